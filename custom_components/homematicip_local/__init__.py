@@ -30,9 +30,9 @@ from .const import (
     DEFAULT_UN_IGNORE,
     DOMAIN,
     HMIP_LOCAL_MIN_VERSION,
-    HMIP_LOCAL_PLATFORMS,
 )
 from .control_unit import ControlConfig, ControlUnit, get_storage_folder
+from .metrics import async_register_metrics_view
 from .services import async_get_loaded_config_entries, async_setup_services, async_unload_services
 from .support import get_device_address_at_interface_from_identifiers
 
@@ -74,9 +74,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: HomematicConfigEntry) ->
         default_port=default_callback_port,
     ).create_control_unit()
     entry.runtime_data = control
-    await hass.config_entries.async_forward_entry_setups(entry, HMIP_LOCAL_PLATFORMS)
+    # Entities, that are created on start, are added by the platforms on their setup.
     await control.start_central()
+    await control.async_forward_platforms(entry=entry)
     await async_setup_services(hass)
+    async_register_metrics_view(hass)
 
     # Register on HA stop event to gracefully shutdown Homematic(IP) Local connection
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, control.stop_central)
@@ -87,9 +89,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: HomematicConfigEntry) ->
 async def async_unload_entry(hass: HomeAssistant, entry: HomematicConfigEntry) -> bool:
     """Unload a config entry."""
     await async_unload_services(hass)
+    platforms: tuple[str, ...] = ()
     if hasattr(entry, "runtime_data") and (control := entry.runtime_data):
         await control.stop_central()
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, HMIP_LOCAL_PLATFORMS)
+        platforms = control.forwarded_platforms
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if len(async_get_loaded_config_entries(hass=hass)) == 0:
         del hass.data[HM_KEY]
     return unload_ok
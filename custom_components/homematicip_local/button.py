@@ -38,7 +38,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any, Final, cast
 
-from hahomematic.const import HmPlatform
+from hahomematic.const import HmPlatform, Parameter
 from hahomematic.platforms.custom import (
     HM_PRESET_MODE_PREFIX,
     PROFILE_DICT,
@@ -122,7 +123,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -269,6 +270,8 @@ class HaHomematicClimate(HaHomematicGenericRestoreEntity[BaseClimateEntity], Cli
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
+        if "target_temperature" in self._optimistic_values:
+            return self._optimistic_values["target_temperature"]
         if self._hm_entity.is_valid:
             return self._hm_entity.target_temperature
         if self.is_restored and self._restored_state:
@@ -395,7 +398,11 @@ class HaHomematicClimate(HaHomematicGenericRestoreEntity[BaseClimateEntity], Cli
         temperature = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
-        await self._hm_entity.set_temperature(temperature=temperature)
+        await self._async_send_command(
+            send=partial(self._hm_entity.set_temperature, temperature=temperature),
+            parameter=Parameter.SET_POINT_TEMPERATURE,
+            optimistic_values={"target_temperature": temperature},
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -0,0 +1,152 @@
+"""Command round-trip latency metrics for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Final
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .command_queue import CommandKey
+from .const import DEFAULT_COMMAND_CONFIRMATION_TIMEOUT
+
+# Upper bounds in seconds of the latency histogram buckets.
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+LATENCY_BUCKET_INF: Final = "+Inf"
+
+
+def _create_latency_buckets() -> dict[str, int]:
+    """Return an empty latency histogram."""
+    return {str(bucket): 0 for bucket in LATENCY_BUCKETS} | {LATENCY_BUCKET_INF: 0}
+
+
+@dataclass
+class DeviceLatencyMetrics:
+    """Command round-trip latency metrics of a device."""
+
+    device_address: str
+    commands_sent: int = 0
+    commands_confirmed: int = 0
+    commands_timed_out: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    latency_last: float | None = None
+    # Count of confirmed commands by the upper bound of the latency in seconds.
+    latency_buckets: dict[str, int] = field(default_factory=_create_latency_buckets)
+
+    @property
+    def latency_avg(self) -> float | None:
+        """Return the average latency of confirmed commands."""
+        if self.commands_confirmed == 0:
+            return None
+        return self.latency_total / self.commands_confirmed
+
+    def add_latency(self, latency: float) -> None:
+        """Add the latency of a confirmed command."""
+        self.commands_confirmed += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.latency_last = latency
+        for bucket in LATENCY_BUCKETS:
+            if latency <= bucket:
+                self.latency_buckets[str(bucket)] += 1
+                return
+        self.latency_buckets[LATENCY_BUCKET_INF] += 1
+
+
+class CommandLatencyTracker:
+    """
+    Track the round-trip latency of commands.
+
+    Outgoing writes are timestamped by (channel, parameter) and matched against
+    the next report of the same (channel, parameter) by the backend. Commands
+    without a confirmation within the timeout are counted as timed out.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_COMMAND_CONFIRMATION_TIMEOUT) -> None:
+        """Init the command latency tracker."""
+        self._timeout: Final = timeout
+        self._sent_at: dict[CommandKey, tuple[str, float]] = {}
+        self._metrics: dict[str, DeviceLatencyMetrics] = {}
+        self._listeners: dict[str, list[Callable[[], None]]] = {}
+
+    @property
+    def metrics(self) -> Mapping[str, DeviceLatencyMetrics]:
+        """Return the latency metrics by device address."""
+        self._expire()
+        return self._metrics
+
+    def get_device_metrics(self, device_address: str) -> DeviceLatencyMetrics | None:
+        """Return the latency metrics of a device."""
+        self._expire()
+        return self._metrics.get(device_address)
+
+    @callback
+    def command_sent(self, device_address: str, key: CommandKey) -> None:
+        """Register an outgoing command."""
+        self._expire()
+        self._sent_at[key] = (device_address, monotonic())
+        self._get_or_create_metrics(device_address=device_address).commands_sent += 1
+
+    @callback
+    def command_failed(self, key: CommandKey) -> None:
+        """Forget a command, that could not be sent."""
+        self._sent_at.pop(key, None)
+
+    @callback
+    def command_confirmed(self, key: CommandKey) -> None:
+        """Register the confirmation of a command by the backend."""
+        if (sent := self._sent_at.pop(key, None)) is None:
+            return
+        device_address, sent_at = sent
+        metrics = self._get_or_create_metrics(device_address=device_address)
+        if (latency := monotonic() - sent_at) > self._timeout:
+            metrics.commands_timed_out += 1
+        else:
+            metrics.add_latency(latency=latency)
+        self._notify_listeners(device_address=device_address)
+
+    @callback
+    def async_add_listener(
+        self, device_address: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Add a listener for metric updates of a device."""
+        self._listeners.setdefault(device_address, []).append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            if listener in (listeners := self._listeners.get(device_address, [])):
+                listeners.remove(listener)
+
+        return remove_listener
+
+    def _expire(self) -> None:
+        """Count commands without a confirmation within the timeout as timed out."""
+        now = monotonic()
+        expired_keys = [
+            key for key, (_, sent_at) in self._sent_at.items() if now - sent_at > self._timeout
+        ]
+        device_addresses: set[str] = set()
+        for key in expired_keys:
+            device_address, _ = self._sent_at.pop(key)
+            self._get_or_create_metrics(device_address=device_address).commands_timed_out += 1
+            device_addresses.add(device_address)
+        # Listeners are notified after all expired commands have been removed,
+        # because they read the metrics again.
+        for device_address in device_addresses:
+            self._notify_listeners(device_address=device_address)
+
+    def _get_or_create_metrics(self, device_address: str) -> DeviceLatencyMetrics:
+        """Return the latency metrics of a device."""
+        if (metrics := self._metrics.get(device_address)) is None:
+            metrics = DeviceLatencyMetrics(device_address=device_address)
+            self._metrics[device_address] = metrics
+        return metrics
+
+    def _notify_listeners(self, device_address: str) -> None:
+        """Notify the listeners of a device."""
+        for listener in self._listeners.get(device_address, []):
+            listener()
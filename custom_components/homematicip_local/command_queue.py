@@ -0,0 +1,333 @@
+"""Command queue for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+import heapq
+import logging
+from time import monotonic
+from typing import Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DEFAULT_COMMAND_QUEUE_BURST,
+    DEFAULT_COMMAND_QUEUE_MAX_RATE,
+    DEFAULT_COMMAND_QUEUE_MIN_RATE,
+    DEFAULT_DUTY_CYCLE_THROTTLE_LEVEL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_DUTY_CYCLE: Final = 100.0
+
+# (channel_address, parameter) of a command. Used for last-writer-wins merging.
+CommandKey = tuple[str, str]
+
+
+class CommandPriority(IntEnum):
+    """Enum with command priorities. Lower values are sent first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+@dataclass
+class CommandQueueMetrics:
+    """Metrics of a command queue."""
+
+    interface_id: str
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    commands_sent: int = 0
+    commands_merged: int = 0
+    commands_failed: int = 0
+    commands_delayed: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    current_rate: float = DEFAULT_COMMAND_QUEUE_MAX_RATE
+    duty_cycle: float | None = None
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Return the average wait time of delayed commands."""
+        if self.commands_delayed == 0:
+            return 0.0
+        return self.wait_time_total / self.commands_delayed
+
+
+class _Command:
+    """A queued command."""
+
+    __slots__ = ("dispatched", "future", "key", "priority", "queued_at", "send")
+
+    def __init__(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        key: CommandKey | None,
+        priority: CommandPriority,
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Init the command."""
+        self.send = send
+        self.key = key
+        self.priority = priority
+        self.future = future
+        self.queued_at = monotonic()
+        self.dispatched = False
+
+
+class CommandQueue:
+    """
+    Per interface command queue.
+
+    Commands are sent immediately as long as the token bucket allows it.
+    Otherwise they are queued by priority, and repeated writes to the same
+    (channel, parameter) are merged, so that only the last value is sent.
+    The refill rate of the bucket is reduced, when the duty cycle of the
+    interface exceeds the throttle level.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interface_id: str,
+        duty_cycle_provider: Callable[[], float | None],
+        burst: int = DEFAULT_COMMAND_QUEUE_BURST,
+        max_rate: float = DEFAULT_COMMAND_QUEUE_MAX_RATE,
+        min_rate: float = DEFAULT_COMMAND_QUEUE_MIN_RATE,
+        throttle_level: float = DEFAULT_DUTY_CYCLE_THROTTLE_LEVEL,
+    ) -> None:
+        """Init the command queue."""
+        self._hass = hass
+        self._interface_id: Final = interface_id
+        self._duty_cycle_provider = duty_cycle_provider
+        self._burst: Final = burst
+        self._max_rate: Final = max_rate
+        self._min_rate: Final = min_rate
+        self._throttle_level: Final = throttle_level
+        self._tokens: float = float(burst)
+        self._last_refill = monotonic()
+        self._heap: list[tuple[int, int, _Command]] = []
+        self._pending: dict[CommandKey, _Command] = {}
+        self._sequence = 0
+        self._worker: asyncio.Task[None] | None = None
+        self._metrics = CommandQueueMetrics(interface_id=interface_id, current_rate=max_rate)
+
+    @property
+    def metrics(self) -> CommandQueueMetrics:
+        """Return the metrics of the command queue."""
+        return self._metrics
+
+    async def async_send(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        key: CommandKey | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> Any:
+        """Send a command or queue it, if the interface is rate limited."""
+        self._refill()
+        if self._metrics.queue_depth == 0 and self._tokens >= 1:
+            self._tokens -= 1
+            return await self._async_execute(send=send)
+
+        if key is not None and (command := self._pending.get(key)) is not None:
+            # Last writer wins. The waiting callers get the result of the latest command.
+            command.send = send
+            self._metrics.commands_merged += 1
+            if priority < command.priority:
+                command.priority = priority
+                self._push(command=command)
+        else:
+            command = _Command(
+                send=send,
+                key=key,
+                priority=priority,
+                future=self._hass.loop.create_future(),
+            )
+            if key is not None:
+                self._pending[key] = command
+            self._metrics.queue_depth += 1
+            self._metrics.max_queue_depth = max(
+                self._metrics.max_queue_depth, self._metrics.queue_depth
+            )
+            self._push(command=command)
+
+        if self._worker is None or self._worker.done():
+            self._worker = self._hass.async_create_background_task(
+                self._async_process_queue(),
+                name=f"homematicip_local_command_queue_{self._interface_id}",
+            )
+        return await asyncio.shield(command.future)
+
+    def stop(self) -> None:
+        """Stop the command queue and fail all pending commands."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        while self._heap:
+            _, _, command = heapq.heappop(self._heap)
+            if not command.dispatched and not command.future.done():
+                command.dispatched = True
+                command.future.set_exception(
+                    HomeAssistantError(f"Command queue for {self._interface_id} stopped")
+                )
+        self._pending.clear()
+        self._metrics.queue_depth = 0
+
+    def _push(self, command: _Command) -> None:
+        """Push a command to the heap."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (command.priority, self._sequence, command))
+
+    async def _async_process_queue(self) -> None:
+        """Dispatch queued commands as soon as tokens are available."""
+        while self._heap:
+            if self._heap[0][2].dispatched:
+                # Outdated heap entry of a command, that has been re-prioritized.
+                heapq.heappop(self._heap)
+                continue
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._metrics.current_rate)
+                continue
+            _, _, command = heapq.heappop(self._heap)
+            command.dispatched = True
+            self._tokens -= 1
+            if command.key is not None:
+                self._pending.pop(command.key, None)
+            self._metrics.queue_depth -= 1
+            wait_time = monotonic() - command.queued_at
+            self._metrics.commands_delayed += 1
+            self._metrics.wait_time_total += wait_time
+            self._metrics.wait_time_max = max(self._metrics.wait_time_max, wait_time)
+            self._hass.async_create_task(self._async_execute_command(command=command))
+
+    async def _async_execute_command(self, command: _Command) -> None:
+        """Execute a queued command and resolve its future."""
+        try:
+            result = await self._async_execute(send=command.send)
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            if not command.future.done():
+                command.future.set_exception(ex)
+            return
+        if not command.future.done():
+            command.future.set_result(result)
+
+    async def _async_execute(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Execute a command and count the result."""
+        try:
+            result = await send()
+        except Exception:
+            self._metrics.commands_failed += 1
+            raise
+        self._metrics.commands_sent += 1
+        return result
+
+    def _refill(self) -> None:
+        """Refill the token bucket based on the current rate."""
+        now = monotonic()
+        rate = self._get_rate()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def _get_rate(self) -> float:
+        """Return the allowed commands per second based on the duty cycle."""
+        duty_cycle = self._duty_cycle_provider()
+        self._metrics.duty_cycle = duty_cycle
+        rate = self._max_rate
+        if duty_cycle is not None and duty_cycle > self._throttle_level:
+            factor = max(0.0, _MAX_DUTY_CYCLE - duty_cycle) / (
+                _MAX_DUTY_CYCLE - self._throttle_level
+            )
+            rate = max(self._min_rate, self._max_rate * factor)
+            if rate != self._metrics.current_rate:
+                _LOGGER.debug(
+                    "Command rate for %s reduced to %.2f/s due to duty cycle of %.0f%%",
+                    self._interface_id,
+                    rate,
+                    duty_cycle,
+                )
+        self._metrics.current_rate = rate
+        return rate
+
+
+class WriteCoalescer:
+    """
+    Coalesce rapid writes to a single entity parameter.
+
+    The first write is sent immediately. Writes within the quiet period replace
+    each other, and only the last one is sent, once no further write arrived
+    for the duration of the quiet period.
+    """
+
+    def __init__(self, hass: HomeAssistant, delay: float) -> None:
+        """Init the write coalescer."""
+        self._hass = hass
+        self._delay: Final = delay
+        self._pending_send: Callable[[], Awaitable[Any]] | None = None
+        self._pending_future: asyncio.Future[Any] | None = None
+        self._unsub_quiet_period: CALLBACK_TYPE | None = None
+
+    async def async_write(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send the write or defer it until the quiet period has elapsed."""
+        if self._unsub_quiet_period is None:
+            self._start_quiet_period()
+            return await send()
+
+        self._pending_send = send
+        if self._pending_future is None:
+            self._pending_future = self._hass.loop.create_future()
+        self._start_quiet_period()
+        return await asyncio.shield(self._pending_future)
+
+    @callback
+    def cancel(self) -> None:
+        """Drop a pending write and end the quiet period."""
+        if self._unsub_quiet_period is not None:
+            self._unsub_quiet_period()
+            self._unsub_quiet_period = None
+        if self._pending_future is not None and not self._pending_future.done():
+            self._pending_future.set_result(None)
+        self._pending_send = None
+        self._pending_future = None
+
+    @callback
+    def _start_quiet_period(self) -> None:
+        """Start or restart the quiet period."""
+        if self._unsub_quiet_period is not None:
+            self._unsub_quiet_period()
+        self._unsub_quiet_period = async_call_later(
+            hass=self._hass, delay=self._delay, action=self._async_quiet_period_elapsed
+        )
+
+    @callback
+    def _async_quiet_period_elapsed(self, *args: Any) -> None:
+        """Send the pending write."""
+        self._unsub_quiet_period = None
+        if (send := self._pending_send) is None or (future := self._pending_future) is None:
+            return
+        self._pending_send = None
+        self._pending_future = None
+        # The trailing write starts a new quiet period.
+        self._start_quiet_period()
+        self._hass.async_create_task(self._async_send_pending(send=send, future=future))
+
+    async def _async_send_pending(
+        self, send: Callable[[], Awaitable[Any]], future: asyncio.Future[Any]
+    ) -> None:
+        """Send the pending write and resolve the future of the waiting callers."""
+        try:
+            result = await send()
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            if not future.done():
+                future.set_exception(ex)
+            return
+        if not future.done():
+            future.set_result(result)
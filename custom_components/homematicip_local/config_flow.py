@@ -47,23 +47,41 @@ from .const import (
     CONF_ADVANCED_CONFIG,
     CONF_CALLBACK_HOST,
     CONF_CALLBACK_PORT,
+    CONF_COMMAND_QUEUE_ENABLED,
+    CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+    CONF_DROP_UNCONSUMED_CLICK_EVENTS,
     CONF_ENABLE_SYSTEM_NOTIFICATIONS,
+    CONF_ENTITY_UPDATE_BATCH_TIME,
     CONF_INSTANCE_NAME,
     CONF_INTERFACE,
     CONF_JSON_PORT,
     CONF_LISTEN_ON_ALL_IP,
+    CONF_LONG_PRESS_AGGREGATION,
+    CONF_LONG_PRESS_REPEAT_INTERVAL,
+    CONF_OPTIMISTIC_UPDATES,
     CONF_PROGRAM_SCAN_ENABLED,
+    CONF_SLOW_CALLBACK_THRESHOLD,
     CONF_SYS_SCAN_INTERVAL,
     CONF_SYSVAR_SCAN_ENABLED,
     CONF_TLS,
     CONF_UN_IGNORE,
     CONF_VERIFY_TLS,
+    CONF_WRITE_COALESCE_DELAY,
+    DEFAULT_COMMAND_QUEUE_ENABLED,
+    DEFAULT_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+    DEFAULT_DROP_UNCONSUMED_CLICK_EVENTS,
     DEFAULT_ENABLE_SYSTEM_NOTIFICATIONS,
+    DEFAULT_ENTITY_UPDATE_BATCH_TIME,
     DEFAULT_LISTEN_ON_ALL_IP,
+    DEFAULT_LONG_PRESS_AGGREGATION,
+    DEFAULT_LONG_PRESS_REPEAT_INTERVAL,
+    DEFAULT_OPTIMISTIC_UPDATES,
     DEFAULT_PROGRAM_SCAN_ENABLED,
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
     DEFAULT_SYS_SCAN_INTERVAL,
     DEFAULT_SYSVAR_SCAN_ENABLED,
     DEFAULT_UN_IGNORE,
+    DEFAULT_WRITE_COALESCE_DELAY,
     DOMAIN,
 )
 from .control_unit import ControlConfig, ControlUnit, validate_config_and_get_system_information
@@ -102,6 +120,30 @@ PORT_SELECTOR_OPTIONAL = vol.All(
     NumberSelector(NumberSelectorConfig(mode=NumberSelectorMode.BOX, min=0, max=65535)),
     vol.Coerce(int),
 )
+DEVICE_ERROR_REANNOUNCE_INTERVAL_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX, min=0, max=86400, step=60, unit_of_measurement="sec"
+        )
+    ),
+    vol.Coerce(int),
+)
+ENTITY_UPDATE_BATCH_TIME_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX, min=0, max=1000, step=5, unit_of_measurement="ms"
+        )
+    ),
+    vol.Coerce(int),
+)
+LONG_PRESS_REPEAT_INTERVAL_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX, min=0, max=10000, step=100, unit_of_measurement="ms"
+        )
+    ),
+    vol.Coerce(int),
+)
 SCAN_INTERVAL_SELECTOR = vol.All(
     NumberSelector(
         NumberSelectorConfig(
@@ -110,6 +152,22 @@ SCAN_INTERVAL_SELECTOR = vol.All(
     ),
     vol.Coerce(int),
 )
+SLOW_CALLBACK_THRESHOLD_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX, min=0, max=10000, step=10, unit_of_measurement="ms"
+        )
+    ),
+    vol.Coerce(int),
+)
+WRITE_COALESCE_DELAY_SELECTOR = vol.All(
+    NumberSelector(
+        NumberSelectorConfig(
+            mode=NumberSelectorMode.BOX, min=0, max=5000, step=50, unit_of_measurement="ms"
+        )
+    ),
+    vol.Coerce(int),
+)
 
 
 def get_domain_schema(data: ConfigType) -> Schema:
@@ -241,6 +299,61 @@ def get_advanced_schema(data: ConfigType, all_un_ignore_parameters: list[str]) -
                     CONF_LISTEN_ON_ALL_IP, DEFAULT_LISTEN_ON_ALL_IP
                 ),
             ): BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_OPTIMISTIC_UPDATES,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_OPTIMISTIC_UPDATES, DEFAULT_OPTIMISTIC_UPDATES
+                ),
+            ): BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_COMMAND_QUEUE_ENABLED,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_COMMAND_QUEUE_ENABLED, DEFAULT_COMMAND_QUEUE_ENABLED
+                ),
+            ): BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_WRITE_COALESCE_DELAY,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_WRITE_COALESCE_DELAY, DEFAULT_WRITE_COALESCE_DELAY
+                ),
+            ): WRITE_COALESCE_DELAY_SELECTOR,
+            vol.Required(
+                CONF_SLOW_CALLBACK_THRESHOLD,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_SLOW_CALLBACK_THRESHOLD, DEFAULT_SLOW_CALLBACK_THRESHOLD
+                ),
+            ): SLOW_CALLBACK_THRESHOLD_SELECTOR,
+            vol.Required(
+                CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+                    DEFAULT_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+                ),
+            ): DEVICE_ERROR_REANNOUNCE_INTERVAL_SELECTOR,
+            vol.Required(
+                CONF_LONG_PRESS_AGGREGATION,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_LONG_PRESS_AGGREGATION, DEFAULT_LONG_PRESS_AGGREGATION
+                ),
+            ): BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_LONG_PRESS_REPEAT_INTERVAL,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_LONG_PRESS_REPEAT_INTERVAL, DEFAULT_LONG_PRESS_REPEAT_INTERVAL
+                ),
+            ): LONG_PRESS_REPEAT_INTERVAL_SELECTOR,
+            vol.Required(
+                CONF_DROP_UNCONSUMED_CLICK_EVENTS,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_DROP_UNCONSUMED_CLICK_EVENTS, DEFAULT_DROP_UNCONSUMED_CLICK_EVENTS
+                ),
+            ): BOOLEAN_SELECTOR,
+            vol.Required(
+                CONF_ENTITY_UPDATE_BATCH_TIME,
+                default=data.get(CONF_ADVANCED_CONFIG, {}).get(
+                    CONF_ENTITY_UPDATE_BATCH_TIME, DEFAULT_ENTITY_UPDATE_BATCH_TIME
+                ),
+            ): ENTITY_UPDATE_BATCH_TIME_SELECTOR,
             vol.Optional(
                 CONF_UN_IGNORE,
                 default=existing_parameters,
@@ -541,6 +654,33 @@ def _update_advanced_input(data: ConfigType, advanced_input: ConfigType) -> None
             CONF_ENABLE_SYSTEM_NOTIFICATIONS
         ]
         data[CONF_ADVANCED_CONFIG][CONF_LISTEN_ON_ALL_IP] = advanced_input[CONF_LISTEN_ON_ALL_IP]
+        data[CONF_ADVANCED_CONFIG][CONF_OPTIMISTIC_UPDATES] = advanced_input[
+            CONF_OPTIMISTIC_UPDATES
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_COMMAND_QUEUE_ENABLED] = advanced_input[
+            CONF_COMMAND_QUEUE_ENABLED
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_WRITE_COALESCE_DELAY] = advanced_input[
+            CONF_WRITE_COALESCE_DELAY
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_SLOW_CALLBACK_THRESHOLD] = advanced_input[
+            CONF_SLOW_CALLBACK_THRESHOLD
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL] = advanced_input[
+            CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_LONG_PRESS_AGGREGATION] = advanced_input[
+            CONF_LONG_PRESS_AGGREGATION
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_LONG_PRESS_REPEAT_INTERVAL] = advanced_input[
+            CONF_LONG_PRESS_REPEAT_INTERVAL
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_DROP_UNCONSUMED_CLICK_EVENTS] = advanced_input[
+            CONF_DROP_UNCONSUMED_CLICK_EVENTS
+        ]
+        data[CONF_ADVANCED_CONFIG][CONF_ENTITY_UPDATE_BATCH_TIME] = advanced_input[
+            CONF_ENTITY_UPDATE_BATCH_TIME
+        ]
         if advanced_input.get(CONF_UN_IGNORE):
             data[CONF_ADVANCED_CONFIG][CONF_UN_IGNORE] = advanced_input[CONF_UN_IGNORE]
 
@@ -2,26 +2,42 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import StrEnum
 from typing import Final
 
-from hahomematic.const import PLATFORMS
+from hahomematic.const import PLATFORMS, HmPlatform
 
 from homeassistant.const import Platform
 
 DOMAIN: Final = "homematicip_local"
 HMIP_LOCAL_MIN_VERSION: Final = "2024.10.0dev0"
 
+DEFAULT_COMMAND_CONFIRMATION_TIMEOUT: Final = 10  # s
+DEFAULT_COMMAND_QUEUE_BURST: Final = 10
+DEFAULT_COMMAND_QUEUE_ENABLED: Final = True
+DEFAULT_COMMAND_QUEUE_MAX_RATE: Final = 10.0  # commands per second
+DEFAULT_COMMAND_QUEUE_MIN_RATE: Final = 0.5  # commands per second
+DEFAULT_DEVICE_ERROR_REANNOUNCE_INTERVAL: Final = 0  # s, 0 disables the re-announcement
 DEFAULT_DEVICE_FIRMWARE_CHECK_ENABLED: Final = True
 DEFAULT_DEVICE_FIRMWARE_CHECK_INTERVAL: Final = 21600  # 6h
 DEFAULT_DEVICE_FIRMWARE_DELIVERING_CHECK_INTERVAL: Final = 3600  # 1h
 DEFAULT_DEVICE_FIRMWARE_UPDATING_CHECK_INTERVAL: Final = 300  # 5m
+DEFAULT_DROP_UNCONSUMED_CLICK_EVENTS: Final = False
+DEFAULT_DUTY_CYCLE_THROTTLE_LEVEL: Final = 50.0  # percent
 DEFAULT_ENABLE_SYSTEM_NOTIFICATIONS: Final = True
+DEFAULT_ENTITY_UPDATE_BATCH_TIME: Final = 0  # ms, 0 disables the queue
 DEFAULT_LISTEN_ON_ALL_IP: Final = False
+DEFAULT_LONG_PRESS_AGGREGATION: Final = False
+DEFAULT_LONG_PRESS_REPEAT_INTERVAL: Final = 0  # ms, 0 disables the repeat
+DEFAULT_OPTIMISTIC_UPDATES: Final = False
 DEFAULT_PROGRAM_SCAN_ENABLED: Final = True
+DEFAULT_SLOW_CALLBACK_THRESHOLD: Final = 0  # ms, 0 disables the watchdog
 DEFAULT_SYSVAR_SCAN_ENABLED: Final = True
 DEFAULT_SYS_SCAN_INTERVAL: Final = 30
 DEFAULT_UN_IGNORE: Final[list[str]] = []
+DEFAULT_VALUE_SNAPSHOT_INTERVAL: Final = 900  # 15m
+DEFAULT_WRITE_COALESCE_DELAY: Final = 300  # ms
 
 LEARN_MORE_URL_XMLRPC_SERVER_RECEIVES_NO_EVENTS: Final = "https://github.com/danielperna84/custom_homematic#what-is-the-meaning-of-xmlrpc-server-received-no-events"
 LEARN_MORE_URL_PONG_MISMATCH: Final = "https://github.com/danielperna84/custom_homematic#what-is-the-meaning-of-pingpong-mismatch-on-interface"
@@ -31,20 +47,30 @@ CONF_ADVANCED_CONFIG: Final = "advanced_config"
 CONF_CALLBACK_HOST: Final = "callback_host"
 CONF_LISTEN_ON_ALL_IP: Final = "listen_on_all_ip"
 CONF_CALLBACK_PORT: Final = "callback_port"
+CONF_COMMAND_QUEUE_ENABLED: Final = "command_queue_enabled"
+CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL: Final = "device_error_reannounce_interval"
+CONF_DROP_UNCONSUMED_CLICK_EVENTS: Final = "drop_unconsumed_click_events"
 CONF_ENABLE_SYSTEM_NOTIFICATIONS: Final = "enable_system_notifications"
+CONF_ENTITY_UPDATE_BATCH_TIME: Final = "entity_update_batch_time"
 CONF_EVENT_TYPE: Final = "event_type"
 CONF_INSTANCE_NAME: Final = "instance_name"
 CONF_INTERFACE: Final = "interface"
 CONF_INTERFACE_ID: Final = "interface_id"
 CONF_JSON_PORT: Final = "json_port"
+CONF_LONG_PRESS_AGGREGATION: Final = "long_press_aggregation"
+CONF_LONG_PRESS_REPEAT_INTERVAL: Final = "long_press_repeat_interval"
 CONF_SUBTYPE: Final = "subtype"
+CONF_OPTIMISTIC_UPDATES: Final = "optimistic_updates"
 CONF_PROGRAM_SCAN_ENABLED: Final = "program_scan_enabled"
+CONF_SLOW_CALLBACK_THRESHOLD: Final = "slow_callback_threshold"
 CONF_SYSVAR_SCAN_ENABLED: Final = "sysvar_scan_enabled"
 CONF_SYS_SCAN_INTERVAL: Final = "sysvar_scan_interval"
 CONF_TLS: Final = "tls"
 CONF_UN_IGNORE: Final = "un_ignore"
 CONF_VERIFY_TLS: Final = "verify_tls"
+CONF_WRITE_COALESCE_DELAY: Final = "write_coalesce_delay"
 
+EVENT_DEVICE_ADDRESSES: Final = "device_addresses"
 EVENT_DEVICE_ID: Final = "device_id"
 EVENT_ERROR: Final = "error"
 EVENT_ERROR_VALUE: Final = "error_value"
@@ -72,6 +98,7 @@ SERVICE_GET_PARAMSET: Final = "get_paramset"
 SERVICE_GET_SCHEDULE_PROFILE: Final = "get_schedule_profile"
 SERVICE_GET_SCHEDULE_PROFILE_WEEKDAY: Final = "get_schedule_profile_weekday"
 SERVICE_LIGHT_SET_ON_TIME: Final = "light_set_on_time"
+SERVICE_PROFILE_CALLBACKS: Final = "profile_callbacks"
 SERVICE_PUT_LINK_PARAMSET: Final = "put_link_paramset"
 SERVICE_PUT_PARAMSET: Final = "put_paramset"
 SERVICE_REMOVE_CENTRAL_LINKS: Final = "remove_central_links"
@@ -105,6 +132,7 @@ HMIP_LOCAL_SERVICES: Final = (
     SERVICE_GET_SCHEDULE_PROFILE,
     SERVICE_GET_SCHEDULE_PROFILE_WEEKDAY,
     SERVICE_LIGHT_SET_ON_TIME,
+    SERVICE_PROFILE_CALLBACKS,
     SERVICE_PUT_LINK_PARAMSET,
     SERVICE_PUT_PARAMSET,
     SERVICE_REMOVE_CENTRAL_LINKS,
@@ -135,8 +163,10 @@ class HmEntityState(StrEnum):
     """Enum with homematic entity states."""
 
     NOT_VALID = "not valid"
+    PENDING = "pending"
     RESTORED = "restored"
     UNCERTAIN = "uncertain"
+    UNCONFIRMED = "unconfirmed"
     VALID = "valid"
 
 
@@ -159,3 +189,14 @@ def _get_hmip_local_platforms() -> tuple[str, ...]:
 
 
 HMIP_LOCAL_PLATFORMS: Final[tuple[str, ...]] = _get_hmip_local_platforms()
+
+# Hub entities are added by the platform of the same entity type.
+HUB_PLATFORMS: Final[Mapping[HmPlatform, HmPlatform]] = {
+    HmPlatform.HUB_BINARY_SENSOR: HmPlatform.BINARY_SENSOR,
+    HmPlatform.HUB_BUTTON: HmPlatform.BUTTON,
+    HmPlatform.HUB_NUMBER: HmPlatform.NUMBER,
+    HmPlatform.HUB_SELECT: HmPlatform.SELECT,
+    HmPlatform.HUB_SENSOR: HmPlatform.SENSOR,
+    HmPlatform.HUB_SWITCH: HmPlatform.SWITCH,
+    HmPlatform.HUB_TEXT: HmPlatform.TEXT,
+}
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+from time import monotonic
 from types import UnionType
 from typing import Any, Final, TypeVar, cast
 
@@ -16,8 +19,10 @@ from hahomematic.const import (
     CALLBACK_TYPE,
     CONF_PASSWORD,
     CONF_USERNAME,
+    ENTITY_EVENTS,
     EVENT_ADDRESS,
     EVENT_AVAILABLE,
+    EVENT_CHANNEL_NO,
     EVENT_DATA,
     EVENT_INTERFACE_ID,
     EVENT_PARAMETER,
@@ -38,12 +43,15 @@ from hahomematic.const import (
     SystemInformation,
 )
 from hahomematic.exceptions import BaseHomematicException
+from hahomematic.platforms.device import HmDevice
 from hahomematic.platforms.entity import CallbackEntity
+from hahomematic.platforms.generic import GenericEntity
 from hahomematic.support import check_config
 
-from homeassistant.const import CONF_HOST, CONF_PATH, CONF_PORT
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import aiohttp_client, device_registry as dr
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_PATH, CONF_PORT, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import aiohttp_client, device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceEntryType, DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval
@@ -53,31 +61,52 @@ from homeassistant.helpers.issue_registry import (
     async_delete_issue,
 )
 
+from .command_latency import CommandLatencyTracker
+from .command_queue import CommandKey, CommandPriority, CommandQueue
 from .const import (
     CONF_ADVANCED_CONFIG,
     CONF_CALLBACK_HOST,
     CONF_CALLBACK_PORT,
+    CONF_COMMAND_QUEUE_ENABLED,
+    CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL,
+    CONF_DROP_UNCONSUMED_CLICK_EVENTS,
     CONF_ENABLE_SYSTEM_NOTIFICATIONS,
+    CONF_ENTITY_UPDATE_BATCH_TIME,
     CONF_INSTANCE_NAME,
     CONF_INTERFACE,
     CONF_JSON_PORT,
     CONF_LISTEN_ON_ALL_IP,
+    CONF_LONG_PRESS_AGGREGATION,
+    CONF_LONG_PRESS_REPEAT_INTERVAL,
+    CONF_OPTIMISTIC_UPDATES,
     CONF_PROGRAM_SCAN_ENABLED,
+    CONF_SLOW_CALLBACK_THRESHOLD,
     CONF_SYS_SCAN_INTERVAL,
     CONF_SYSVAR_SCAN_ENABLED,
     CONF_TLS,
     CONF_UN_IGNORE,
     CONF_VERIFY_TLS,
+    CONF_WRITE_COALESCE_DELAY,
+    DEFAULT_COMMAND_QUEUE_ENABLED,
+    DEFAULT_DEVICE_ERROR_REANNOUNCE_INTERVAL,
     DEFAULT_DEVICE_FIRMWARE_CHECK_ENABLED,
     DEFAULT_DEVICE_FIRMWARE_CHECK_INTERVAL,
     DEFAULT_DEVICE_FIRMWARE_DELIVERING_CHECK_INTERVAL,
     DEFAULT_DEVICE_FIRMWARE_UPDATING_CHECK_INTERVAL,
+    DEFAULT_DROP_UNCONSUMED_CLICK_EVENTS,
     DEFAULT_ENABLE_SYSTEM_NOTIFICATIONS,
+    DEFAULT_ENTITY_UPDATE_BATCH_TIME,
     DEFAULT_LISTEN_ON_ALL_IP,
+    DEFAULT_LONG_PRESS_AGGREGATION,
+    DEFAULT_LONG_PRESS_REPEAT_INTERVAL,
+    DEFAULT_OPTIMISTIC_UPDATES,
     DEFAULT_PROGRAM_SCAN_ENABLED,
+    DEFAULT_SLOW_CALLBACK_THRESHOLD,
     DEFAULT_SYS_SCAN_INTERVAL,
     DEFAULT_SYSVAR_SCAN_ENABLED,
     DEFAULT_UN_IGNORE,
+    DEFAULT_VALUE_SNAPSHOT_INTERVAL,
+    DEFAULT_WRITE_COALESCE_DELAY,
     DOMAIN,
     EVENT_DEVICE_ID,
     EVENT_ERROR,
@@ -88,9 +117,21 @@ from .const import (
     EVENT_TITLE,
     EVENT_UNAVAILABLE,
     FILTER_ERROR_EVENT_PARAMETERS,
+    HMIP_LOCAL_PLATFORMS,
+    HUB_PLATFORMS,
     LEARN_MORE_URL_PONG_MISMATCH,
     LEARN_MORE_URL_XMLRPC_SERVER_RECEIVES_NO_EVENTS,
 )
+from .entity_update_queue import EntityUpdateQueue
+from .event_aggregation import (
+    LONG_PRESS_END_PARAMETER,
+    DeviceAvailabilityAggregator,
+    DeviceErrorDeduplicator,
+    LongPressAggregator,
+)
+from .event_consumers import ClickEventStats, async_get_click_event_consumers
+from .event_metrics import CALLBACK_BACKEND_SYSTEM_EVENT, CALLBACK_HOMEMATIC_EVENT, EventMetrics
+from .issue_damper import IssueDamper
 from .support import (
     CLICK_EVENT_SCHEMA,
     DEVICE_AVAILABILITY_EVENT_SCHEMA,
@@ -99,10 +140,17 @@ from .support import (
     cleanup_click_event_data,
     is_valid_event,
 )
+from .value_snapshot import ValueSnapshot
+from .watchdog import CallbackWatchdog
 
 _LOGGER = logging.getLogger(__name__)
 _EntityT = TypeVar("_EntityT", bound=CallbackEntity)
 
+DUTY_CYCLE_LEVEL: Final = "DUTY_CYCLE_LEVEL"
+# Delay in seconds between the reconnect attempts, if the backend is not reachable on startup.
+RECONNECT_DELAY_MAX: Final = 300
+RECONNECT_DELAY_MIN: Final = 10
+
 
 class BaseControlUnit:
     """Base central point to control a central unit."""
@@ -226,9 +274,228 @@ class ControlUnit(BaseControlUnit):
             hass=self._hass,
             control_unit=self,
         )
+        self._command_queues: dict[str, CommandQueue] = {}
+        self._duty_cycle_entities: dict[str, tuple[GenericEntity, ...]] = {}
+        self._command_latency = CommandLatencyTracker()
+        self._event_metrics = EventMetrics()
+        self._device_availability_aggregator = DeviceAvailabilityAggregator(hass=self._hass)
+        self._issue_damper = IssueDamper(hass=self._hass)
+        self._device_error_deduplicator = DeviceErrorDeduplicator(
+            reannounce_interval=control_config.device_error_reannounce_interval
+        )
+        self._long_press_aggregator = self.create_long_press_aggregator(
+            on_long_press_end=self._async_long_press_ended
+        )
+        self._click_event_consumers = async_get_click_event_consumers(hass=self._hass)
+        self._click_event_stats = ClickEventStats()
+        self._entity_update_queue = EntityUpdateQueue(
+            hass=self._hass, batch_time=control_config.entity_update_batch_time / 1000
+        )
+        self._callback_watchdog = CallbackWatchdog(
+            instance_name=self._instance_name,
+            threshold=control_config.slow_callback_threshold / 1000,
+        )
+        self._duty_cycle_cache_stats = CacheStats()
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._device_registry_stats = DeviceRegistryStats()
+        self._removed_device_ids: set[str] = set()
+        self._removed_entity_ids: set[str] = set()
+        # Disabled registry entries of the config entry. Built on first use,
+        # and kept current by the updates of the entity registry.
+        self._disabled_entity_ids: dict[str, str] | None = None
+        self._disabled_unique_ids: set[str] = set()
+        self._entities_version = 0
+        self._forwarded_platforms: set[str] = set()
+        self._pending_platforms: set[str] = set()
+        self._forward_new_platforms = False
+        self._interface_available: dict[str, bool] = {}
+        self._interface_callback_alive: dict[str, bool] = {}
+        self._value_snapshot = ValueSnapshot(
+            hass=self._hass,
+            storage_folder=get_storage_folder(hass=self._hass),
+            name=self._instance_name,
+        )
+        self._reconnect_task: asyncio.Task[None] | None = None
+
+    @property
+    def command_latency(self) -> CommandLatencyTracker:
+        """Return the command latency tracker."""
+        return self._command_latency
+
+    @property
+    def event_metrics(self) -> EventMetrics:
+        """Return the event ingestion metrics."""
+        return self._event_metrics
+
+    @property
+    def callback_watchdog(self) -> CallbackWatchdog:
+        """Return the slow callback watchdog."""
+        return self._callback_watchdog
+
+    @property
+    def device_error_deduplicator(self) -> DeviceErrorDeduplicator:
+        """Return the deduplication of device error events."""
+        return self._device_error_deduplicator
+
+    @property
+    def long_press_aggregator(self) -> LongPressAggregator | None:
+        """Return the long press aggregation of the click events."""
+        return self._long_press_aggregator
+
+    def create_long_press_aggregator(
+        self, on_long_press_end: Callable[[str, Mapping[str, Any] | None], None]
+    ) -> LongPressAggregator | None:
+        """Return a new long press aggregator, if the aggregation is enabled."""
+        if not self._config.long_press_aggregation:
+            return None
+        return LongPressAggregator(
+            hass=self._hass,
+            on_long_press_end=on_long_press_end,
+            repeat_interval=self._config.long_press_repeat_interval / 1000,
+        )
+
+    @property
+    def entity_update_queue(self) -> EntityUpdateQueue:
+        """Return the queue for batched entity updates."""
+        return self._entity_update_queue
+
+    @property
+    def click_event_stats(self) -> ClickEventStats:
+        """Return the statistics of the click events."""
+        return self._click_event_stats
+
+    @property
+    def issue_damper(self) -> IssueDamper:
+        """Return the flap damping of repair issues."""
+        return self._issue_damper
+
+    @property
+    def device_registry_stats(self) -> DeviceRegistryStats:
+        """Return the statistics of the device registry reconciliation."""
+        return self._device_registry_stats
+
+    @property
+    def cache_stats(self) -> Mapping[str, CacheStats]:
+        """Return the statistics of the caches by cache name."""
+        return {"duty_cycle_entities": self._duty_cycle_cache_stats}
+
+    @property
+    def entities_version(self) -> int:
+        """Return a version, that changes whenever entities may have been added or removed."""
+        return self._entities_version
+
+    @property
+    def forwarded_platforms(self) -> tuple[str, ...]:
+        """Return the platforms, that are forwarded to HA."""
+        return tuple(sorted(self._forwarded_platforms))
+
+    async def async_forward_platforms(self, entry: ConfigEntry) -> None:
+        """
+        Forward the platforms, that have entities, within the setup of the config entry.
+
+        The central must be started before. Other platforms are forwarded, when
+        entities of their type are created later.
+        """
+        hm_platforms: set[HmPlatform] = {
+            hm_platform
+            for hm_platform in HmPlatform
+            if self._central.get_entities(
+                platform=hm_platform, exclude_no_create=True, registered=False
+            )
+            or self._central.get_hub_entities(platform=hm_platform, registered=False)
+        }
+        if any(
+            self._central.get_events(event_type=event_type, registered=False)
+            for event_type in ENTITY_EVENTS
+        ):
+            hm_platforms.add(HmPlatform.EVENT)
+        # The sensor platform adds the event metrics sensors of the central.
+        platforms = self._get_platforms(hm_platforms=hm_platforms) | {Platform.SENSOR.value}
+        self._forwarded_platforms.update(platforms)
+        self._forward_new_platforms = True
+        _LOGGER.debug(
+            "Forwarding platforms %s for %s", ", ".join(sorted(platforms)), self._instance_name
+        )
+        await self._hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    @callback
+    def _async_forward_new_platforms(self, hm_platforms: Iterable[HmPlatform]) -> None:
+        """Forward the platforms of new entities, that are not forwarded yet."""
+        if not self._forward_new_platforms:
+            return
+        if platforms := (
+            self._get_platforms(hm_platforms=hm_platforms)
+            - self._forwarded_platforms
+            - self._pending_platforms
+        ):
+            self._pending_platforms.update(platforms)
+            self._hass.async_create_task(
+                self._async_forward_new_platforms_locked(platforms=platforms),
+                name=f"{DOMAIN}-forward-platforms-{self._instance_name}",
+            )
+
+    async def _async_forward_new_platforms_locked(self, platforms: set[str]) -> None:
+        """Forward platforms to a loaded config entry."""
+        if (entry := self._hass.config_entries.async_get_entry(self._entry_id)) is None:
+            return
+        # Wait for a running setup or unload of the config entry.
+        async with entry.setup_lock:
+            self._pending_platforms.difference_update(platforms)
+            if entry.state is not ConfigEntryState.LOADED:
+                return
+            _LOGGER.debug(
+                "Forwarding new platforms %s for %s",
+                ", ".join(sorted(platforms)),
+                self._instance_name,
+            )
+            self._forwarded_platforms.update(platforms)
+            await self._hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+    @staticmethod
+    def _get_platforms(hm_platforms: Iterable[HmPlatform]) -> set[str]:
+        """Return the HA platforms, that add the entities of the given hahomematic platforms."""
+        return {
+            platform
+            for hm_platform in hm_platforms
+            if (platform := HUB_PLATFORMS.get(hm_platform, hm_platform).value)
+            in HMIP_LOCAL_PLATFORMS
+        }
+
+    @property
+    def interface_available(self) -> Mapping[str, bool]:
+        """Return the availability of the interfaces by interface_id."""
+        return self._interface_available
+
+    @property
+    def interface_callback_alive(self) -> Mapping[str, bool]:
+        """Return if the interfaces send events by interface_id."""
+        return self._interface_callback_alive
+
+    @property
+    def scheduler_fetch_stats(self) -> Mapping[str, FetchStats]:
+        """Return the statistics of the scheduled fetches by job name."""
+        return self._scheduler.fetch_stats
+
+    @property
+    def command_queues(self) -> Mapping[str, CommandQueue]:
+        """Return the command queues by interface_id."""
+        return self._command_queues
+
+    @property
+    def value_snapshot(self) -> ValueSnapshot:
+        """Return the snapshot of the entity states."""
+        return self._value_snapshot
 
     async def start_central(self) -> None:
         """Start the central unit."""
+        # The snapshot must be loaded before the entities are created.
+        await self._value_snapshot.async_load()
+        self._unregister_callbacks.append(
+            self._hass.bus.async_listen(
+                event_type=er.EVENT_ENTITY_REGISTRY_UPDATED,
+                listener=self._async_update_disabled_entities,
+            )
+        )
         self._unregister_callbacks.append(
             self._central.register_backend_system_callback(cb=self._async_backend_system_callback)
         )
@@ -237,72 +504,290 @@ class ControlUnit(BaseControlUnit):
             self._central.register_homematic_callback(cb=self._async_homematic_callback)
         )
         await super().start_central()
-        self._async_add_central_to_device_registry()
+        # Devices created on start are already in the registry, but the central
+        # may have been missing as their via device.
+        self._async_reconcile_device_registry(hm_devices=self._get_all_devices())
+        if not self._central.has_clients:
+            self._async_start_reconnect()
+        self._unregister_callbacks.append(
+            async_track_time_interval(
+                hass=self._hass,
+                action=self._async_save_value_snapshot,
+                interval=timedelta(seconds=DEFAULT_VALUE_SNAPSHOT_INTERVAL),
+                cancel_on_shutdown=True,
+            )
+        )
 
     async def stop_central(self, *args: Any) -> None:
         """Stop the central unit."""
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        if self._central.started:
+            await self._async_save_value_snapshot()
+
         if self._scheduler.initialized:
             self._scheduler.de_init()
 
+        for command_queue in self._command_queues.values():
+            command_queue.stop()
+
+        self._device_availability_aggregator.async_stop()
+        if self._long_press_aggregator:
+            self._long_press_aggregator.async_stop()
+        self._issue_damper.async_stop()
+        self._entity_update_queue.async_clear()
+
         for unregister in self._unregister_callbacks:
             if unregister is not None:
                 unregister()
+        self._disabled_entity_ids = None
+        self._disabled_unique_ids.clear()
 
         await super().stop_central(*args)
 
+    async def _async_save_value_snapshot(self, *args: Any) -> None:
+        """Save the value snapshot, if the central is connected to the backend."""
+        # Without clients, no entity has a current state to save.
+        if self._central.has_clients:
+            await self._value_snapshot.async_save()
+
+    @callback
+    def _async_start_reconnect(self) -> None:
+        """Start reconnecting to a backend, that was not reachable on startup."""
+        _LOGGER.warning(
+            "Backend of %s not reachable. Devices are created as soon as it is reachable",
+            self._instance_name,
+        )
+        async_create_issue(
+            hass=self._hass,
+            domain=DOMAIN,
+            issue_id=self._reconnect_issue_id,
+            is_fixable=False,
+            severity=IssueSeverity.WARNING,
+            translation_key="central_not_reachable",
+            translation_placeholders={CONF_INSTANCE_NAME: self._instance_name},
+        )
+        self._reconnect_task = self._hass.async_create_background_task(
+            self._async_reconnect(), name=f"{DOMAIN}-reconnect-{self._instance_name}"
+        )
+
+    async def _async_reconnect(self) -> None:
+        """Restart the clients with an increasing delay until the backend is reachable."""
+        delay = RECONNECT_DELAY_MIN
+        while not self._central.has_clients:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RECONNECT_DELAY_MAX)
+            _LOGGER.debug("Reconnecting to backend of %s", self._instance_name)
+            try:
+                # Creates the devices, that are added to the platforms by DEVICES_CREATED.
+                await self._central.restart_clients()
+            except BaseHomematicException as ex:
+                _LOGGER.debug("Reconnect to backend of %s failed: %s", self._instance_name, ex)
+        async_delete_issue(hass=self._hass, domain=DOMAIN, issue_id=self._reconnect_issue_id)
+        self._reconnect_task = None
+        _LOGGER.info("Reconnected to backend of %s", self._instance_name)
+
+    @property
+    def _reconnect_issue_id(self) -> str:
+        """Return the issue_id of an unreachable backend."""
+        return f"central_not_reachable-{self._instance_name}"
+
     @callback
-    def _async_add_central_to_device_registry(self) -> None:
-        """Add the central to device registry."""
+    def async_get_device_info(self, hm_device: HmDevice) -> DeviceInfo:
+        """
+        Return the device info for the entities of a device.
+
+        The device is added to the device registry once, and all entities of the
+        device share a device info, that only contains the identifiers.
+        """
+        if (device_info := self._device_infos.get(hm_device.identifier)) is None:
+            self._async_reconcile_device_registry(hm_devices=(hm_device,), include_central=False)
+            device_info = self._device_infos[hm_device.identifier]
+        return device_info
+
+    @callback
+    def async_remove_device(self, device_id: str) -> None:
+        """Remove a device and its entities from the registries."""
+        self._async_schedule_removal()
+        self._removed_device_ids.add(device_id)
+
+    @callback
+    def async_remove_entity(self, entity_id: str) -> None:
+        """Remove an entity from the entity registry."""
+        self._async_schedule_removal()
+        self._removed_entity_ids.add(entity_id)
+
+    @callback
+    def _async_schedule_removal(self) -> None:
+        """
+        Schedule the removal of the collected devices and entities.
+
+        hahomematic calls the removal callbacks of all entities of a device or
+        hub refresh within one iteration of the event loop. The removals are
+        collected and processed once in the next iteration.
+        """
+        if not self._removed_device_ids and not self._removed_entity_ids:
+            self._hass.loop.call_soon(self._async_process_removals)
+
+    @callback
+    def _async_process_removals(self) -> None:
+        """Remove the collected devices and entities from the registries."""
         device_registry = dr.async_get(self._hass)
-        device_registry.async_get_or_create(
-            config_entry_id=self._entry_id,
-            identifiers={
-                (
-                    DOMAIN,
-                    self._central.name,
-                )
-            },
-            manufacturer=Manufacturer.EQ3,
-            model=self._central.model,
-            sw_version=self._central.version,
-            name=self._central.name,
-            entry_type=DeviceEntryType.SERVICE,
-            configuration_url=self._central.central_url,
+        for device_id in self._removed_device_ids:
+            if (device := device_registry.async_get(device_id)) is None:
+                continue
+            for domain, identifier in device.identifiers:
+                if domain == DOMAIN:
+                    self._device_infos.pop(identifier, None)
+            # This will also remove associated entities from entity registry.
+            device_registry.async_remove_device(device_id)
+        if self._removed_device_ids:
+            # The duty cycle entities of deleted devices must not be read anymore.
+            self._duty_cycle_entities.clear()
+        self._entities_version += 1
+        entity_registry = er.async_get(self._hass)
+        for entity_id in self._removed_entity_ids:
+            if entity_id in entity_registry.entities:
+                entity_registry.async_remove(entity_id)
+        _LOGGER.debug(
+            "Removed %i devices and %i entities of %s",
+            len(self._removed_device_ids),
+            len(self._removed_entity_ids),
+            self._instance_name,
         )
+        self._removed_device_ids.clear()
+        self._removed_entity_ids.clear()
+
+    def _get_all_devices(self) -> tuple[HmDevice, ...]:
+        """Return the devices and the virtual remotes of the central."""
+        hm_devices = {hm_device.identifier: hm_device for hm_device in self._central.devices}
+        if self._central.has_clients:
+            for virtual_remote in self._central.get_virtual_remotes():
+                hm_devices.setdefault(virtual_remote.identifier, virtual_remote)
+        return tuple(hm_devices.values())
 
     @callback
-    def _async_add_virtual_remotes_to_device_registry(self) -> None:
-        """Add the virtual remotes to device registry."""
-        if not self._central.has_clients:
-            _LOGGER.error(
-                "Cannot create ControlUnit %s virtual remote devices. No clients",
-                self._instance_name,
-            )
-            return
+    def _async_reconcile_device_registry(
+        self, hm_devices: Iterable[HmDevice], include_central: bool = True
+    ) -> None:
+        """
+        Reconcile the central and the given devices with the device registry.
 
+        Devices are only written to the device registry, if they are missing
+        or their attributes have changed.
+        """
         device_registry = dr.async_get(self._hass)
-        for virtual_remote in self._central.get_virtual_remotes():
-            device_registry.async_get_or_create(
-                config_entry_id=self._entry_id,
-                identifiers={
-                    (
-                        DOMAIN,
-                        virtual_remote.identifier,
-                    )
+        central_device_id: str | None = None
+        if include_central:
+            central_device_id = self._async_reconcile_device(
+                device_registry=device_registry,
+                identifier=self._central.name,
+                attributes={
+                    "manufacturer": Manufacturer.EQ3,
+                    "model": self._central.model,
+                    "name": self._central.name,
+                    "sw_version": self._central.version,
+                    "entry_type": DeviceEntryType.SERVICE,
+                    "configuration_url": self._central.central_url,
                 },
-                manufacturer=Manufacturer.EQ3,
-                name=virtual_remote.name,
-                model=virtual_remote.model,
-                sw_version=virtual_remote.firmware,
+            )
+        elif central_device := device_registry.async_get_device(
+            identifiers={(DOMAIN, self._central.name)}
+        ):
+            central_device_id = central_device.id
+
+        for hm_device in hm_devices:
+            self._async_reconcile_device(
+                device_registry=device_registry,
+                identifier=hm_device.identifier,
+                attributes={
+                    "manufacturer": hm_device.manufacturer,
+                    "model": hm_device.model,
+                    "name": hm_device.name,
+                    "serial_number": hm_device.address,
+                    "sw_version": hm_device.firmware,
+                },
+                suggested_area=hm_device.room,
                 # Link to the homematic control unit.
-                via_device=cast(tuple[str, str], self._central.name),
+                via_device_id=central_device_id,
+            )
+            self._device_infos[hm_device.identifier] = DeviceInfo(
+                identifiers={(DOMAIN, hm_device.identifier)}
+            )
+
+    @callback
+    def _async_reconcile_device(
+        self,
+        device_registry: dr.DeviceRegistry,
+        identifier: str,
+        attributes: Mapping[str, Any],
+        suggested_area: str | None = None,
+        via_device_id: str | None = None,
+    ) -> str:
+        """Create or update a device in the device registry and return its id."""
+        identifiers = {(DOMAIN, identifier)}
+        device = device_registry.async_get_device(identifiers=identifiers)
+        if device is None or self._entry_id not in device.config_entries:
+            # async_get_or_create only takes the identifiers of the via device.
+            device = device_registry.async_get_or_create(
+                config_entry_id=self._entry_id,
+                identifiers=identifiers,
+                suggested_area=suggested_area,
+                via_device=(DOMAIN, self._central.name) if via_device_id else None,
+                **attributes,
             )
+            self._device_registry_stats.created += 1
+            return device.id
+        changes = {
+            key: value for key, value in attributes.items() if getattr(device, key) != value
+        }
+        if via_device_id and device.via_device_id != via_device_id:
+            changes["via_device_id"] = via_device_id
+        if changes:
+            device = device_registry.async_update_device(device.id, **changes) or device
+            self._device_registry_stats.updated += 1
+        else:
+            self._device_registry_stats.unchanged += 1
+        return device.id
+
+    @callback
+    def async_callback_finished(
+        self,
+        callback_name: str,
+        started_at: float,
+        device_address: str | None = None,
+        event_type: str | None = None,
+    ) -> None:
+        """Register the time spent in a callback, that started at the given monotonic time."""
+        duration = monotonic() - started_at
+        self._event_metrics.callback_finished(callback_name=callback_name, duration=duration)
+        self._callback_watchdog.callback_finished(
+            callback_name=callback_name,
+            duration=duration,
+            device_address=device_address,
+            event_type=event_type,
+        )
 
     @callback
     def _async_backend_system_callback(
         self, system_event: BackendSystemEvent, **kwargs: Any
     ) -> None:
         """Execute the callback for system based events."""
+        started_at = monotonic()
+        self._async_handle_backend_system_event(system_event, **kwargs)
+        self.async_callback_finished(
+            callback_name=CALLBACK_BACKEND_SYSTEM_EVENT,
+            started_at=started_at,
+            event_type=system_event.value,
+        )
+
+    @callback
+    def _async_handle_backend_system_event(
+        self, system_event: BackendSystemEvent, **kwargs: Any
+    ) -> None:
+        """Handle system based events."""
         _LOGGER.debug(
             "callback_system_event: Received system event %s for event for %s",
             system_event,
@@ -311,25 +796,63 @@ class ControlUnit(BaseControlUnit):
 
         # Handle event of new device creation in Homematic(IP) Local.
         if system_event == BackendSystemEvent.DEVICES_CREATED:
+            new_devices = {
+                hm_entity.device
+                for hm_entities in kwargs["new_entities"].values()
+                for hm_entity in hm_entities
+            }
+            self._entities_version += 1
+            # Add the new devices in one pass, before their entities are added.
+            self._async_reconcile_device_registry(hm_devices=new_devices, include_central=False)
+            self._async_forward_new_platforms(
+                hm_platforms=[
+                    platform
+                    for platform, hm_entities in kwargs["new_entities"].items()
+                    if hm_entities
+                ]
+                + ([HmPlatform.EVENT] if kwargs["new_channel_events"] else [])
+            )
             for platform, hm_entities in kwargs["new_entities"].items():
                 if hm_entities and len(hm_entities) > 0:
+                    # The platforms add their entities synchronously within the dispatch.
+                    started_at = monotonic()
                     async_dispatcher_send(
                         self._hass,
                         signal_new_hm_entity(entry_id=self._entry_id, platform=platform),
                         hm_entities,
                     )
+                    self.async_callback_finished(
+                        callback_name=f"async_add_{platform.value}",
+                        started_at=started_at,
+                        event_type=system_event.value,
+                    )
+            if new_devices:
+                async_dispatcher_send(
+                    self._hass,
+                    signal_new_hm_devices(entry_id=self._entry_id),
+                    tuple(new_devices),
+                )
             for channel_events in kwargs["new_channel_events"]:
                 async_dispatcher_send(
                     self._hass,
                     signal_new_hm_entity(entry_id=self._entry_id, platform=HmPlatform.EVENT),
                     channel_events,
                 )
-            self._async_add_virtual_remotes_to_device_registry()
+            self._duty_cycle_entities.clear()
         elif system_event == BackendSystemEvent.HUB_REFRESHED:
             if not self._scheduler.initialized:
                 self._hass.create_task(target=self._scheduler.init())
 
             # Handle event of new hub entity creation in Homematic(IP) Local.
+            if any(kwargs["new_hub_entities"].values()):
+                self._entities_version += 1
+            self._async_forward_new_platforms(
+                hm_platforms=[
+                    platform
+                    for platform, hm_hub_entities in kwargs["new_hub_entities"].items()
+                    if hm_hub_entities
+                ]
+            )
             for platform, hm_hub_entities in kwargs["new_hub_entities"].items():
                 if hm_hub_entities and len(hm_hub_entities) > 0:
                     async_dispatcher_send(
@@ -340,11 +863,64 @@ class ControlUnit(BaseControlUnit):
             return
         return
 
+    @callback
+    def _async_long_press_ended(
+        self, channel_address: str, event_data: Mapping[str, Any] | None
+    ) -> None:
+        """Fire a release event for a long press, that ended without one."""
+        if event_data is None:
+            return
+        # Fired directly, because the device has no trigger for the release event,
+        # and the long press aggregator has already ended the long press.
+        release_event_data = {**event_data, EVENT_PARAMETER: LONG_PRESS_END_PARAMETER}
+        if device_entry := self._async_get_device_entry(
+            device_address=release_event_data[EVENT_ADDRESS]
+        ):
+            release_event_data.update(
+                {
+                    EVENT_DEVICE_ID: device_entry.id,
+                    EVENT_NAME: device_entry.name_by_user or device_entry.name,
+                }
+            )
+        self._async_fire_click_event(
+            hm_event_type=HomematicEventType.KEYPRESS, event_data=release_event_data
+        )
+
+    @callback
+    def _async_fire_click_event(
+        self, hm_event_type: HomematicEventType, event_data: dict[str, Any]
+    ) -> None:
+        """Fire a click event on the event bus."""
+        event_data = cleanup_click_event_data(event_data=event_data)
+        if is_valid_event(event_data=event_data, schema=CLICK_EVENT_SCHEMA):
+            self._click_event_stats.delivered += 1
+            self._hass.bus.fire(
+                event_type=hm_event_type.value,
+                event_data=event_data,
+            )
+
     @callback
     def _async_homematic_callback(
         self, hm_event_type: HomematicEventType, event_data: dict[str, Any]
     ) -> None:
         """Execute the callback used for device related events."""
+        started_at = monotonic()
+        self._event_metrics.event_received(
+            interface_id=event_data[EVENT_INTERFACE_ID], event_type=hm_event_type.value
+        )
+        self._async_handle_homematic_event(hm_event_type=hm_event_type, event_data=event_data)
+        self.async_callback_finished(
+            callback_name=CALLBACK_HOMEMATIC_EVENT,
+            started_at=started_at,
+            device_address=event_data.get(EVENT_ADDRESS),
+            event_type=hm_event_type.value,
+        )
+
+    @callback
+    def _async_handle_homematic_event(
+        self, hm_event_type: HomematicEventType, event_data: dict[str, Any]
+    ) -> None:
+        """Handle device related events."""
 
         interface_id = event_data[EVENT_INTERFACE_ID]
         if hm_event_type == HomematicEventType.INTERFACE:
@@ -353,15 +929,17 @@ class ControlUnit(BaseControlUnit):
             event_data = cast(dict[str, Any], INTERFACE_EVENT_SCHEMA(event_data))
             data = event_data[EVENT_DATA]
             if interface_event_type == InterfaceEventType.CALLBACK:
+                self._interface_callback_alive[interface_id] = data[EVENT_AVAILABLE]
                 if not self._enable_system_notifications:
                     _LOGGER.debug("SYSTEM NOTIFICATION disabled for CALLBACK")
                     return
                 if data[EVENT_AVAILABLE]:
-                    async_delete_issue(hass=self._hass, domain=DOMAIN, issue_id=issue_id)
+                    self._issue_damper.async_clear_issue(
+                        interface_id=interface_id, issue_id=issue_id
+                    )
                 else:
-                    async_create_issue(
-                        hass=self._hass,
-                        domain=DOMAIN,
+                    self._issue_damper.async_set_issue(
+                        interface_id=interface_id,
                         issue_id=issue_id,
                         is_fixable=False,
                         learn_more_url=LEARN_MORE_URL_XMLRPC_SERVER_RECEIVES_NO_EVENTS,
@@ -377,15 +955,12 @@ class ControlUnit(BaseControlUnit):
                     _LOGGER.debug("SYSTEM NOTIFICATION disabled for PENDING_PONG")
                     return
                 if data[EVENT_PONG_MISMATCH_COUNT] == 0:
-                    async_delete_issue(
-                        hass=self._hass,
-                        domain=DOMAIN,
-                        issue_id=issue_id,
+                    self._issue_damper.async_clear_issue(
+                        interface_id=interface_id, issue_id=issue_id
                     )
                 else:
-                    async_create_issue(
-                        hass=self._hass,
-                        domain=DOMAIN,
+                    self._issue_damper.async_set_issue(
+                        interface_id=interface_id,
                         issue_id=issue_id,
                         is_fixable=False,
                         learn_more_url=LEARN_MORE_URL_PONG_MISMATCH,
@@ -397,12 +972,14 @@ class ControlUnit(BaseControlUnit):
                         },
                     )
             elif interface_event_type == InterfaceEventType.PROXY:
+                self._interface_available[interface_id] = data[EVENT_AVAILABLE]
                 if data[EVENT_AVAILABLE]:
-                    async_delete_issue(hass=self._hass, domain=DOMAIN, issue_id=issue_id)
+                    self._issue_damper.async_clear_issue(
+                        interface_id=interface_id, issue_id=issue_id
+                    )
                 else:
-                    async_create_issue(
-                        hass=self._hass,
-                        domain=DOMAIN,
+                    self._issue_damper.async_set_issue(
+                        interface_id=interface_id,
                         issue_id=issue_id,
                         is_fixable=False,
                         severity=IssueSeverity.WARNING,
@@ -414,17 +991,34 @@ class ControlUnit(BaseControlUnit):
 
         else:
             device_address = event_data[EVENT_ADDRESS]
+            if (
+                self._config.drop_unconsumed_click_events
+                and hm_event_type in (HomematicEventType.IMPULSE, HomematicEventType.KEYPRESS)
+                and not self._click_event_consumers.has_consumer(
+                    event_type=hm_event_type.value,
+                    device_address=device_address,
+                    channel_no=event_data[EVENT_CHANNEL_NO],
+                    parameter=event_data[EVENT_PARAMETER],
+                )
+            ):
+                self._click_event_stats.dropped += 1
+                return
+            if (
+                hm_event_type in (HomematicEventType.IMPULSE, HomematicEventType.KEYPRESS)
+                and self._long_press_aggregator
+                and not self._long_press_aggregator.is_passed(
+                    channel_address=f"{device_address}:{event_data[EVENT_CHANNEL_NO]}",
+                    parameter=event_data[EVENT_PARAMETER],
+                    event_data=event_data,
+                )
+            ):
+                return
             name: str | None = None
             if device_entry := self._async_get_device_entry(device_address=device_address):
                 name = device_entry.name_by_user or device_entry.name
                 event_data.update({EVENT_DEVICE_ID: device_entry.id, EVENT_NAME: name})
             if hm_event_type in (HomematicEventType.IMPULSE, HomematicEventType.KEYPRESS):
-                event_data = cleanup_click_event_data(event_data=event_data)
-                if is_valid_event(event_data=event_data, schema=CLICK_EVENT_SCHEMA):
-                    self._hass.bus.fire(
-                        event_type=hm_event_type.value,
-                        event_data=event_data,
-                    )
+                self._async_fire_click_event(hm_event_type=hm_event_type, event_data=event_data)
             elif hm_event_type == HomematicEventType.DEVICE_AVAILABILITY:
                 parameter = event_data[EVENT_PARAMETER]
                 unavailable = event_data[EVENT_VALUE]
@@ -443,18 +1037,20 @@ class ControlUnit(BaseControlUnit):
                         event_data=event_data,
                         schema=DEVICE_AVAILABILITY_EVENT_SCHEMA,
                     ):
-                        self._hass.bus.fire(
-                            event_type=hm_event_type.value,
-                            event_data=event_data,
-                        )
+                        self._device_availability_aggregator.async_add_event(event_data=event_data)
             elif hm_event_type == HomematicEventType.DEVICE_ERROR:
                 error_parameter = event_data[EVENT_PARAMETER]
                 if error_parameter in FILTER_ERROR_EVENT_PARAMETERS:
                     return
+                error_value = event_data[EVENT_VALUE]
+                # Devices re-report unchanged errors on every status cycle.
+                if not self._device_error_deduplicator.is_changed(
+                    device_address=device_address, parameter=error_parameter, value=error_value
+                ):
+                    return
                 error_parameter_display = error_parameter.replace("_", " ").title()
                 title = f"{DOMAIN.upper()} Device Error"
                 error_message: str = ""
-                error_value = event_data[EVENT_VALUE]
                 display_error: bool = False
                 if isinstance(error_value, bool):
                     display_error = error_value
@@ -498,6 +1094,47 @@ class ControlUnit(BaseControlUnit):
             }
         )
 
+    async def async_send_command(
+        self,
+        interface_id: str,
+        send: Callable[[], Awaitable[Any]],
+        key: CommandKey | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+    ) -> Any:
+        """Send a command through the command queue of the interface."""
+        if not self._config.command_queue_enabled:
+            return await send()
+        if (command_queue := self._command_queues.get(interface_id)) is None:
+            command_queue = CommandQueue(
+                hass=self._hass,
+                interface_id=interface_id,
+                duty_cycle_provider=lambda: self._get_duty_cycle(interface_id=interface_id),
+            )
+            self._command_queues[interface_id] = command_queue
+        return await command_queue.async_send(send=send, key=key, priority=priority)
+
+    @callback
+    def _get_duty_cycle(self, interface_id: str) -> float | None:
+        """Return the highest duty cycle level reported by the devices of an interface."""
+        if (duty_cycle_entities := self._duty_cycle_entities.get(interface_id)) is not None:
+            self._duty_cycle_cache_stats.hits += 1
+        else:
+            self._duty_cycle_cache_stats.misses += 1
+            duty_cycle_entities = tuple(
+                entity
+                for hm_device in self._central.devices
+                if hm_device.interface_id == interface_id
+                for entity in hm_device.generic_entities
+                if entity.parameter == DUTY_CYCLE_LEVEL
+            )
+            self._duty_cycle_entities[interface_id] = duty_cycle_entities
+        duty_cycles = [
+            float(entity.value)
+            for entity in duty_cycle_entities
+            if entity.is_valid and isinstance(entity.value, int | float)
+        ]
+        return max(duty_cycles) if duty_cycles else None
+
     async def fetch_all_system_variables(self) -> None:
         """Fetch all system variables from CCU / Homegear."""
         if not self._scheduler.initialized:
@@ -506,6 +1143,57 @@ class ControlUnit(BaseControlUnit):
 
         await self._scheduler.fetch_sysvars()
 
+    @callback
+    def async_exclude_disabled_entities(
+        self, hm_entities: tuple[_EntityT, ...]
+    ) -> tuple[_EntityT, ...]:
+        """
+        Return the entities, that are not disabled in the entity registry.
+
+        Disabled entities are not constructed. HA reloads the config entry,
+        when an entity is enabled, and the entity is created on the reload.
+        Entities without a registry entry are always returned, so that the
+        registry entry is created with the default of the entity.
+        """
+        if self._disabled_entity_ids is None:
+            self._disabled_entity_ids = {}
+            for entity_entry in er.async_entries_for_config_entry(
+                er.async_get(self._hass), self._entry_id
+            ):
+                if entity_entry.disabled:
+                    self._disabled_entity_ids[entity_entry.entity_id] = entity_entry.unique_id
+                    self._disabled_unique_ids.add(entity_entry.unique_id)
+        if not self._disabled_unique_ids:
+            return hm_entities
+        return tuple(
+            hm_entity
+            for hm_entity in hm_entities
+            if f"{DOMAIN}_{hm_entity.unique_id}" not in self._disabled_unique_ids
+        )
+
+    @callback
+    def _async_update_disabled_entities(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Keep the disabled registry entries of the config entry current."""
+        if self._disabled_entity_ids is None:
+            return
+        data = event.data
+        entity_ids = [data["entity_id"]]
+        if data["action"] == "update" and (old_entity_id := data.get("old_entity_id")):
+            entity_ids.append(old_entity_id)
+        for entity_id in entity_ids:
+            if (unique_id := self._disabled_entity_ids.pop(entity_id, None)) is not None:
+                self._disabled_unique_ids.discard(unique_id)
+        if (
+            data["action"] != "remove"
+            and (entity_entry := er.async_get(self._hass).async_get(data["entity_id"]))
+            and entity_entry.config_entry_id == self._entry_id
+            and entity_entry.disabled
+        ):
+            self._disabled_entity_ids[entity_entry.entity_id] = entity_entry.unique_id
+            self._disabled_unique_ids.add(entity_entry.unique_id)
+
     def get_new_entities(
         self,
         entity_type: type[_EntityT] | UnionType,
@@ -610,7 +1298,34 @@ class ControlConfig:
         self.listen_on_all_ip = advanced_config.get(
             CONF_LISTEN_ON_ALL_IP, DEFAULT_LISTEN_ON_ALL_IP
         )
+        self.optimistic_updates: Final[bool] = advanced_config.get(
+            CONF_OPTIMISTIC_UPDATES, DEFAULT_OPTIMISTIC_UPDATES
+        )
+        self.slow_callback_threshold: Final[int] = advanced_config.get(
+            CONF_SLOW_CALLBACK_THRESHOLD, DEFAULT_SLOW_CALLBACK_THRESHOLD
+        )
+        self.device_error_reannounce_interval: Final[int] = advanced_config.get(
+            CONF_DEVICE_ERROR_REANNOUNCE_INTERVAL, DEFAULT_DEVICE_ERROR_REANNOUNCE_INTERVAL
+        )
+        self.long_press_aggregation: Final[bool] = advanced_config.get(
+            CONF_LONG_PRESS_AGGREGATION, DEFAULT_LONG_PRESS_AGGREGATION
+        )
+        self.long_press_repeat_interval: Final[int] = advanced_config.get(
+            CONF_LONG_PRESS_REPEAT_INTERVAL, DEFAULT_LONG_PRESS_REPEAT_INTERVAL
+        )
+        self.drop_unconsumed_click_events: Final[bool] = advanced_config.get(
+            CONF_DROP_UNCONSUMED_CLICK_EVENTS, DEFAULT_DROP_UNCONSUMED_CLICK_EVENTS
+        )
+        self.entity_update_batch_time: Final[int] = advanced_config.get(
+            CONF_ENTITY_UPDATE_BATCH_TIME, DEFAULT_ENTITY_UPDATE_BATCH_TIME
+        )
+        self.command_queue_enabled: Final[bool] = advanced_config.get(
+            CONF_COMMAND_QUEUE_ENABLED, DEFAULT_COMMAND_QUEUE_ENABLED
+        )
         self.un_ignore: Final = advanced_config.get(CONF_UN_IGNORE, DEFAULT_UN_IGNORE)
+        self.write_coalesce_delay: Final[int] = advanced_config.get(
+            CONF_WRITE_COALESCE_DELAY, DEFAULT_WRITE_COALESCE_DELAY
+        )
 
     def check_config(self) -> None:
         """Check config. Throws BaseHomematicException on failure."""
@@ -648,6 +1363,40 @@ class ControlConfig:
         )
 
 
+@dataclass
+class CacheStats:
+    """Statistics of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the ratio of cache hits."""
+        if (lookups := self.hits + self.misses) == 0:
+            return None
+        return self.hits / lookups
+
+
+@dataclass
+class DeviceRegistryStats:
+    """Statistics of the device registry reconciliation."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+@dataclass
+class FetchStats:
+    """Statistics of a scheduled fetch job."""
+
+    count: int = 0
+    failures: int = 0
+    duration_total: float = 0.0
+    duration_last: float = 0.0
+
+
 class HmScheduler:
     """The Homematic(IP) Local hub scheduler. (CCU/HomeGear)."""
 
@@ -666,12 +1415,35 @@ class HmScheduler:
         self._remove_device_firmware_updating_check_listener: Callable | None = None
         self._remove_sys_listener: Callable | None = None
         self._sema_init: Final = asyncio.Semaphore()
+        self._fetch_stats: dict[str, FetchStats] = {}
+
+    @property
+    def fetch_stats(self) -> Mapping[str, FetchStats]:
+        """Return the statistics of the fetch jobs by job name."""
+        return self._fetch_stats
 
     @property
     def initialized(self) -> bool:
         """Return initialized state."""
         return self._initialized
 
+    @contextmanager
+    def _measure_fetch(self, name: str) -> Iterator[None]:
+        """Measure the duration of a fetch job."""
+        if (fetch_stats := self._fetch_stats.get(name)) is None:
+            fetch_stats = FetchStats()
+            self._fetch_stats[name] = fetch_stats
+        started_at = monotonic()
+        try:
+            yield
+        except Exception:
+            fetch_stats.failures += 1
+            raise
+        finally:
+            fetch_stats.count += 1
+            fetch_stats.duration_last = monotonic() - started_at
+            fetch_stats.duration_total += fetch_stats.duration_last
+
     async def init(self) -> None:
         """Execute the initial data refresh."""
         async with self._sema_init:
@@ -736,8 +1508,9 @@ class HmScheduler:
 
     async def _fetch_sys_data(self, now: datetime) -> None:
         """Fetch data from backend."""
-        await self._central.fetch_program_data(scheduled=True)
-        await self._central.fetch_sysvar_data(scheduled=True)
+        with self._measure_fetch(name="sys_data"):
+            await self._central.fetch_program_data(scheduled=True)
+            await self._central.fetch_sysvar_data(scheduled=True)
 
     async def fetch_sysvars(self) -> None:
         """Fetch sysvars from backend."""
@@ -749,7 +1522,8 @@ class HmScheduler:
             "Scheduled fetching of device firmware update data for %s",
             self._central.name,
         )
-        await self._central.refresh_firmware_data()
+        with self._measure_fetch(name="device_firmware"):
+            await self._central.refresh_firmware_data()
 
     async def _fetch_device_firmware_update_data_in_delivery(self, now: datetime) -> None:
         """Fetch device firmware update data from backend for delivering devices."""
@@ -757,12 +1531,13 @@ class HmScheduler:
             "Scheduled fetching of device firmware update data for delivering devices for %s",
             self._central.name,
         )
-        await self._central.refresh_firmware_data_by_state(
-            device_firmware_states=(
-                DeviceFirmwareState.DELIVER_FIRMWARE_IMAGE,
-                DeviceFirmwareState.LIVE_DELIVER_FIRMWARE_IMAGE,
+        with self._measure_fetch(name="device_firmware_delivering"):
+            await self._central.refresh_firmware_data_by_state(
+                device_firmware_states=(
+                    DeviceFirmwareState.DELIVER_FIRMWARE_IMAGE,
+                    DeviceFirmwareState.LIVE_DELIVER_FIRMWARE_IMAGE,
+                )
             )
-        )
 
     async def _fetch_device_firmware_update_data_in_update(self, now: datetime) -> None:
         """Fetch device firmware update data from backend for updating devices."""
@@ -770,13 +1545,14 @@ class HmScheduler:
             "Scheduled fetching of device firmware update data for updating devices for %s",
             self._central.name,
         )
-        await self._central.refresh_firmware_data_by_state(
-            device_firmware_states=(
-                DeviceFirmwareState.READY_FOR_UPDATE,
-                DeviceFirmwareState.DO_UPDATE_PENDING,
-                DeviceFirmwareState.PERFORMING_UPDATE,
+        with self._measure_fetch(name="device_firmware_updating"):
+            await self._central.refresh_firmware_data_by_state(
+                device_firmware_states=(
+                    DeviceFirmwareState.READY_FOR_UPDATE,
+                    DeviceFirmwareState.DO_UPDATE_PENDING,
+                    DeviceFirmwareState.PERFORMING_UPDATE,
+                )
             )
-        )
 
 
 def signal_new_hm_entity(entry_id: str, platform: HmPlatform) -> str:
@@ -784,6 +1560,11 @@ def signal_new_hm_entity(entry_id: str, platform: HmPlatform) -> str:
     return f"{DOMAIN}-new-entity-{entry_id}-{platform.value}"
 
 
+def signal_new_hm_devices(entry_id: str) -> str:
+    """Gateway specific event to signal new devices."""
+    return f"{DOMAIN}-new-devices-{entry_id}"
+
+
 async def validate_config_and_get_system_information(
     control_config: ControlConfig,
 ) -> SystemInformation | None:
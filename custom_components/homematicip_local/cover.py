@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any, TypeVar
 
-from hahomematic.const import HmPlatform
+from hahomematic.const import HmPlatform, Parameter
 from hahomematic.platforms.custom import CeBlind, CeCover, CeGarage, CeIpBlind
 from hahomematic.platforms.entity import CallParameterCollector
 import voluptuous as vol
@@ -25,6 +26,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HomematicConfigEntry
+from .command_queue import CommandPriority
 from .const import SERVICE_SET_COVER_COMBINED_POSITION
 from .control_unit import ControlUnit, signal_new_hm_entity
 from .generic_entity import HaHomematicGenericRestoreEntity
@@ -49,7 +51,7 @@ async def async_setup_entry(
         _LOGGER.debug("ASYNC_ADD_COVER: Adding %i entities", len(hm_entities))
         entities: list[HaHomematicBaseCover] = []
 
-        for hm_entity in hm_entities:
+        for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities):
             if isinstance(hm_entity, CeIpBlind):
                 if hm_entity.operation_mode and hm_entity.operation_mode == "SHUTTER":
                     entities.append(
@@ -119,6 +121,8 @@ class HaHomematicBaseCover(HaHomematicGenericRestoreEntity[HmGenericCover], Cove
     @property
     def current_cover_position(self) -> int | None:
         """Return current position of cover."""
+        if "current_cover_position" in self._optimistic_values:
+            return self._optimistic_values["current_cover_position"]
         if self._hm_entity.is_valid:
             return self._hm_entity.current_position
         if self.is_restored and self._restored_state:
@@ -128,6 +132,8 @@ class HaHomematicBaseCover(HaHomematicGenericRestoreEntity[HmGenericCover], Cove
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed."""
+        if "is_closed" in self._optimistic_values:
+            return self._optimistic_values["is_closed"]
         if self._hm_entity.is_valid:
             return self._hm_entity.is_closed
         if (
@@ -157,29 +163,64 @@ class HaHomematicBaseCover(HaHomematicGenericRestoreEntity[HmGenericCover], Cove
         # Hm cover is closed:1 -> open:0
         if ATTR_POSITION in kwargs:
             position = int(kwargs[ATTR_POSITION])
-            await self._hm_entity.set_position(position=position)
+            await self._async_send_command(
+                send=partial(self._hm_entity.set_position, position=position),
+                parameter=Parameter.LEVEL,
+                coalesce=True,
+                optimistic_values={
+                    "current_cover_position": position,
+                    "is_closed": position == 0,
+                },
+            )
 
     async def async_set_cover_combined_position(
         self, position: int, tilt_position: int | None = None, wait_for_callback: int | None = None
     ) -> None:
         """Move the cover to a specific position incl. tilt."""
-        collector = CallParameterCollector(client=self._hm_entity.device.client)
-        await self._hm_entity.set_position(
-            position=position, tilt_position=tilt_position, collector=collector
+
+        async def send_combined_position() -> None:
+            collector = CallParameterCollector(client=self._hm_entity.device.client)
+            await self._hm_entity.set_position(
+                position=position, tilt_position=tilt_position, collector=collector
+            )
+            await collector.send_data(wait_for_callback=wait_for_callback)
+
+        optimistic_values: dict[str, Any] = {
+            "current_cover_position": position,
+            "is_closed": position == 0,
+        }
+        if tilt_position is not None:
+            optimistic_values["current_cover_tilt_position"] = tilt_position
+        await self._async_send_command(
+            send=send_combined_position,
+            parameter=Parameter.LEVEL,
+            optimistic_values=optimistic_values,
         )
-        await collector.send_data(wait_for_callback=wait_for_callback)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
-        await self._hm_entity.open()
+        await self._async_send_command(
+            send=self._hm_entity.open,
+            parameter=Parameter.LEVEL,
+            optimistic_values={"current_cover_position": 100, "is_closed": False},
+        )
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close the cover."""
-        await self._hm_entity.close()
+        await self._async_send_command(
+            send=self._hm_entity.close,
+            parameter=Parameter.LEVEL,
+            optimistic_values={"current_cover_position": 0, "is_closed": True},
+        )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the device if in motion."""
-        await self._hm_entity.stop()
+        # A stop replaces a pending movement and is sent before other commands.
+        # The final position is unknown, so optimistic values are dropped.
+        self._async_clear_optimistic_values()
+        await self._async_send_command(
+            send=self._hm_entity.stop, parameter=Parameter.LEVEL, priority=CommandPriority.HIGH
+        )
 
 
 class HaHomematicCover(HaHomematicBaseCover[CeCover]):
@@ -192,6 +233,8 @@ class HaHomematicBlind(HaHomematicBaseCover[CeBlind | CeIpBlind]):
     @property
     def current_cover_tilt_position(self) -> int | None:
         """Return current tilt position of cover."""
+        if "current_cover_tilt_position" in self._optimistic_values:
+            return self._optimistic_values["current_cover_tilt_position"]
         if self._hm_entity.is_valid:
             return self._hm_entity.current_tilt_position
         if self.is_restored and self._restored_state:
@@ -202,19 +245,37 @@ class HaHomematicBlind(HaHomematicBaseCover[CeBlind | CeIpBlind]):
         """Move the cover to a specific tilt position."""
         if ATTR_TILT_POSITION in kwargs:
             tilt_position = int(kwargs[ATTR_TILT_POSITION])
-            await self._hm_entity.set_position(tilt_position=tilt_position)
+            await self._async_send_command(
+                send=partial(self._hm_entity.set_position, tilt_position=tilt_position),
+                parameter=Parameter.LEVEL_2,
+                coalesce=True,
+                optimistic_values={"current_cover_tilt_position": tilt_position},
+            )
 
     async def async_open_cover_tilt(self, **kwargs: Any) -> None:
         """Open the tilt."""
-        await self._hm_entity.open_tilt()
+        await self._async_send_command(
+            send=self._hm_entity.open_tilt,
+            parameter=Parameter.LEVEL_2,
+            optimistic_values={"current_cover_tilt_position": 100},
+        )
 
     async def async_close_cover_tilt(self, **kwargs: Any) -> None:
         """Close the tilt."""
-        await self._hm_entity.close_tilt()
+        await self._async_send_command(
+            send=self._hm_entity.close_tilt,
+            parameter=Parameter.LEVEL_2,
+            optimistic_values={"current_cover_tilt_position": 0},
+        )
 
     async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
         """Stop the device if in motion."""
-        await self._hm_entity.stop_tilt()
+        self._async_clear_optimistic_values()
+        await self._async_send_command(
+            send=self._hm_entity.stop_tilt,
+            parameter=Parameter.LEVEL_2,
+            priority=CommandPriority.HIGH,
+        )
 
 
 class HaHomematicGarage(HaHomematicBaseCover[CeGarage]):
@@ -9,7 +9,7 @@ import voluptuous as vol
 from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
 from homeassistant.components.homeassistant.triggers import event as event_trigger
 from homeassistant.const import CONF_ADDRESS, CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
@@ -17,6 +17,7 @@ from homeassistant.helpers.typing import ConfigType
 from . import DOMAIN
 from .const import CONF_EVENT_TYPE, CONF_INTERFACE_ID, CONF_SUBTYPE
 from .control_unit import ControlUnit
+from .event_consumers import async_get_click_event_consumers
 from .support import cleanup_click_event_data, get_device_address_at_interface_from_identifiers
 
 TRIGGER_TYPES = {param.lower() for param in CLICK_EVENTS}
@@ -95,10 +96,24 @@ async def async_attach_trigger(
     }
 
     event_config = event_trigger.TRIGGER_SCHEMA(event_config)
-    return await event_trigger.async_attach_trigger(
+    remove_trigger = await event_trigger.async_attach_trigger(
         hass=hass,
         config=event_config,
         action=action,
         trigger_info=trigger_info,
         platform_type="device",
     )
+    remove_consumer = async_get_click_event_consumers(hass=hass).async_add_consumer(
+        event_type=config[CONF_EVENT_TYPE],
+        device_address=config[CONF_ADDRESS],
+        channel_no=config[CONF_SUBTYPE],
+        parameter=config[CONF_TYPE],
+    )
+
+    @callback
+    def async_remove() -> None:
+        """Remove the trigger and its consumer of the click event."""
+        remove_trigger()
+        remove_consumer()
+
+    return async_remove
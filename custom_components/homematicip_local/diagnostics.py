@@ -7,13 +7,14 @@ from dataclasses import asdict
 from typing import Any
 
 from hahomematic.central import CentralUnit
-from hahomematic.const import CONF_PASSWORD, CONF_USERNAME, HmPlatform
+from hahomematic.const import CONF_PASSWORD, CONF_USERNAME
 
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from . import HomematicConfigEntry
 from .control_unit import ControlUnit
+from .support import get_entities_by_platform_stats
 
 REDACT_CONFIG = {CONF_USERNAME, CONF_PASSWORD}
 
@@ -32,26 +33,69 @@ async def async_get_config_entry_diagnostics(
     diag["system_information"] = async_redact_data(
         asdict(control_unit.central.system_information), "serial"
     )
+    diag["command_queues"] = get_command_queue_stats(control_unit=control_unit)
+    diag["command_latency"] = get_command_latency_stats(control_unit=control_unit)
+    diag["event_metrics"] = get_event_metrics_stats(control_unit=control_unit)
+    diag["slow_callbacks"] = get_slow_callback_stats(control_unit=control_unit)
+    diag["device_registry"] = asdict(control_unit.device_registry_stats)
+    diag["device_error_events_suppressed"] = control_unit.device_error_deduplicator.suppressed
+    diag["entity_update_queue"] = asdict(control_unit.entity_update_queue.stats)
+    click_event_stats = control_unit.click_event_stats
+    diag["click_events"] = {
+        "delivered": click_event_stats.delivered,
+        "dropped": click_event_stats.dropped,
+        "dropped_ratio": click_event_stats.dropped_ratio,
+    }
+    if long_press_aggregator := control_unit.long_press_aggregator:
+        diag["long_press_events_suppressed"] = long_press_aggregator.suppressed
+    diag["repair_issues"] = {
+        interface_id: asdict(stats)
+        for interface_id, stats in control_unit.issue_damper.stats.items()
+    }
 
     return diag
 
 
+def get_command_latency_stats(control_unit: ControlUnit) -> Mapping[str, Any]:
+    """Return the command round-trip latency statistics by device address."""
+    return {
+        device_address: asdict(metrics) | {"latency_avg": metrics.latency_avg}
+        for device_address, metrics in sorted(control_unit.command_latency.metrics.items())
+    }
+
+
+def get_command_queue_stats(control_unit: ControlUnit) -> Mapping[str, Any]:
+    """Return the command queue statistics by interface."""
+    return {
+        interface_id: asdict(command_queue.metrics)
+        | {"wait_time_avg": command_queue.metrics.wait_time_avg}
+        for interface_id, command_queue in sorted(control_unit.command_queues.items())
+    }
+
+
+def get_event_metrics_stats(control_unit: ControlUnit) -> Mapping[str, Any]:
+    """Return the event ingestion statistics."""
+    event_metrics = control_unit.event_metrics
+    return {
+        "events_total": event_metrics.events_total,
+        "events_total_by_event_type": event_metrics.events_total_by_event_type,
+        "events_per_second": event_metrics.events_per_second,
+        "events_per_second_by_interface": event_metrics.events_per_second_by_interface,
+        "events_per_second_by_event_type": event_metrics.events_per_second_by_event_type,
+        "lag_avg": event_metrics.lag_avg,
+        "lag_max": event_metrics.lag_max,
+        "callback_time_max": event_metrics.callback_time_max,
+    }
+
+
+def get_slow_callback_stats(control_unit: ControlUnit) -> Mapping[str, Any]:
+    """Return the statistics of callbacks, that exceeded the slow callback threshold."""
+    return {
+        callback_name: asdict(stats)
+        for callback_name, stats in control_unit.callback_watchdog.stats.items()
+    }
+
+
 def get_devices_per_type_stats(central: CentralUnit) -> tuple[str, ...]:
     """Return the central statistics for devices by type."""
     return tuple(sorted({d.model for d in central.devices}))
-
-
-def get_entities_by_platform_stats(
-    central: CentralUnit, registered: bool | None = None
-) -> Mapping[HmPlatform, int]:
-    """Return the central statistics for entities by platform."""
-    _entities_by_platform: dict[HmPlatform, int] = {}
-    for entity in (
-        central.get_entities(registered=registered)
-        + central.program_buttons
-        + central.sysvar_entities
-    ):
-        if (platform := entity.platform) not in _entities_by_platform:
-            _entities_by_platform[platform] = 0
-        _entities_by_platform[platform] += 1
-    return dict(sorted(_entities_by_platform.items()))
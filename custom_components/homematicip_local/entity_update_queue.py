@@ -0,0 +1,116 @@
+"""Batched processing of entity updates for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Final
+
+from homeassistant.core import HomeAssistant, callback
+
+# Max number of queued entity updates. Further updates are processed immediately.
+ENTITY_UPDATE_QUEUE_SIZE: Final = 1000
+
+
+@dataclass
+class EntityUpdateQueueStats:
+    """Statistics of the entity update queue."""
+
+    updates: int = 0
+    batches: int = 0
+    compacted: int = 0
+    overflows: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    max_batch_size: int = 0
+
+
+class EntityUpdateQueue:
+    """
+    Process entity updates in batches on the event loop of HA.
+
+    Updates are keyed by (channel address, parameter) and read the current value
+    of the entity, when they are processed. A new update for a key, that is still
+    queued, is dropped, because the queued update writes the latest value. So
+    intermediate values, that piled up while the event loop was busy, never reach
+    the state machine and the recorder. Updates are put on the event loop and are
+    processed in the order their keys were queued. A batch ends, when the queue
+    is empty or the batch time is used up. The remaining updates are processed
+    in a new batch, after the other callbacks on the event loop got their turn.
+    If the queue is full, updates are processed immediately.
+    Without a batch time, the queue is disabled and updates are processed
+    immediately, when they are put.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        batch_time: float = 0,
+        max_size: int = ENTITY_UPDATE_QUEUE_SIZE,
+    ) -> None:
+        """Init the entity update queue."""
+        self._hass: Final = hass
+        self._batch_time: Final = batch_time
+        self._max_size: Final = max_size
+        self._queue: dict[Hashable, Callable[[], None]] = {}
+        self._scheduled = False
+        self._stats = EntityUpdateQueueStats()
+
+    @property
+    def stats(self) -> EntityUpdateQueueStats:
+        """Return the statistics of the queue."""
+        self._stats.queue_depth = len(self._queue)
+        return self._stats
+
+    @callback
+    def put(self, key: Hashable, update: Callable[[], None]) -> None:
+        """Put an entity update into the queue."""
+        if not self._batch_time:
+            update()
+            return
+        if key in self._queue:
+            self._stats.compacted += 1
+            return
+        if len(self._queue) >= self._max_size:
+            self._stats.overflows += 1
+            update()
+            return
+        self._queue[key] = update
+        if not self._scheduled:
+            self._scheduled = True
+            self._hass.loop.call_soon(self._async_process_batch)
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop the queued updates."""
+        self._queue.clear()
+
+    @callback
+    def _async_process_batch(self) -> None:
+        """Process the queued updates until the batch time is used up."""
+        # Reset first, so that an update put during the batch schedules a new one.
+        self._scheduled = False
+        if (queue_depth := len(self._queue)) == 0:
+            return
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, queue_depth)
+        started_at = monotonic()
+        batch_size = 0
+        try:
+            # Updates queued during the batch are processed in the next batch.
+            for _ in range(queue_depth):
+                if not self._queue:
+                    break
+                update = self._queue.pop(next(iter(self._queue)))
+                batch_size += 1
+                update()
+                if self._batch_time and monotonic() - started_at >= self._batch_time:
+                    break
+        finally:
+            self._stats.updates += batch_size
+            self._stats.batches += 1
+            self._stats.max_batch_size = max(self._stats.max_batch_size, batch_size)
+            # A failing update must not block the remaining updates.
+            if self._queue and not self._scheduled:
+                self._scheduled = True
+                self._hass.loop.call_soon(self._async_process_batch)
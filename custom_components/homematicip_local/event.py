@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
+from time import monotonic
 from typing import Any
 
 from hahomematic.const import (
@@ -17,8 +19,6 @@ from hahomematic.platforms.event import GenericEvent
 
 from homeassistant.components.event import EventDeviceClass, EventEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import UndefinedType
@@ -26,6 +26,12 @@ from homeassistant.helpers.typing import UndefinedType
 from . import HomematicConfigEntry
 from .const import DOMAIN, EVENT_MODEL
 from .control_unit import ControlUnit, signal_new_hm_entity
+from .event_aggregation import (
+    LONG_PRESS_END_PARAMETER,
+    LONG_PRESS_END_PARAMETERS,
+    LONG_PRESS_REPEAT_PARAMETERS,
+)
+from .event_metrics import CALLBACK_EVENT_CHANGED
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,15 +97,24 @@ class HaHomematicEvent(EventEntity):
         self._attr_translation_key = self._hm_primary_entity.event_type.value.replace(".", "_")
 
         self._attr_unique_id = f"{DOMAIN}_{self._hm_channel.unique_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._hm_device.identifier)},
-        )
+        self._attr_device_info = control_unit.async_get_device_info(hm_device=self._hm_device)
         self._attr_extra_state_attributes = {
             EVENT_INTERFACE_ID: self._hm_device.interface_id,
             EVENT_ADDRESS: self._hm_channel.address,
             EVENT_MODEL: self._hm_device.model,
         }
         self._unregister_callbacks: list[CALLBACK_TYPE] = []
+        self._long_press_aggregator = control_unit.create_long_press_aggregator(
+            on_long_press_end=self._async_long_press_ended
+        )
+        parameters = {event.parameter.upper() for event in hm_channel_events}
+        if (
+            self._long_press_aggregator
+            and parameters & LONG_PRESS_REPEAT_PARAMETERS
+            and not parameters & LONG_PRESS_END_PARAMETERS
+        ):
+            # The end of a long press is triggered, although the device has no release event.
+            self._attr_event_types.append(LONG_PRESS_END_PARAMETER.lower())
         _LOGGER.debug(
             "init: Setting up %s %s",
             self._hm_device.name,
@@ -118,7 +133,8 @@ class HaHomematicEvent(EventEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks and load initial data."""
-
+        # Callbacks are only registered, while the entity is added to HA.
+        # HA doesn't add disabled entities and removes entities, that get disabled.
         for event in self._hm_channel_events:
             self._unregister_callbacks.append(
                 event.register_entity_updated_callback(
@@ -132,16 +148,32 @@ class HaHomematicEvent(EventEntity):
     @callback
     def _async_event_changed(self, *args: Any, **kwargs: Any) -> None:
         """Handle device state changes."""
-        # Don't update disabled entities
-        if self.enabled:
-            self._trigger_event(event_type=kwargs["parameter"])
-            _LOGGER.debug("Device event fired %s", self.name)
-            self.async_schedule_update_ha_state()
-        else:
-            _LOGGER.debug(
-                "Device event for %s not fired. Entity is disabled",
-                self.name,
-            )
+        started_at = monotonic()
+        self._async_handle_event_changed(**kwargs)
+        self._cu.async_callback_finished(
+            callback_name=CALLBACK_EVENT_CHANGED,
+            started_at=started_at,
+            device_address=self._hm_device.address,
+            event_type=kwargs.get("parameter"),
+        )
+
+    @callback
+    def _async_handle_event_changed(self, **kwargs: Any) -> None:
+        """Trigger the event."""
+        if self._long_press_aggregator and not self._long_press_aggregator.is_passed(
+            channel_address=self._hm_channel.address, parameter=kwargs["parameter"]
+        ):
+            return
+        self._trigger_event(event_type=kwargs["parameter"])
+        self.async_schedule_update_ha_state()
+
+    @callback
+    def _async_long_press_ended(
+        self, channel_address: str, event_data: Mapping[str, Any] | None
+    ) -> None:
+        """Trigger the release of a long press, that ended without one."""
+        self._trigger_event(event_type=LONG_PRESS_END_PARAMETER.lower())
+        self.async_schedule_update_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when hmip device will be removed from hass."""
@@ -149,18 +181,15 @@ class HaHomematicEvent(EventEntity):
         for unregister in self._unregister_callbacks:
             if unregister is not None:
                 unregister()
+        self._unregister_callbacks.clear()
+        if self._long_press_aggregator:
+            self._long_press_aggregator.async_stop()
 
     @callback
     def _async_device_removed(self, *args: Any, **kwargs: Any) -> None:
         """Handle hm device removal."""
-        self.hass.async_create_task(self.async_remove(force_remove=True))
-
-        if not self.registry_entry:
-            return
-
-        if device_id := self.registry_entry.device_id:
-            # Remove from device registry.
-            device_registry = dr.async_get(self.hass)
-            if device_id in device_registry.devices:
-                # This will also remove associated entities from entity registry.
-                device_registry.async_remove_device(device_id)
+        if self.registry_entry and (device_id := self.registry_entry.device_id):
+            # The removal of the device also removes its entities.
+            self._cu.async_remove_device(device_id=device_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
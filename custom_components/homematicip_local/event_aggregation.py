@@ -0,0 +1,259 @@
+"""Aggregation of device events for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from functools import partial
+from time import monotonic
+from typing import Any, Final
+
+from hahomematic.const import EVENT_ADDRESS, EVENT_INTERFACE_ID, HomematicEventType
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    EVENT_DEVICE_ADDRESSES,
+    EVENT_IDENTIFIER,
+    EVENT_MESSAGE,
+    EVENT_TITLE,
+    EVENT_UNAVAILABLE,
+)
+
+# Event, that summarizes the availability changes of many devices of an interface.
+EVENT_DEVICE_AVAILABILITY_SUMMARY: Final = "homematic.device_availability_summary"
+# Number of devices within the window, above which a summary event is fired.
+DEVICE_AVAILABILITY_THRESHOLD: Final = 10
+# Time in seconds, in which the availability changes of an interface are collected.
+DEVICE_AVAILABILITY_WINDOW: Final = 3.0
+# Click event, that is fired, if a long press ends without a release event.
+LONG_PRESS_END_PARAMETER: Final = "PRESS_LONG_RELEASE"
+# Click events, that end a long press.
+LONG_PRESS_END_PARAMETERS: Final = frozenset({LONG_PRESS_END_PARAMETER})
+# Click events, that are repeated while a button is held.
+LONG_PRESS_REPEAT_PARAMETERS: Final = frozenset({"PRESS_CONT", "PRESS_LONG"})
+# Time in seconds without a repeated click event, after which a long press has ended.
+LONG_PRESS_TIMEOUT: Final = 1.0
+
+
+class DeviceAvailabilityAggregator:
+    """
+    Aggregate the device availability events of an interface.
+
+    The devices are collected per interface and availability for a short window.
+    The events of the first devices up to the threshold are fired immediately.
+    If more devices changed their availability within the window, e.g. because
+    the interface is down, their events are dropped and one summary event is
+    fired at the end of the window instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        threshold: int = DEVICE_AVAILABILITY_THRESHOLD,
+        window: float = DEVICE_AVAILABILITY_WINDOW,
+    ) -> None:
+        """Init the device availability aggregator."""
+        self._hass: Final = hass
+        self._threshold: Final = threshold
+        self._window: Final = window
+        self._device_addresses: dict[tuple[str, bool], set[str]] = {}
+        self._unsub_flush: dict[tuple[str, bool], CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add_event(self, event_data: dict[str, Any]) -> None:
+        """Add a device availability event."""
+        key = (event_data[EVENT_INTERFACE_ID], event_data[EVENT_UNAVAILABLE])
+        if (device_addresses := self._device_addresses.get(key)) is None:
+            device_addresses = self._device_addresses[key] = set()
+            self._unsub_flush[key] = async_call_later(
+                hass=self._hass,
+                delay=self._window,
+                action=partial(self._async_flush, key),
+            )
+        # UN_REACH and STICKY_UN_REACH can both be reported for a device.
+        device_addresses.add(event_data[EVENT_ADDRESS])
+        if len(device_addresses) <= self._threshold:
+            self._hass.bus.async_fire(
+                event_type=HomematicEventType.DEVICE_AVAILABILITY.value,
+                event_data=event_data,
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop the pending events."""
+        for unsub_flush in self._unsub_flush.values():
+            unsub_flush()
+        self._unsub_flush.clear()
+        self._device_addresses.clear()
+
+    @callback
+    def _async_flush(self, key: tuple[str, bool], _now: datetime) -> None:
+        """Fire the summary event of an interface, if the threshold was crossed."""
+        self._unsub_flush.pop(key, None)
+        device_addresses = sorted(self._device_addresses.pop(key, ()))
+        if len(device_addresses) <= self._threshold:
+            return
+
+        interface_id, unavailable = key
+        self._hass.bus.async_fire(
+            event_type=EVENT_DEVICE_AVAILABILITY_SUMMARY,
+            event_data={
+                EVENT_INTERFACE_ID: interface_id,
+                EVENT_DEVICE_ADDRESSES: device_addresses,
+                EVENT_IDENTIFIER: f"{interface_id}_DEVICE_AVAILABILITY",
+                EVENT_TITLE: f"{DOMAIN.upper()} Devices not reachable",
+                EVENT_MESSAGE: f"{len(device_addresses)} devices on interface {interface_id}",
+                EVENT_UNAVAILABLE: unavailable,
+            },
+        )
+
+
+class DeviceErrorDeduplicator:
+    """
+    Drop device error events, that repeat the last value of the error parameter.
+
+    Devices report unchanged error parameters on every status cycle. Only
+    changes of the value are passed. If a re-announce interval is set, an
+    unchanged value is passed again after this interval.
+    """
+
+    def __init__(self, reannounce_interval: float = 0) -> None:
+        """Init the device error deduplicator."""
+        self._reannounce_interval: Final = reannounce_interval
+        self._last_values: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._suppressed = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of dropped device error events."""
+        return self._suppressed
+
+    def is_changed(self, device_address: str, parameter: str, value: Any) -> bool:
+        """Return if the error value is new and register it."""
+        key = (device_address, parameter)
+        now = monotonic()
+        if (last := self._last_values.get(key)) is not None:
+            last_value, announced_at = last
+            if last_value == value and (
+                not self._reannounce_interval or now - announced_at < self._reannounce_interval
+            ):
+                self._suppressed += 1
+                return False
+        self._last_values[key] = (value, now)
+        return True
+
+
+class LongPressAggregator:
+    """
+    Fold the stream of events of a held button.
+
+    The first repeated event of a long press is passed as its start. Further
+    repeated events are only passed, if the repeat interval has elapsed since
+    the last passed event. The release event ends the long press and is always
+    passed. For devices without a release event, a long press ends, if no
+    repeated event was received for the long press timeout, and the end is
+    reported to on_long_press_end with the data of the last repeated event.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_long_press_end: Callable[[str, Mapping[str, Any] | None], None] | None = None,
+        repeat_interval: float = 0,
+        timeout: float = LONG_PRESS_TIMEOUT,
+    ) -> None:
+        """Init the long press aggregator."""
+        self._hass: Final = hass
+        self._on_long_press_end: Final = on_long_press_end
+        self._repeat_interval: Final = repeat_interval
+        self._timeout: Final = timeout
+        # Time of the last received and the last passed event by channel address.
+        self._long_presses: dict[str, tuple[float, float]] = {}
+        # Data of the last received event by channel address.
+        self._event_data: dict[str, Mapping[str, Any] | None] = {}
+        self._unsub_timeout: dict[str, CALLBACK_TYPE] = {}
+        self._suppressed = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of dropped repeated events."""
+        return self._suppressed
+
+    def is_passed(
+        self,
+        channel_address: str,
+        parameter: str,
+        event_data: Mapping[str, Any] | None = None,
+    ) -> bool:
+        """Return if the click event of the channel is passed."""
+        parameter = parameter.upper()
+        if parameter in LONG_PRESS_END_PARAMETERS:
+            self._async_end_long_press(channel_address=channel_address)
+            return True
+        if parameter not in LONG_PRESS_REPEAT_PARAMETERS:
+            return True
+        now = monotonic()
+        # Copied, because the event data is changed, when the event is fired.
+        self._event_data[channel_address] = dict(event_data) if event_data is not None else None
+        long_press = self._long_presses.get(channel_address)
+        if long_press is None or now - long_press[0] > self._timeout:
+            self._long_presses[channel_address] = (now, now)
+            self._async_schedule_timeout(channel_address=channel_address, delay=self._timeout)
+            return True
+        passed_at = long_press[1]
+        if self._repeat_interval and now - passed_at >= self._repeat_interval:
+            self._long_presses[channel_address] = (now, now)
+            return True
+        self._long_presses[channel_address] = (now, passed_at)
+        self._suppressed += 1
+        return False
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop the running long presses."""
+        for unsub_timeout in self._unsub_timeout.values():
+            unsub_timeout()
+        self._unsub_timeout.clear()
+        self._long_presses.clear()
+        self._event_data.clear()
+
+    @callback
+    def _async_schedule_timeout(self, channel_address: str, delay: float) -> None:
+        """Schedule the check for the end of a long press without a release event."""
+        if self._on_long_press_end is None:
+            return
+        if unsub_timeout := self._unsub_timeout.pop(channel_address, None):
+            unsub_timeout()
+        self._unsub_timeout[channel_address] = async_call_later(
+            hass=self._hass,
+            delay=delay,
+            action=partial(self._async_check_timeout, channel_address),
+        )
+
+    @callback
+    def _async_check_timeout(self, channel_address: str, _now: datetime) -> None:
+        """End a long press, that received no repeated event within the timeout."""
+        self._unsub_timeout.pop(channel_address, None)
+        if (long_press := self._long_presses.get(channel_address)) is None:
+            return
+        # The timer is not restarted by every repeated event, but only once it expired.
+        if (elapsed := monotonic() - long_press[0]) < self._timeout:
+            self._async_schedule_timeout(
+                channel_address=channel_address, delay=self._timeout - elapsed
+            )
+            return
+        event_data = self._event_data.get(channel_address)
+        self._async_end_long_press(channel_address=channel_address)
+        if self._on_long_press_end is not None:
+            self._on_long_press_end(channel_address, event_data)
+
+    @callback
+    def _async_end_long_press(self, channel_address: str) -> None:
+        """Forget a long press."""
+        self._long_presses.pop(channel_address, None)
+        self._event_data.pop(channel_address, None)
+        if unsub_timeout := self._unsub_timeout.pop(channel_address, None):
+            unsub_timeout()
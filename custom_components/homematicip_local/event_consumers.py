@@ -0,0 +1,114 @@
+"""Consumers of the click events of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from time import monotonic
+from typing import Final
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+# The consumers are shared by all config entries, because device triggers outlive reloads.
+CLICK_EVENT_CONSUMERS_KEY: HassKey[ClickEventConsumers] = HassKey(
+    f"{DOMAIN}_click_event_consumers"
+)
+# Time in seconds, that the listener counts of the event bus are reused.
+LISTENER_COUNT_CACHE_TIME: Final = 10.0
+
+
+@dataclass
+class ClickEventStats:
+    """Statistics of the click events of a central."""
+
+    delivered: int = 0
+    dropped: int = 0
+
+    @property
+    def dropped_ratio(self) -> float | None:
+        """Return the ratio of dropped to delivered events."""
+        if self.delivered == 0:
+            return None
+        return self.dropped / self.delivered
+
+
+class ClickEventConsumers:
+    """
+    Track the consumers of the click events.
+
+    Click events are fired on the event bus for every channel, although only few
+    channels are used in automations. Device triggers register the channel and
+    parameter they are attached to, so that events of other channels can be
+    dropped before they are processed. Other listeners of an event type, e.g.
+    automations with an event trigger, can't be resolved to a channel. As long as
+    such a listener exists, all events of the event type have a consumer.
+    The listener counts of the event bus are cached for a short time, because
+    the event bus counts the listeners of all event types on every request.
+    Listeners of all events (MATCH_ALL), e.g. the recorder, are no consumers.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Init the click event consumers."""
+        self._hass: Final = hass
+        self._consumers: Counter[tuple[str, str, int, str]] = Counter()
+        self._consumers_by_event_type: Counter[str] = Counter()
+        self._listener_counts: Mapping[str, int] = {}
+        self._listener_counts_at: float | None = None
+
+    @callback
+    def async_add_consumer(
+        self, event_type: str, device_address: str, channel_no: int, parameter: str
+    ) -> CALLBACK_TYPE:
+        """Add a consumer of a click event until the returned callback is called."""
+        key = (event_type, device_address, channel_no, parameter.lower())
+        self._consumers[key] += 1
+        self._consumers_by_event_type[event_type] += 1
+        # The device trigger has added its listener to the event bus.
+        self._listener_counts_at = None
+
+        @callback
+        def remove_consumer() -> None:
+            """Remove the consumer."""
+            self._consumers[key] -= 1
+            if self._consumers[key] <= 0:
+                del self._consumers[key]
+            self._consumers_by_event_type[event_type] -= 1
+            self._listener_counts_at = None
+
+        return remove_consumer
+
+    @callback
+    def has_consumer(
+        self, event_type: str, device_address: str, channel_no: int, parameter: str
+    ) -> bool:
+        """Return if a click event has a consumer."""
+        if (
+            self._get_listener_count(event_type=event_type)
+            > self._consumers_by_event_type[event_type]
+        ):
+            return True
+        return (event_type, device_address, channel_no, parameter.lower()) in self._consumers
+
+    @callback
+    def _get_listener_count(self, event_type: str) -> int:
+        """Return the number of listeners of the event type on the event bus."""
+        now = monotonic()
+        if (
+            self._listener_counts_at is None
+            or now - self._listener_counts_at >= LISTENER_COUNT_CACHE_TIME
+        ):
+            self._listener_counts = self._hass.bus.async_listeners()
+            self._listener_counts_at = now
+        return self._listener_counts.get(event_type, 0)
+
+
+@callback
+def async_get_click_event_consumers(hass: HomeAssistant) -> ClickEventConsumers:
+    """Return the click event consumers."""
+    if (consumers := hass.data.get(CLICK_EVENT_CONSUMERS_KEY)) is None:
+        consumers = hass.data[CLICK_EVENT_CONSUMERS_KEY] = ClickEventConsumers(hass=hass)
+    return consumers
@@ -0,0 +1,153 @@
+"""Event ingestion metrics for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Mapping
+from time import monotonic
+from typing import Final
+
+# Length in seconds of the sliding window used for event rates.
+EVENT_RATE_WINDOW: Final = 60
+# Event type for value updates of entities.
+EVENT_TYPE_ENTITY_UPDATED: Final = "entity_updated"
+# Names of the instrumented callbacks.
+CALLBACK_BACKEND_SYSTEM_EVENT: Final = "backend_system_event"
+CALLBACK_ENTITY_UPDATED: Final = "entity_updated"
+CALLBACK_EVENT_CHANGED: Final = "event_changed"
+CALLBACK_HOMEMATIC_EVENT: Final = "homematic_event"
+# Updates without a recent value (e.g. availability changes) are not counted as lag.
+_MAX_LAG: Final = 300.0
+
+
+class RollingCounter:
+    """Count events in a sliding window of one second buckets."""
+
+    __slots__ = ("_buckets", "_window", "total")
+
+    def __init__(self, window: int = EVENT_RATE_WINDOW) -> None:
+        """Init the rolling counter."""
+        self._window: Final = window
+        self._buckets: deque[list[int]] = deque()
+        self.total = 0
+
+    def increment(self, now: float) -> None:
+        """Count an event."""
+        second = int(now)
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += 1
+        else:
+            self._buckets.append([second, 1])
+            self._prune(second=second)
+        self.total += 1
+
+    def rate(self, now: float) -> float:
+        """Return the events per second within the window."""
+        self._prune(second=int(now))
+        return sum(count for _, count in self._buckets) / self._window
+
+    def _prune(self, second: int) -> None:
+        """Drop buckets, that are outside the window."""
+        while self._buckets and self._buckets[0][0] <= second - self._window:
+            self._buckets.popleft()
+
+
+class EventMetrics:
+    """
+    Collect metrics about the ingestion of events from the backend.
+
+    Events are counted by interface and by event type, when they are received.
+    The lag is the time between the processing of an event by hahomematic and
+    the state write in HA.
+    The callback time is the time spent on the event loop within a callback.
+    """
+
+    def __init__(self) -> None:
+        """Init the event metrics."""
+        self._by_interface: dict[str, RollingCounter] = {}
+        self._by_event_type: dict[str, RollingCounter] = {}
+        self._lag_count = 0
+        self._lag_total = 0.0
+        self.lag_max = 0.0
+        self._callback_time_max: dict[str, float] = {}
+
+    @property
+    def events_total(self) -> int:
+        """Return the number of received events."""
+        return sum(counter.total for counter in self._by_interface.values())
+
+    @property
+    def events_total_by_interface(self) -> Mapping[str, int]:
+        """Return the number of received events by interface."""
+        return {
+            interface_id: counter.total
+            for interface_id, counter in sorted(self._by_interface.items())
+        }
+
+    @property
+    def events_per_second(self) -> float:
+        """Return the events per second of all interfaces."""
+        now = monotonic()
+        return sum(counter.rate(now=now) for counter in self._by_interface.values())
+
+    @property
+    def events_per_second_by_interface(self) -> Mapping[str, float]:
+        """Return the events per second by interface."""
+        now = monotonic()
+        return {
+            interface_id: counter.rate(now=now)
+            for interface_id, counter in sorted(self._by_interface.items())
+        }
+
+    @property
+    def events_per_second_by_event_type(self) -> Mapping[str, float]:
+        """Return the events per second by event type."""
+        now = monotonic()
+        return {
+            event_type: counter.rate(now=now)
+            for event_type, counter in sorted(self._by_event_type.items())
+        }
+
+    @property
+    def events_total_by_event_type(self) -> Mapping[str, int]:
+        """Return the number of received events by event type."""
+        return {
+            event_type: counter.total
+            for event_type, counter in sorted(self._by_event_type.items())
+        }
+
+    @property
+    def lag_avg(self) -> float | None:
+        """Return the average lag between event and state write."""
+        if self._lag_count == 0:
+            return None
+        return self._lag_total / self._lag_count
+
+    @property
+    def callback_time_max(self) -> Mapping[str, float]:
+        """Return the max time spent in a callback by callback name."""
+        return dict(sorted(self._callback_time_max.items()))
+
+    def event_received(self, interface_id: str, event_type: str) -> None:
+        """Count a received event."""
+        now = monotonic()
+        if (interface_counter := self._by_interface.get(interface_id)) is None:
+            interface_counter = RollingCounter()
+            self._by_interface[interface_id] = interface_counter
+        interface_counter.increment(now=now)
+        if (event_type_counter := self._by_event_type.get(event_type)) is None:
+            event_type_counter = RollingCounter()
+            self._by_event_type[event_type] = event_type_counter
+        event_type_counter.increment(now=now)
+
+    def event_processed(self, lag: float) -> None:
+        """Register the lag of a processed event."""
+        if 0 <= lag <= _MAX_LAG:
+            self._lag_count += 1
+            self._lag_total += lag
+            self.lag_max = max(self.lag_max, lag)
+
+    def callback_finished(self, callback_name: str, duration: float) -> None:
+        """Register the time spent in a callback."""
+        if duration > self._callback_time_max.get(callback_name, 0.0):
+            self._callback_time_max[callback_name] = duration
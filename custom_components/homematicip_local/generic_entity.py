@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from functools import partial
 import logging
+from time import monotonic
 from typing import Any, Final, Generic
 
 from hahomematic.const import CALLBACK_TYPE, CallSource
@@ -12,16 +15,17 @@ from hahomematic.platforms.entity import CallbackEntity
 from hahomematic.platforms.generic import GenericEntity
 from hahomematic.platforms.hub import GenericHubEntity, GenericSystemVariable
 
-from homeassistant.core import State, callback
-from homeassistant.helpers import device_registry as dr, entity_registry as er
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE as HA_CALLBACK_TYPE, State, callback
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import UndefinedType
 
-from .const import DOMAIN, HmEntityState, HmEntityType
+from .command_queue import CommandKey, CommandPriority, WriteCoalescer
+from .const import DEFAULT_COMMAND_CONFIRMATION_TIMEOUT, DOMAIN, HmEntityState, HmEntityType
 from .control_unit import ControlUnit
 from .entity_helpers import get_entity_description
+from .event_metrics import CALLBACK_ENTITY_UPDATED, EVENT_TYPE_ENTITY_UPDATED
 from .support import HmGenericEntity, HmGenericSysvarEntity, get_hm_entity
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +37,19 @@ ATTR_MODEL: Final = "model"
 ATTR_NAME: Final = "name"
 ATTR_PARAMETER: Final = "parameter"
 ATTR_VALUE_STATE: Final = "value_state"
+# Attributes of sysvars and programs, that are part of the state of a hub entity.
+HUB_ENTITY_CONTENT_ATTRIBUTES: Final = (
+    "available",
+    "value",
+    "data_type",
+    "unit",
+    "min",
+    "max",
+    "values",
+    "is_active",
+    "is_internal",
+    "last_execute_time",
+)
 
 
 class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
@@ -70,21 +87,23 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
             if isinstance(hm_entity, GenericEntity):
                 self._attr_translation_key = hm_entity.parameter.lower()
 
-        hm_device = hm_entity.device
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, hm_device.identifier)},
-            manufacturer=hm_device.manufacturer,
-            model=hm_device.model,
-            name=hm_device.name,
-            serial_number=hm_device.address,
-            sw_version=hm_device.firmware,
-            suggested_area=hm_device.room,
-            # Link to the homematic control unit.
-            via_device=(DOMAIN, hm_device.central.name),
-        )
+        self._attr_device_info = control_unit.async_get_device_info(hm_device=hm_entity.device)
 
         self._static_state_attributes = self._get_static_state_attributes()
         self._unregister_callbacks: list[CALLBACK_TYPE] = []
+        self._write_coalescers: dict[CommandKey, WriteCoalescer] = {}
+        self._optimistic_values: dict[str, Any] = {}
+        # Command key of the optimistic values, that confirms them.
+        self._optimistic_keys: dict[str, CommandKey | None] = {}
+        self._command_unconfirmed = False
+        self._unsub_optimistic_timeout: HA_CALLBACK_TYPE | None = None
+        # Send time of the commands, that wait for the confirmation by the CCU.
+        self._unconfirmed_commands: dict[CommandKey, datetime] = {}
+        # Key of the updates of the entity in the entity update queue.
+        self._update_key: tuple[str, str] = (
+            hm_entity.channel.address,
+            hm_entity.parameter if isinstance(hm_entity, GenericEntity) else hm_entity.unique_id,
+        )
 
         _LOGGER.debug("init: Setting up %s", hm_entity.full_name)
         if (
@@ -138,8 +157,17 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
                 )
             else:
                 attributes[ATTR_VALUE_STATE] = HmEntityState.NOT_VALID
+            if self.is_pending:
+                attributes[ATTR_VALUE_STATE] = HmEntityState.PENDING
+            elif self._command_unconfirmed:
+                attributes[ATTR_VALUE_STATE] = HmEntityState.UNCONFIRMED
         return attributes
 
+    @property
+    def is_pending(self) -> bool:
+        """Return if an optimistic value is waiting for the confirmation by the CCU."""
+        return len(self._optimistic_values) > 0
+
     @property
     def hm_entity(self) -> HmGenericEntity:
         """Return the homematic entity."""
@@ -210,6 +238,8 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks and load initial data."""
+        # Callbacks are only registered, while the entity is added to HA.
+        # HA doesn't add disabled entities and removes entities, that get disabled.
         if isinstance(self._hm_entity, CallbackEntity):
             self._unregister_callbacks.append(
                 self._hm_entity.register_entity_updated_callback(
@@ -219,7 +249,26 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
             self._unregister_callbacks.append(
                 self._hm_entity.register_device_removed_callback(cb=self._async_device_removed)
             )
+        if isinstance(self, RestoreEntity):
+            self.async_on_remove(self._cu.value_snapshot.async_track_entity(entity=self))
+            # Entities with a state in the value snapshot are seeded from the snapshot
+            # and are reconciled with the backend in the background.
+            if self._cu.value_snapshot.has_state(unique_id=self.unique_id):
+                self.hass.async_create_background_task(
+                    self._async_reconcile_entity_value(),
+                    name=f"{DOMAIN}-reconcile-{self.entity_id}",
+                )
+                return
         # Init value of entity.
+        await self._async_init_entity_value()
+
+    async def _async_reconcile_entity_value(self) -> None:
+        """Replace the state from the value snapshot by the value of the backend."""
+        await self._async_init_entity_value()
+        self.async_write_ha_state()
+
+    async def _async_init_entity_value(self) -> None:
+        """Load the initial value of the entity from the backend."""
         if isinstance(self._hm_entity, GenericEntity | CustomEntity):
             await self._hm_entity.load_entity_value(call_source=CallSource.HA_INIT)
         if (
@@ -235,21 +284,203 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
     @callback
     def _async_entity_updated(self, *args: Any, **kwargs: Any) -> None:
         """Handle device state changes."""
-        # Don't update disabled entities
-        update_type = (
-            "updated"
-            if self._hm_entity.refreshed_at == self._hm_entity.modified_at
-            else "refreshed"
+        # Counted on receipt, because the entity update queue drops superseded updates.
+        self._cu.event_metrics.event_received(
+            interface_id=self._hm_entity.device.interface_id,
+            event_type=EVENT_TYPE_ENTITY_UPDATED,
         )
-        if self.enabled:
-            _LOGGER.debug("Device %s event fired for %s", update_type, self._hm_entity.full_name)
-            self.async_schedule_update_ha_state()
-        else:
-            _LOGGER.debug(
-                "Device %s event for %s not fired. Entity is disabled",
-                update_type,
-                self._hm_entity.full_name,
+        self._cu.entity_update_queue.put(
+            key=self._update_key, update=self._async_process_entity_update
+        )
+
+    @callback
+    def _async_process_entity_update(self) -> None:
+        """Process a device state change."""
+        started_at = monotonic()
+        self._async_handle_entity_update()
+        self._cu.event_metrics.event_processed(
+            lag=(datetime.now() - self._hm_entity.refreshed_at).total_seconds()
+        )
+        self._cu.async_callback_finished(
+            callback_name=CALLBACK_ENTITY_UPDATED,
+            started_at=started_at,
+            device_address=self._hm_entity.device.address,
+            event_type=EVENT_TYPE_ENTITY_UPDATED,
+        )
+
+    @callback
+    def _async_handle_entity_update(self) -> None:
+        """Write the updated state of the entity."""
+        confirmed_keys = self._async_pop_confirmed_commands()
+        for key in confirmed_keys:
+            self._cu.command_latency.command_confirmed(key=key)
+        # The CCU reported the entity again after a command was not confirmed.
+        self._command_unconfirmed = False
+        self._async_confirm_optimistic_values(keys=confirmed_keys)
+        self.async_schedule_update_ha_state()
+
+    @callback
+    def _async_pop_confirmed_commands(self) -> tuple[CommandKey, ...]:
+        """
+        Remove and return the commands, that are confirmed by the CCU.
+
+        A command is confirmed, when its (channel, parameter) was reported
+        after the command was sent. Updates of other parameters of the entity
+        don't confirm the command. Commands without a confirmation within the
+        timeout are dropped.
+        """
+        if not self._unconfirmed_commands:
+            return ()
+        now = datetime.now()
+        for key, sent_at in tuple(self._unconfirmed_commands.items()):
+            if (now - sent_at).total_seconds() > DEFAULT_COMMAND_CONFIRMATION_TIMEOUT:
+                del self._unconfirmed_commands[key]
+        confirmed_keys = tuple(
+            key
+            for hm_entity in self._hm_entity.device.generic_entities
+            if (key := (hm_entity.channel.address, hm_entity.parameter))
+            in self._unconfirmed_commands
+            and hm_entity.refreshed_at >= self._unconfirmed_commands[key]
+        )
+        for key in confirmed_keys:
+            del self._unconfirmed_commands[key]
+        return confirmed_keys
+
+    async def _async_send_command(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        parameter: str | None = None,
+        priority: CommandPriority = CommandPriority.NORMAL,
+        coalesce: bool = False,
+        optimistic_values: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """
+        Send a command through the command queue of the interface.
+
+        Coalesced commands (e.g. from sliders) are sent on the leading and trailing
+        edge of a series of writes to the same parameter.
+        If optimistic updates are enabled, the optimistic values are shown until
+        the CCU confirms the command, or rolled back if the command fails.
+        """
+        key: CommandKey | None = None
+        if parameter is not None:
+            key = (self._hm_entity.channel.address, parameter)
+            send = partial(self._async_send_unconfirmed_command, send=send, key=key)
+        if optimistic_values and self._cu.config.optimistic_updates:
+            self._async_set_optimistic_values(values=optimistic_values, key=key)
+        try:
+            return await self._async_send_queued_command(
+                send=send, key=key, priority=priority, coalesce=coalesce
             )
+        except Exception:
+            if key is not None:
+                self._cu.command_latency.command_failed(key=key)
+                self._unconfirmed_commands.pop(key, None)
+            self._async_clear_optimistic_values(write_state=True)
+            raise
+
+    async def _async_send_unconfirmed_command(
+        self, send: Callable[[], Awaitable[Any]], key: CommandKey
+    ) -> Any:
+        """Send a command, that waits for the confirmation by the CCU."""
+        # Stamped when the command leaves the command queue and the write coalescer,
+        # so that a report of the previous value doesn't confirm the command, and
+        # writes dropped by the write coalescer are not counted as sent.
+        self._cu.command_latency.command_sent(
+            device_address=self._hm_entity.device.address, key=key
+        )
+        self._unconfirmed_commands[key] = datetime.now()
+        return await send()
+
+    async def _async_send_queued_command(
+        self,
+        send: Callable[[], Awaitable[Any]],
+        key: CommandKey | None,
+        priority: CommandPriority,
+        coalesce: bool,
+    ) -> Any:
+        """Send a command through the command queue and the write coalescer."""
+        queued_send = partial(
+            self._cu.async_send_command,
+            interface_id=self._hm_entity.device.interface_id,
+            send=send,
+            key=key,
+            priority=priority,
+        )
+        if key is None or self._cu.config.write_coalesce_delay <= 0:
+            return await queued_send()
+        if coalesce:
+            if (write_coalescer := self._write_coalescers.get(key)) is None:
+                write_coalescer = WriteCoalescer(
+                    hass=self.hass, delay=self._cu.config.write_coalesce_delay / 1000
+                )
+                self._write_coalescers[key] = write_coalescer
+            return await write_coalescer.async_write(send=queued_send)
+        if write_coalescer := self._write_coalescers.get(key):
+            # A regular write supersedes a pending coalesced write of the same parameter.
+            write_coalescer.cancel()
+        return await queued_send()
+
+    @callback
+    def _async_set_optimistic_values(
+        self, values: Mapping[str, Any], key: CommandKey | None
+    ) -> None:
+        """Show the commanded values until they are confirmed by the CCU."""
+        self._optimistic_values.update(values)
+        self._optimistic_keys.update(dict.fromkeys(values, key))
+        if self._unsub_optimistic_timeout is not None:
+            self._unsub_optimistic_timeout()
+        self._unsub_optimistic_timeout = async_call_later(
+            hass=self.hass,
+            delay=DEFAULT_COMMAND_CONFIRMATION_TIMEOUT,
+            action=self._async_optimistic_update_timed_out,
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_clear_optimistic_values(self, write_state: bool = False) -> None:
+        """Drop the optimistic values."""
+        if self._unsub_optimistic_timeout is not None:
+            self._unsub_optimistic_timeout()
+            self._unsub_optimistic_timeout = None
+        if not self._optimistic_values:
+            return
+        self._optimistic_values.clear()
+        self._optimistic_keys.clear()
+        if write_state and self.hass is not None and self.enabled:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_confirm_optimistic_values(self, keys: tuple[CommandKey, ...]) -> None:
+        """Drop the optimistic values, that are confirmed by the given commands."""
+        for attribute, key in tuple(self._optimistic_keys.items()):
+            # Optimistic values without a command key are replaced by every update.
+            if key is None or key in keys:
+                del self._optimistic_keys[attribute]
+                del self._optimistic_values[attribute]
+        if not self._optimistic_values:
+            self._async_clear_optimistic_values()
+
+    @callback
+    def _async_optimistic_update_timed_out(self, *args: Any) -> None:
+        """
+        Roll back the optimistic values, if the CCU did not confirm the command.
+
+        The value_state of the entity is unconfirmed, until the CCU reports
+        the entity again.
+        """
+        self._unsub_optimistic_timeout = None
+        for key in self._optimistic_keys.values():
+            if key is not None:
+                self._unconfirmed_commands.pop(key, None)
+        _LOGGER.warning(
+            "Command for %s was not confirmed by the CCU within %ss. "
+            "Rolling back to the last known state",
+            self._hm_entity.full_name,
+            DEFAULT_COMMAND_CONFIRMATION_TIMEOUT,
+        )
+        self._command_unconfirmed = True
+        self._async_clear_optimistic_values(write_state=True)
 
     async def async_update(self) -> None:
         """Update entities."""
@@ -262,21 +493,19 @@ class HaHomematicGenericEntity(Generic[HmGenericEntity], Entity):
         for unregister in self._unregister_callbacks:
             if unregister is not None:
                 unregister()
+        self._unregister_callbacks.clear()
+        for write_coalescer in self._write_coalescers.values():
+            write_coalescer.cancel()
+        self._async_clear_optimistic_values()
 
     @callback
     def _async_device_removed(self, *args: Any, **kwargs: Any) -> None:
         """Handle hm device removal."""
-        self.hass.async_create_task(self.async_remove(force_remove=True))
-
-        if not self.registry_entry:
-            return
-
-        if device_id := self.registry_entry.device_id:
-            # Remove from device registry.
-            device_registry = dr.async_get(self.hass)
-            if device_id in device_registry.devices:
-                # This will also remove associated entities from entity registry.
-                device_registry.async_remove_device(device_id)
+        if self.registry_entry and (device_id := self.registry_entry.device_id):
+            # The removal of the device also removes its entities.
+            self._cu.async_remove_device(device_id=device_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
 
 
 class HaHomematicGenericRestoreEntity(HaHomematicGenericEntity[HmGenericEntity], RestoreEntity):
@@ -288,7 +517,7 @@ class HaHomematicGenericRestoreEntity(HaHomematicGenericEntity[HmGenericEntity],
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the generic entity."""
         attributes = super().extra_state_attributes
-        if self.is_restored:
+        if self.is_restored and not self.is_pending:
             attributes[ATTR_VALUE_STATE] = HmEntityState.RESTORED
         return attributes
 
@@ -303,9 +532,12 @@ class HaHomematicGenericRestoreEntity(HaHomematicGenericEntity[HmGenericEntity],
 
     async def async_added_to_hass(self) -> None:
         """Check, if state needs to be restored."""
+        self._restored_state = self._cu.value_snapshot.get_state(
+            unique_id=self.unique_id, entity_id=self.entity_id
+        )
         await super().async_added_to_hass()
-        # if not self._hm_entity.is_valid:
-        self._restored_state = await self.async_get_last_state()
+        if self._restored_state is None:
+            self._restored_state = await self.async_get_last_state()
 
 
 class HaHomematicGenericHubEntity(Entity):
@@ -331,6 +563,7 @@ class HaHomematicGenericHubEntity(Entity):
         self._attr_name = hm_hub_entity.name
         self._attr_device_info = control_unit.device_info
         self._unregister_callbacks: list[CALLBACK_TYPE] = []
+        self._hub_entity_content: tuple[Any, ...] = self._get_hub_entity_content()
         _LOGGER.debug("init sysvar: Setting up %s", self.name)
 
     @property
@@ -340,6 +573,8 @@ class HaHomematicGenericHubEntity(Entity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks and load initial data."""
+        # Callbacks are only registered, while the entity is added to HA.
+        # HA doesn't add disabled entities and removes entities, that get disabled.
         if isinstance(self._hm_hub_entity, CallbackEntity):
             self._unregister_callbacks.append(
                 self._hm_hub_entity.register_entity_updated_callback(
@@ -359,32 +594,32 @@ class HaHomematicGenericHubEntity(Entity):
         for unregister in self._unregister_callbacks:
             if unregister is not None:
                 unregister()
+        self._unregister_callbacks.clear()
+
+    def _get_hub_entity_content(self) -> tuple[Any, ...]:
+        """Return the content of the sysvar or program, that defines the state."""
+        return tuple(
+            getattr(self._hm_hub_entity, attribute, None)
+            for attribute in HUB_ENTITY_CONTENT_ATTRIBUTES
+        )
 
     @callback
     def _async_hub_entity_updated(self, *args: Any, **kwargs: Any) -> None:
         """Handle sysvar entity state changes."""
-        # Don't update disabled entities
-        if self.enabled:
-            _LOGGER.debug("Sysvar changed event fired for %s", self.name)
-            self.async_schedule_update_ha_state()
-        else:
-            _LOGGER.debug(
-                "Sysvar changed event for %s not fired. Sysvar entity is disabled",
-                self.name,
-            )
+        # The hub refresh updates all sysvars and programs. Only changes are written.
+        if (content := self._get_hub_entity_content()) == self._hub_entity_content:
+            return
+        self._hub_entity_content = content
+        self.async_schedule_update_ha_state()
 
     @callback
     def _async_hub_device_removed(self, *args: Any, **kwargs: Any) -> None:
         """Handle hm sysvar entity removal."""
-        self.hass.async_create_task(self.async_remove(force_remove=True))
-
-        if not self.registry_entry:
-            return
-
-        if entity_id := self.registry_entry.entity_id:
-            entity_registry = er.async_get(self.hass)
-            if entity_id in entity_registry.entities:
-                entity_registry.async_remove(entity_id)
+        if self.registry_entry:
+            # The removal of the registry entry also removes the entity.
+            self._cu.async_remove_entity(entity_id=self.registry_entry.entity_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
 
 
 class HaHomematicGenericSysvarEntity(Generic[HmGenericSysvarEntity], HaHomematicGenericHubEntity):
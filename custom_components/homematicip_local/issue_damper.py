@@ -0,0 +1,141 @@
+"""Flap damping of repair issues for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+import logging
+from typing import Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time in seconds, that a condition must persist, before its issue is created.
+ISSUE_CREATE_DELAY: Final = 30.0
+# Time in seconds, that a condition must be clear, before its issue is deleted.
+ISSUE_DELETE_DELAY: Final = 60.0
+
+
+@dataclass
+class IssueStats:
+    """Statistics of the repair issues of an interface."""
+
+    created: int = 0
+    deleted: int = 0
+    suppressed: int = 0
+
+
+class IssueDamper:
+    """
+    Create and delete repair issues with hysteresis.
+
+    An issue is only created, if its condition persists for the create delay,
+    and only deleted, if its condition has been clear for the delete delay.
+    A flapping condition therefore causes at most one write to the issue
+    registry per delay instead of one per event. If a condition returns, while
+    the deletion of its issue is pending, the issue is updated with its data.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        create_delay: float = ISSUE_CREATE_DELAY,
+        delete_delay: float = ISSUE_DELETE_DELAY,
+    ) -> None:
+        """Init the issue damper."""
+        self._hass: Final = hass
+        self._create_delay: Final = create_delay
+        self._delete_delay: Final = delete_delay
+        self._issue_data: dict[str, dict[str, Any]] = {}
+        self._unsub_pending_create: dict[str, CALLBACK_TYPE] = {}
+        self._unsub_pending_delete: dict[str, CALLBACK_TYPE] = {}
+        self._stats: dict[str, IssueStats] = {}
+
+    @property
+    def stats(self) -> Mapping[str, IssueStats]:
+        """Return the statistics of the repair issues by interface_id."""
+        return dict(sorted(self._stats.items()))
+
+    @callback
+    def async_set_issue(self, interface_id: str, issue_id: str, **issue_data: Any) -> None:
+        """Report the condition of an issue, that is passed to async_create_issue."""
+        if unsub_delete := self._unsub_pending_delete.pop(issue_id, None):
+            unsub_delete()
+            self._get_stats(interface_id=interface_id).suppressed += 1
+            # The issue still exists, but its data may have changed.
+            ir.async_create_issue(hass=self._hass, domain=DOMAIN, issue_id=issue_id, **issue_data)
+            return
+        self._issue_data[issue_id] = issue_data
+        if issue_id in self._unsub_pending_create or self._issue_exists(issue_id=issue_id):
+            return
+        self._unsub_pending_create[issue_id] = async_call_later(
+            hass=self._hass,
+            delay=self._create_delay,
+            action=partial(self._async_create_issue, interface_id, issue_id),
+        )
+
+    @callback
+    def async_clear_issue(self, interface_id: str, issue_id: str) -> None:
+        """Report that the condition of an issue is clear."""
+        if unsub_create := self._unsub_pending_create.pop(issue_id, None):
+            unsub_create()
+            self._get_stats(interface_id=interface_id).suppressed += 1
+            return
+        if issue_id in self._unsub_pending_delete or not self._issue_exists(issue_id=issue_id):
+            return
+        self._unsub_pending_delete[issue_id] = async_call_later(
+            hass=self._hass,
+            delay=self._delete_delay,
+            action=partial(self._async_delete_issue, interface_id, issue_id),
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending issue changes."""
+        for unsub in (
+            *self._unsub_pending_create.values(),
+            *self._unsub_pending_delete.values(),
+        ):
+            unsub()
+        self._unsub_pending_create.clear()
+        self._unsub_pending_delete.clear()
+
+    @callback
+    def _async_create_issue(self, interface_id: str, issue_id: str, _now: datetime) -> None:
+        """Create an issue, whose condition persisted."""
+        del self._unsub_pending_create[issue_id]
+        _LOGGER.debug("Creating issue %s", issue_id)
+        ir.async_create_issue(
+            hass=self._hass,
+            domain=DOMAIN,
+            issue_id=issue_id,
+            **self._issue_data.pop(issue_id),
+        )
+        self._get_stats(interface_id=interface_id).created += 1
+
+    @callback
+    def _async_delete_issue(self, interface_id: str, issue_id: str, _now: datetime) -> None:
+        """Delete an issue, whose condition stayed clear."""
+        del self._unsub_pending_delete[issue_id]
+        _LOGGER.debug("Deleting issue %s", issue_id)
+        ir.async_delete_issue(hass=self._hass, domain=DOMAIN, issue_id=issue_id)
+        self._issue_data.pop(issue_id, None)
+        self._get_stats(interface_id=interface_id).deleted += 1
+
+    def _get_stats(self, interface_id: str) -> IssueStats:
+        """Return the statistics of an interface."""
+        if (stats := self._stats.get(interface_id)) is None:
+            stats = self._stats[interface_id] = IssueStats()
+        return stats
+
+    def _issue_exists(self, issue_id: str) -> bool:
+        """Return if the issue is in the issue registry."""
+        issue_registry = ir.async_get(self._hass)
+        return issue_registry.async_get_issue(domain=DOMAIN, issue_id=issue_id) is not None
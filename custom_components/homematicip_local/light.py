@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any, Final
 
-from hahomematic.const import HmPlatform
+from hahomematic.const import HmPlatform, Parameter
 from hahomematic.platforms.custom import CeDimmer, CeIpFixedColorLight, LightOffArgs, LightOnArgs
 import voluptuous as vol
 
@@ -58,7 +59,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -144,6 +145,8 @@ class HaHomematicLight(HaHomematicGenericRestoreEntity[CeDimmer], LightEntity):
     @property
     def is_on(self) -> bool | None:
         """Return true if dimmer is on."""
+        if "is_on" in self._optimistic_values:
+            return self._optimistic_values["is_on"]
         if self._hm_entity.is_valid:
             return self._hm_entity.is_on is True
         if (
@@ -161,6 +164,8 @@ class HaHomematicLight(HaHomematicGenericRestoreEntity[CeDimmer], LightEntity):
     @property
     def brightness(self) -> int | None:
         """Return the brightness of this light between 0..255."""
+        if "brightness" in self._optimistic_values:
+            return self._optimistic_values["brightness"]
         if self._hm_entity.is_valid:
             return self._hm_entity.brightness
         if self.is_restored and self._restored_state:
@@ -213,7 +218,12 @@ class HaHomematicLight(HaHomematicGenericRestoreEntity[CeDimmer], LightEntity):
         if effect := kwargs.get(ATTR_EFFECT):
             hm_kwargs["effect"] = effect
 
-        await self._hm_entity.turn_on(**hm_kwargs)
+        await self._async_send_command(
+            send=partial(self._hm_entity.turn_on, **hm_kwargs),
+            parameter=Parameter.LEVEL,
+            coalesce=ATTR_BRIGHTNESS in kwargs,
+            optimistic_values={"is_on": True, "brightness": brightness},
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
@@ -221,7 +231,11 @@ class HaHomematicLight(HaHomematicGenericRestoreEntity[CeDimmer], LightEntity):
         # Use transition from kwargs, if not applicable use 0.
         if ramp_time := kwargs.get(ATTR_TRANSITION, 0):
             hm_kwargs["ramp_time"] = ramp_time
-        await self._hm_entity.turn_off(**hm_kwargs)
+        await self._async_send_command(
+            send=partial(self._hm_entity.turn_off, **hm_kwargs),
+            parameter=Parameter.LEVEL,
+            optimistic_values={"is_on": False},
+        )
 
     @callback
     def async_set_on_time(self, on_time: float) -> None:
@@ -0,0 +1,342 @@
+"""Prometheus metrics endpoint for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Final
+
+from aiohttp import web
+from hahomematic.const import HmPlatform
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .command_latency import LATENCY_BUCKET_INF, LATENCY_BUCKETS
+from .const import DOMAIN
+from .control_unit import ControlUnit
+from .services import async_get_loaded_config_entries
+from .support import get_entities_by_platform_stats
+
+METRICS_URL: Final = f"/api/{DOMAIN}/metrics"
+METRICS_VIEW_KEY: HassKey[bool] = HassKey(f"{DOMAIN}_metrics_view")
+CONTENT_TYPE_PROMETHEUS: Final = "text/plain; version=0.0.4; charset=utf-8"
+
+LABEL_CALLBACK: Final = "callback"
+LABEL_CACHE: Final = "cache"
+LABEL_DEVICE_ADDRESS: Final = "device_address"
+LABEL_EVENT_TYPE: Final = "event_type"
+LABEL_INSTANCE: Final = "instance"
+LABEL_INTERFACE_ID: Final = "interface_id"
+LABEL_JOB: Final = "job"
+LABEL_LE: Final = "le"
+LABEL_PLATFORM: Final = "platform"
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once for all config entries."""
+    if hass.data.get(METRICS_VIEW_KEY):
+        return
+    hass.http.register_view(HmMetricsView())
+    hass.data[METRICS_VIEW_KEY] = True
+
+
+class HmMetricsView(HomeAssistantView):
+    """Serve the metrics of all loaded Homematic(IP) Local instances in Prometheus text format."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Init the metrics view."""
+        # Entity counts by entry_id. Recalculated only if the entities of the central changed.
+        self._entity_stats: dict[str, tuple[int, Mapping[HmPlatform, int]]] = {}
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics."""
+        hass = request.app[KEY_HASS]
+        metrics = MetricFamilies()
+        for entry in async_get_loaded_config_entries(hass=hass):
+            control_unit: ControlUnit = entry.runtime_data
+            self._add_control_unit_metrics(
+                metrics=metrics, entry_id=entry.entry_id, control_unit=control_unit
+            )
+        return web.Response(
+            body=metrics.render(), headers={"Content-Type": CONTENT_TYPE_PROMETHEUS}
+        )
+
+    def _get_entities_by_platform(
+        self, entry_id: str, control_unit: ControlUnit
+    ) -> Mapping[HmPlatform, int]:
+        """Return the entity counts by platform."""
+        entities_version = control_unit.entities_version
+        if (entity_stats := self._entity_stats.get(entry_id)) is not None:
+            version, entities_by_platform = entity_stats
+            if version == entities_version:
+                return entities_by_platform
+        entities_by_platform = get_entities_by_platform_stats(central=control_unit.central)
+        self._entity_stats[entry_id] = (entities_version, entities_by_platform)
+        return entities_by_platform
+
+    def _add_control_unit_metrics(
+        self, metrics: MetricFamilies, entry_id: str, control_unit: ControlUnit
+    ) -> None:
+        """Add the metrics of a control unit."""
+        instance = {LABEL_INSTANCE: control_unit.central.name}
+
+        for platform, count in self._get_entities_by_platform(
+            entry_id=entry_id, control_unit=control_unit
+        ).items():
+            metrics.add(
+                name="entities",
+                metric_type="gauge",
+                help_text="Number of entities by platform.",
+                labels=instance | {LABEL_PLATFORM: platform.value},
+                value=count,
+            )
+
+        for interface_id, available in control_unit.interface_available.items():
+            metrics.add(
+                name="interface_available",
+                metric_type="gauge",
+                help_text="Availability of the interface.",
+                labels=instance | {LABEL_INTERFACE_ID: interface_id},
+                value=int(available),
+            )
+        for interface_id, alive in control_unit.interface_callback_alive.items():
+            metrics.add(
+                name="interface_callback_alive",
+                metric_type="gauge",
+                help_text="Whether the interface sends events to the callback server.",
+                labels=instance | {LABEL_INTERFACE_ID: interface_id},
+                value=int(alive),
+            )
+
+        event_metrics = control_unit.event_metrics
+        for interface_id, total in event_metrics.events_total_by_interface.items():
+            metrics.add(
+                name="events_total",
+                metric_type="counter",
+                help_text="Number of received events by interface.",
+                labels=instance | {LABEL_INTERFACE_ID: interface_id},
+                value=total,
+            )
+        for interface_id, rate in event_metrics.events_per_second_by_interface.items():
+            metrics.add(
+                name="events_per_second",
+                metric_type="gauge",
+                help_text="Received events per second by interface within the last minute.",
+                labels=instance | {LABEL_INTERFACE_ID: interface_id},
+                value=rate,
+            )
+        for event_type, total in event_metrics.events_total_by_event_type.items():
+            metrics.add(
+                name="events_by_type_total",
+                metric_type="counter",
+                help_text="Number of received events by event type.",
+                labels=instance | {LABEL_EVENT_TYPE: event_type},
+                value=total,
+            )
+        metrics.add(
+            name="event_lag_max_seconds",
+            metric_type="gauge",
+            help_text="Max lag between the value update and the state write.",
+            labels=instance,
+            value=event_metrics.lag_max,
+        )
+        for callback_name, duration in event_metrics.callback_time_max.items():
+            metrics.add(
+                name="callback_time_max_seconds",
+                metric_type="gauge",
+                help_text="Max time spent on the event loop within a callback.",
+                labels=instance | {LABEL_CALLBACK: callback_name},
+                value=duration,
+            )
+
+        latency_help = "Round-trip latency of commands from the call to the confirming event."
+        latency_buckets = (*(str(bucket) for bucket in LATENCY_BUCKETS), LATENCY_BUCKET_INF)
+        for device_address, latency in control_unit.command_latency.metrics.items():
+            device = instance | {LABEL_DEVICE_ADDRESS: device_address}
+            cumulative_count = 0
+            for latency_bucket in latency_buckets:
+                cumulative_count += latency.latency_buckets[latency_bucket]
+                metrics.add(
+                    name="command_latency_seconds",
+                    metric_type="histogram",
+                    help_text=latency_help,
+                    labels=device | {LABEL_LE: latency_bucket},
+                    value=cumulative_count,
+                    suffix="_bucket",
+                )
+            metrics.add(
+                name="command_latency_seconds",
+                metric_type="histogram",
+                help_text=latency_help,
+                labels=device,
+                value=latency.latency_total,
+                suffix="_sum",
+            )
+            metrics.add(
+                name="command_latency_seconds",
+                metric_type="histogram",
+                help_text=latency_help,
+                labels=device,
+                value=latency.commands_confirmed,
+                suffix="_count",
+            )
+            metrics.add(
+                name="command_timeouts_total",
+                metric_type="counter",
+                help_text="Number of commands without a confirming event.",
+                labels=device,
+                value=latency.commands_timed_out,
+            )
+
+        for interface_id, command_queue in control_unit.command_queues.items():
+            interface = instance | {LABEL_INTERFACE_ID: interface_id}
+            queue_metrics = command_queue.metrics
+            metrics.add(
+                name="command_queue_depth",
+                metric_type="gauge",
+                help_text="Number of queued commands.",
+                labels=interface,
+                value=queue_metrics.queue_depth,
+            )
+            metrics.add(
+                name="command_queue_sent_total",
+                metric_type="counter",
+                help_text="Number of sent commands.",
+                labels=interface,
+                value=queue_metrics.commands_sent,
+            )
+            metrics.add(
+                name="command_queue_merged_total",
+                metric_type="counter",
+                help_text="Number of commands replaced by a later command.",
+                labels=interface,
+                value=queue_metrics.commands_merged,
+            )
+            metrics.add(
+                name="command_queue_failed_total",
+                metric_type="counter",
+                help_text="Number of failed commands.",
+                labels=interface,
+                value=queue_metrics.commands_failed,
+            )
+
+        entity_update_queue_stats = control_unit.entity_update_queue.stats
+        metrics.add(
+            name="entity_update_queue_depth",
+            metric_type="gauge",
+            help_text="Number of queued entity updates.",
+            labels=instance,
+            value=entity_update_queue_stats.queue_depth,
+        )
+        metrics.add(
+            name="entity_update_queue_compacted_total",
+            metric_type="counter",
+            help_text="Number of entity updates superseded by a queued update.",
+            labels=instance,
+            value=entity_update_queue_stats.compacted,
+        )
+
+        fetch_help = "Duration of the scheduled fetch jobs."
+        for job, fetch_stats in control_unit.scheduler_fetch_stats.items():
+            fetch_job = instance | {LABEL_JOB: job}
+            metrics.add(
+                name="scheduler_fetch_duration_seconds",
+                metric_type="summary",
+                help_text=fetch_help,
+                labels=fetch_job,
+                value=fetch_stats.duration_total,
+                suffix="_sum",
+            )
+            metrics.add(
+                name="scheduler_fetch_duration_seconds",
+                metric_type="summary",
+                help_text=fetch_help,
+                labels=fetch_job,
+                value=fetch_stats.count,
+                suffix="_count",
+            )
+            metrics.add(
+                name="scheduler_fetch_failures_total",
+                metric_type="counter",
+                help_text="Number of failed scheduled fetch jobs.",
+                labels=fetch_job,
+                value=fetch_stats.failures,
+            )
+
+        for cache_name, cache_stats in control_unit.cache_stats.items():
+            cache = instance | {LABEL_CACHE: cache_name}
+            metrics.add(
+                name="cache_hits_total",
+                metric_type="counter",
+                help_text="Number of cache hits.",
+                labels=cache,
+                value=cache_stats.hits,
+            )
+            metrics.add(
+                name="cache_misses_total",
+                metric_type="counter",
+                help_text="Number of cache misses.",
+                labels=cache,
+                value=cache_stats.misses,
+            )
+
+
+class MetricFamilies:
+    """Collect metric samples grouped by metric family."""
+
+    def __init__(self) -> None:
+        """Init the metric families."""
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def add(
+        self,
+        name: str,
+        metric_type: str,
+        help_text: str,
+        labels: Mapping[str, str],
+        value: float,
+        suffix: str = "",
+    ) -> None:
+        """Add a sample to a metric family."""
+        family_name = f"{DOMAIN}_{name}"
+        if (family := self._families.get(family_name)) is None:
+            family = (metric_type, help_text, [])
+            self._families[family_name] = family
+        family[2].append(f"{family_name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+    def render(self) -> str:
+        """Return the metrics in Prometheus text format."""
+        lines: list[str] = []
+        for family_name, (metric_type, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {family_name} {help_text}")
+            lines.append(f"# TYPE {family_name} {metric_type}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Mapping[str, str]) -> str:
+    """Return the labels of a sample."""
+    if not labels:
+        return ""
+    formatted_labels = ",".join(
+        f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()
+    )
+    return f"{{{formatted_labels}}}"
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Return the value of a sample."""
+    if isinstance(value, bool):
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
@@ -9,7 +10,12 @@ from hahomematic.const import HmPlatform, SysvarType
 from hahomematic.platforms.generic import BaseNumber
 from hahomematic.platforms.hub import HmSysvarNumber
 
-from homeassistant.components.number import NumberEntity, NumberMode, RestoreNumber
+from homeassistant.components.number import (
+    NumberEntity,
+    NumberExtraStoredData,
+    NumberMode,
+    RestoreNumber,
+)
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
@@ -46,7 +52,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -116,6 +122,8 @@ class HaHomematicNumber(HaHomematicGenericEntity[BaseNumber], RestoreNumber):
     @property
     def native_value(self) -> float | None:
         """Return the current value."""
+        if "native_value" in self._optimistic_values:
+            return self._optimistic_values["native_value"]
         if self._hm_entity.is_valid and self._hm_entity.value is not None:
             return float(self._hm_entity.value * self._multiplier)
         if self.is_restored:
@@ -124,13 +132,18 @@ class HaHomematicNumber(HaHomematicGenericEntity[BaseNumber], RestoreNumber):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        await self._hm_entity.send_value(value / self._multiplier)
+        await self._async_send_command(
+            send=partial(self._hm_entity.send_value, value / self._multiplier),
+            parameter=self._hm_entity.parameter,
+            coalesce=True,
+            optimistic_values={"native_value": value},
+        )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the generic entity."""
         attributes = super().extra_state_attributes
-        if self.is_restored:
+        if self.is_restored and not self.is_pending:
             attributes[ATTR_VALUE_STATE] = HmEntityState.RESTORED
         return attributes
 
@@ -142,10 +155,16 @@ class HaHomematicNumber(HaHomematicGenericEntity[BaseNumber], RestoreNumber):
     async def async_added_to_hass(self) -> None:
         """Check, if state needs to be restored."""
         await super().async_added_to_hass()
-        if not self._hm_entity.is_valid and (
-            restored_sensor_data := await self.async_get_last_number_data()
-        ):
-            self._restored_native_value = restored_sensor_data.native_value
+        if self._hm_entity.is_valid:
+            return
+        if (
+            extra_data := self._cu.value_snapshot.get_extra_data(unique_id=self.unique_id)
+        ) is not None:
+            restored_number_data = NumberExtraStoredData.from_dict(extra_data)
+        else:
+            restored_number_data = await self.async_get_last_number_data()
+        if restored_number_data:
+            self._restored_native_value = restored_number_data.native_value
 
 
 class HaHomematicSysvarNumber(HaHomematicGenericSysvarEntity[HmSysvarNumber], NumberEntity):
@@ -0,0 +1,74 @@
+"""On-demand profiling of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from datetime import datetime
+import io
+import logging
+import os
+import pstats
+from typing import Final
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+from .control_unit import get_storage_folder
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILER_RUNNING_KEY: HassKey[bool] = HassKey(f"{DOMAIN}_profiler_running")
+# Only functions of these packages are part of the summary.
+PROFILE_SUMMARY_FILTER: Final = "homematicip_local|hahomematic"
+
+
+async def async_profile(
+    hass: HomeAssistant, instance_name: str, duration: float, top: int
+) -> tuple[str, str]:
+    """
+    Profile the event loop for the given duration.
+
+    The profiler is only installed while the profile is recorded, so there is
+    no overhead when no profile is running. All callbacks on the loop are
+    recorded, but the summary is limited to Homematic(IP) Local and hahomematic.
+    Returns the paths of the profile and the summary file.
+    """
+    if hass.data.get(PROFILER_RUNNING_KEY):
+        raise HomeAssistantError("A profile is already running")
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError as ex:
+        # Another profiler (e.g. the profiler integration) is active.
+        raise HomeAssistantError(f"Unable to start profiling: {ex}") from ex
+    hass.data[PROFILER_RUNNING_KEY] = True
+    _LOGGER.info("Profiling %s for %s seconds", instance_name, duration)
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+        hass.data[PROFILER_RUNNING_KEY] = False
+
+    file_name = f"{instance_name}_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    profile_path = os.path.join(get_storage_folder(hass=hass), f"{file_name}.prof")
+    summary_path = os.path.join(get_storage_folder(hass=hass), f"{file_name}.txt")
+    await hass.async_add_executor_job(_write_profile, profiler, profile_path, summary_path, top)
+    _LOGGER.info("Profile of %s written to %s and %s", instance_name, profile_path, summary_path)
+    return profile_path, summary_path
+
+
+def _write_profile(
+    profiler: cProfile.Profile, profile_path: str, summary_path: str, top: int
+) -> None:
+    """Write the profile and the top-N summary."""
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    profiler.dump_stats(profile_path)
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_SUMMARY_FILTER, top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(PROFILE_SUMMARY_FILTER, top)
+    with open(summary_path, "w", encoding="utf-8") as summary_file:
+        summary_file.write(summary.getvalue())
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 import logging
-from typing import Any
+from typing import Any, Final
 
 from hahomematic.const import HmPlatform, ParameterType, SysvarType
+from hahomematic.platforms.device import HmDevice
 from hahomematic.platforms.generic import HmSensor
 from hahomematic.platforms.hub import HmSysvarSensor
 
@@ -15,17 +18,22 @@ from homeassistant.components.sensor import (
     RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
+    SensorExtraStoredData,
     SensorStateClass,
 )
+from homeassistant.const import MATCH_ALL, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
 from . import HomematicConfigEntry
-from .const import TOTAL_SYSVAR, HmEntityState
-from .control_unit import ControlUnit, signal_new_hm_entity
+from .const import DOMAIN, TOTAL_SYSVAR, HmEntityState
+from .control_unit import ControlUnit, signal_new_hm_devices, signal_new_hm_entity
 from .entity_helpers import HmSensorEntityDescription
+from .event_metrics import EventMetrics
 from .generic_entity import (
     ATTR_VALUE_STATE,
     HaHomematicGenericEntity,
@@ -33,6 +41,57 @@ from .generic_entity import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+ATTR_COMMANDS_CONFIRMED: Final = "commands_confirmed"
+ATTR_COMMANDS_SENT: Final = "commands_sent"
+ATTR_COMMANDS_TIMED_OUT: Final = "commands_timed_out"
+ATTR_LATENCY_BUCKETS: Final = "latency_buckets"
+ATTR_LATENCY_LAST: Final = "latency_last"
+ATTR_LATENCY_MAX: Final = "latency_max"
+
+
+@dataclass(frozen=True, kw_only=True)
+class HmEventMetricsSensorEntityDescription(SensorEntityDescription):
+    """Class describing an event metrics sensor entity."""
+
+    value_fn: Callable[[EventMetrics], float | None]
+    attributes_fn: Callable[[EventMetrics], dict[str, Any]]
+
+
+EVENT_METRICS_SENSOR_DESCRIPTIONS: Final[tuple[HmEventMetricsSensorEntityDescription, ...]] = (
+    HmEventMetricsSensorEntityDescription(
+        key="event_rate",
+        translation_key="event_rate",
+        native_unit_of_measurement="events/s",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda event_metrics: event_metrics.events_per_second,
+        attributes_fn=lambda event_metrics: {
+            "events_total": event_metrics.events_total,
+            "events_per_second_by_interface": event_metrics.events_per_second_by_interface,
+            "events_per_second_by_event_type": event_metrics.events_per_second_by_event_type,
+        },
+    ),
+    HmEventMetricsSensorEntityDescription(
+        key="event_lag",
+        translation_key="event_lag",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda event_metrics: event_metrics.lag_avg,
+        attributes_fn=lambda event_metrics: {"lag_max": event_metrics.lag_max},
+    ),
+    HmEventMetricsSensorEntityDescription(
+        key="callback_time_max",
+        translation_key="callback_time_max",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=3,
+        value_fn=lambda event_metrics: max(event_metrics.callback_time_max.values(), default=None),
+        attributes_fn=lambda event_metrics: dict(event_metrics.callback_time_max),
+    ),
+)
 
 
 async def async_setup_entry(
@@ -53,7 +112,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -68,6 +127,26 @@ async def async_setup_entry(
         ]:
             async_add_entities(entities)
 
+    command_latency_devices: set[str] = set()
+
+    @callback
+    def async_add_command_latency_sensor(hm_devices: tuple[HmDevice, ...]) -> None:
+        """Add command latency sensor for devices with writable entities."""
+        if writable_devices := [
+            hm_device
+            for hm_device in hm_devices
+            if hm_device.address not in command_latency_devices
+            and any(hm_entity.is_writable for hm_entity in hm_device.generic_entities)
+        ]:
+            _LOGGER.debug(
+                "ASYNC_ADD_COMMAND_LATENCY_SENSOR: Adding %i entities", len(writable_devices)
+            )
+            command_latency_devices.update(hm_device.address for hm_device in writable_devices)
+            async_add_entities(
+                HaHomematicCommandLatencySensor(control_unit=control_unit, hm_device=hm_device)
+                for hm_device in writable_devices
+            )
+
     entry.async_on_unload(
         func=async_dispatcher_connect(
             hass=hass,
@@ -75,6 +154,13 @@ async def async_setup_entry(
             target=async_add_sensor,
         )
     )
+    entry.async_on_unload(
+        func=async_dispatcher_connect(
+            hass=hass,
+            signal=signal_new_hm_devices(entry_id=entry.entry_id),
+            target=async_add_command_latency_sensor,
+        )
+    )
     entry.async_on_unload(
         func=async_dispatcher_connect(
             hass=hass,
@@ -87,6 +173,13 @@ async def async_setup_entry(
 
     async_add_hub_sensor(hm_entities=control_unit.get_new_hub_entities(entity_type=HmSysvarSensor))
 
+    async_add_command_latency_sensor(hm_devices=tuple(control_unit.central.devices))
+
+    async_add_entities(
+        HaHomematicEventMetricsSensor(control_unit=control_unit, entity_description=description)
+        for description in EVENT_METRICS_SENSOR_DESCRIPTIONS
+    )
+
 
 class HaHomematicSensor(HaHomematicGenericEntity[HmSensor], RestoreSensor):
     """Representation of the HomematicIP sensor entity."""
@@ -158,9 +251,15 @@ class HaHomematicSensor(HaHomematicGenericEntity[HmSensor], RestoreSensor):
     async def async_added_to_hass(self) -> None:
         """Check, if state needs to be restored."""
         await super().async_added_to_hass()
-        if not self._hm_entity.is_valid and (
-            restored_sensor_data := await self.async_get_last_sensor_data()
-        ):
+        if self._hm_entity.is_valid:
+            return
+        if (
+            extra_data := self._cu.value_snapshot.get_extra_data(unique_id=self.unique_id)
+        ) is not None:
+            restored_sensor_data = SensorExtraStoredData.from_dict(extra_data)
+        else:
+            restored_sensor_data = await self.async_get_last_sensor_data()
+        if restored_sensor_data:
             self._restored_native_value = restored_sensor_data.native_value
 
 
@@ -194,3 +293,100 @@ class HaHomematicSysvarSensor(HaHomematicGenericSysvarEntity[HmSysvarSensor], Se
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the native value of the entity."""
         return self._hm_hub_entity.value
+
+
+class HaHomematicCommandLatencySensor(SensorEntity):
+    """Representation of the command round-trip latency of a device."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 2
+    _attr_translation_key = "command_latency"
+
+    _unrecorded_attributes = frozenset({ATTR_LATENCY_BUCKETS})
+
+    def __init__(self, control_unit: ControlUnit, hm_device: HmDevice) -> None:
+        """Initialize the command latency sensor."""
+        self._cu: ControlUnit = control_unit
+        self._hm_device = hm_device
+        self._attr_unique_id = f"{DOMAIN}_{hm_device.identifier}_command_latency"
+        self._attr_device_info = control_unit.async_get_device_info(hm_device=hm_device)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._hm_device.available
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average command latency of the device."""
+        if metrics := self._cu.command_latency.get_device_metrics(
+            device_address=self._hm_device.address
+        ):
+            return metrics.latency_avg
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes of the command latency sensor."""
+        if (
+            metrics := self._cu.command_latency.get_device_metrics(
+                device_address=self._hm_device.address
+            )
+        ) is None:
+            return {}
+        return {
+            ATTR_COMMANDS_SENT: metrics.commands_sent,
+            ATTR_COMMANDS_CONFIRMED: metrics.commands_confirmed,
+            ATTR_COMMANDS_TIMED_OUT: metrics.commands_timed_out,
+            ATTR_LATENCY_LAST: metrics.latency_last,
+            ATTR_LATENCY_MAX: metrics.latency_max,
+            ATTR_LATENCY_BUCKETS: metrics.latency_buckets,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.async_on_remove(
+            self._cu.command_latency.async_add_listener(
+                device_address=self._hm_device.address,
+                listener=self.async_write_ha_state,
+            )
+        )
+
+
+class HaHomematicEventMetricsSensor(SensorEntity):
+    """Representation of the event ingestion metrics of the central."""
+
+    entity_description: HmEventMetricsSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_has_entity_name = True
+
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    def __init__(
+        self,
+        control_unit: ControlUnit,
+        entity_description: HmEventMetricsSensorEntityDescription,
+    ) -> None:
+        """Initialize the event metrics sensor."""
+        self._cu: ControlUnit = control_unit
+        self.entity_description = entity_description
+        central_name = control_unit.central.name
+        self._attr_unique_id = f"{DOMAIN}_{central_name}_{entity_description.key}"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, central_name)})
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the value of the event metric."""
+        return self.entity_description.value_fn(self._cu.event_metrics)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes of the event metric."""
+        return self.entity_description.attributes_fn(self._cu.event_metrics)
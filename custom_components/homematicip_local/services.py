@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import datetime
+from functools import partial
 import logging
-from typing import TYPE_CHECKING, Final, cast
+from typing import TYPE_CHECKING, Any, Final, cast
 
 from hahomematic.const import ForcedDeviceAvailability, ParamsetKey
 from hahomematic.exceptions import BaseHomematicException
@@ -28,6 +30,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.service import async_register_admin_service, verify_domain_control
 
+from .command_queue import CommandKey, CommandPriority
 from .const import (
     DOMAIN,
     HMIP_LOCAL_SERVICES,
@@ -40,6 +43,7 @@ from .const import (
     SERVICE_GET_LINK_PARAMSET,
     SERVICE_GET_LINK_PEERS,
     SERVICE_GET_PARAMSET,
+    SERVICE_PROFILE_CALLBACKS,
     SERVICE_PUT_LINK_PARAMSET,
     SERVICE_PUT_PARAMSET,
     SERVICE_REMOVE_CENTRAL_LINKS,
@@ -49,6 +53,7 @@ from .const import (
     SERVICE_UPDATE_DEVICE_FIRMWARE_DATA,
 )
 from .control_unit import ControlUnit
+from .profiler import async_profile
 from .support import get_device_address_at_interface_from_identifiers
 
 if TYPE_CHECKING:
@@ -60,6 +65,7 @@ CONF_ADDRESS: Final = "address"
 CONF_CHANNEL: Final = "channel"
 CONF_CHANNEL_ADDRESS: Final = "channel_address"
 CONF_DEVICE_ADDRESS: Final = "device_address"
+CONF_DURATION: Final = "duration"
 CONF_ENTRY_ID: Final = "entry_id"
 CONF_INTERFACE_ID: Final = "interface_id"
 CONF_NAME: Final = "name"
@@ -70,6 +76,7 @@ CONF_RECEIVER_CHANNEL_ADDRESS: Final = "receiver_channel_address"
 CONF_RX_MODE: Final = "rx_mode"
 CONF_SENDER_CHANNEL_ADDRESS: Final = "sender_channel_address"
 CONF_TIME: Final = "time"
+CONF_TOP: Final = "top"
 CONF_VALUE: Final = "value"
 CONF_VALUE_TYPE: Final = "value_type"
 CONF_WAIT_FOR_CALLBACK: Final = "wait_for_callback"
@@ -178,6 +185,16 @@ SCHEMA_SERVICE_SET_VARIABLE_VALUE = vol.Schema(
     }
 )
 
+SCHEMA_SERVICE_PROFILE_CALLBACKS = vol.Schema(
+    {
+        vol.Required(CONF_ENTRY_ID): cv.string,
+        vol.Optional(CONF_DURATION, default=30): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=600)
+        ),
+        vol.Optional(CONF_TOP, default=30): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+    }
+)
+
 SCHEMA_SERVICE_SET_INSTALL_MODE = vol.Schema(
     {
         vol.Required(CONF_INTERFACE_ID): cv.string,
@@ -262,6 +279,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             return await _async_service_get_link_paramset(hass=hass, service=service)
         elif service_name == SERVICE_GET_PARAMSET:
             return await _async_service_get_paramset(hass=hass, service=service)
+        elif service_name == SERVICE_PROFILE_CALLBACKS:
+            await _async_service_profile_callbacks(hass=hass, service=service)
         elif service_name == SERVICE_PUT_LINK_PARAMSET:
             await _async_service_put_link_paramset(hass=hass, service=service)
         elif service_name == SERVICE_PUT_PARAMSET:
@@ -350,6 +369,14 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         supports_response=SupportsResponse.OPTIONAL,
     )
 
+    async_register_admin_service(
+        hass=hass,
+        domain=DOMAIN,
+        service=SERVICE_PROFILE_CALLBACKS,
+        service_func=async_call_hmip_local_service,
+        schema=SCHEMA_SERVICE_PROFILE_CALLBACKS,
+    )
+
     async_register_admin_service(
         hass=hass,
         domain=DOMAIN,
@@ -578,15 +605,22 @@ async def _async_service_set_device_value(hass: HomeAssistant, service: ServiceC
             value = str(value)
 
     if hm_device := _async_get_hm_device_by_service_data(hass=hass, service=service):
+        channel_address = f"{hm_device.address}:{channel_no}"
         try:
-            await hm_device.client.set_value(
-                channel_address=f"{hm_device.address}:{channel_no}",
-                paramset_key=ParamsetKey.VALUES,
-                parameter=parameter,
-                value=value,
-                wait_for_callback=wait_for_callback,
-                rx_mode=rx_mode,
-                check_against_pd=True,
+            await _async_send_command(
+                hass=hass,
+                hm_device=hm_device,
+                send=partial(
+                    hm_device.client.set_value,
+                    channel_address=channel_address,
+                    paramset_key=ParamsetKey.VALUES,
+                    parameter=parameter,
+                    value=value,
+                    wait_for_callback=wait_for_callback,
+                    rx_mode=rx_mode,
+                    check_against_pd=True,
+                ),
+                key=(channel_address, parameter),
             )
         except BaseHomematicException as ex:
             raise HomeAssistantError(ex) from ex
@@ -620,6 +654,19 @@ async def _async_service_clear_cache(hass: HomeAssistant, service: ServiceCall)
     entry_id = service.data[CONF_ENTRY_ID]
     if control := _async_get_control_unit(hass=hass, entry_id=entry_id):
         await control.central.clear_caches()
+        await control.value_snapshot.async_clear()
+
+
+async def _async_service_profile_callbacks(hass: HomeAssistant, service: ServiceCall) -> None:
+    """Service to profile the callbacks and service handlers of the integration."""
+    entry_id = service.data[CONF_ENTRY_ID]
+    if control := _async_get_control_unit(hass=hass, entry_id=entry_id):
+        await async_profile(
+            hass=hass,
+            instance_name=control.central.name,
+            duration=service.data[CONF_DURATION],
+            top=service.data[CONF_TOP],
+        )
 
 
 async def _async_service_fetch_system_variables(hass: HomeAssistant, service: ServiceCall) -> None:
@@ -641,12 +688,18 @@ async def _async_service_put_link_paramset(hass: HomeAssistant, service: Service
 
     if hm_device := _async_get_hm_device_by_service_data(hass=hass, service=service):
         try:
-            await hm_device.client.put_paramset(
-                channel_address=receiver_channel_address,
-                paramset_key=sender_channel_address,
-                values=values,
-                rx_mode=rx_mode,
-                check_against_pd=True,
+            await _async_send_command(
+                hass=hass,
+                hm_device=hm_device,
+                send=partial(
+                    hm_device.client.put_paramset,
+                    channel_address=receiver_channel_address,
+                    paramset_key=sender_channel_address,
+                    values=values,
+                    rx_mode=rx_mode,
+                    check_against_pd=True,
+                ),
+                priority=CommandPriority.LOW,
             )
         except BaseHomematicException as ex:
             raise HomeAssistantError(ex) from ex
@@ -668,13 +721,23 @@ async def _async_service_put_paramset(hass: HomeAssistant, service: ServiceCall)
             f"{hm_device.address}:{channel_no}" if channel_no is not None else hm_device.address
         )
         try:
-            await hm_device.client.put_paramset(
-                channel_address=channel_address,
-                paramset_key=paramset_key,
-                values=values,
-                wait_for_callback=wait_for_callback,
-                rx_mode=rx_mode,
-                check_against_pd=True,
+            await _async_send_command(
+                hass=hass,
+                hm_device=hm_device,
+                send=partial(
+                    hm_device.client.put_paramset,
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    values=values,
+                    wait_for_callback=wait_for_callback,
+                    rx_mode=rx_mode,
+                    check_against_pd=True,
+                ),
+                # Only writes of the same set of parameters are merged.
+                key=(channel_address, f"{paramset_key}:{','.join(sorted(values))}"),
+                priority=CommandPriority.LOW
+                if paramset_key == ParamsetKey.MASTER
+                else CommandPriority.NORMAL,
             )
         except BaseHomematicException as ex:
             raise HomeAssistantError(ex) from ex
@@ -689,6 +752,24 @@ async def _async_service_update_device_firmware_data(
         await control.central.refresh_firmware_data()
 
 
+async def _async_send_command(
+    hass: HomeAssistant,
+    hm_device: HmDevice,
+    send: Callable[[], Awaitable[Any]],
+    key: CommandKey | None = None,
+    priority: CommandPriority = CommandPriority.NORMAL,
+) -> None:
+    """Send a command through the command queue of the device interface."""
+    if control_unit := _async_get_cu_by_interface_id(
+        hass=hass, interface_id=hm_device.interface_id
+    ):
+        await control_unit.async_send_command(
+            interface_id=hm_device.interface_id, send=send, key=key, priority=priority
+        )
+    else:
+        await send()
+
+
 @callback
 def _async_get_control_unit(hass: HomeAssistant, entry_id: str) -> ControlUnit | None:
     """Get ControlUnit by entry_id."""
@@ -6,7 +6,14 @@ from collections.abc import Mapping
 import logging
 from typing import Any, TypeAlias, TypeVar, cast
 
-from hahomematic.const import EVENT_CHANNEL_NO, EVENT_PARAMETER, EVENT_VALUE, IDENTIFIER_SEPARATOR
+from hahomematic.central import CentralUnit
+from hahomematic.const import (
+    EVENT_CHANNEL_NO,
+    EVENT_PARAMETER,
+    EVENT_VALUE,
+    IDENTIFIER_SEPARATOR,
+    HmPlatform,
+)
 from hahomematic.platforms.custom import CustomEntity
 from hahomematic.platforms.entity import EVENT_DATA_SCHEMA, CallbackEntity
 from hahomematic.platforms.generic import GenericEntity
@@ -115,3 +122,19 @@ def get_hm_entity(hm_entity: T) -> T:
 
 class InvalidConfig(HomeAssistantError):
     """Error to indicate there is invalid config."""
+
+
+def get_entities_by_platform_stats(
+    central: CentralUnit, registered: bool | None = None
+) -> Mapping[HmPlatform, int]:
+    """Return the central statistics for entities by platform."""
+    _entities_by_platform: dict[HmPlatform, int] = {}
+    for entity in (
+        central.get_entities(registered=registered)
+        + central.program_buttons
+        + central.sysvar_entities
+    ):
+        if (platform := entity.platform) not in _entities_by_platform:
+            _entities_by_platform[platform] = 0
+        _entities_by_platform[platform] += 1
+    return dict(sorted(_entities_by_platform.items()))
@@ -10,8 +10,6 @@ from hahomematic.platforms.update import HmUpdate
 
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -41,7 +39,7 @@ async def async_setup_entry(
                 control_unit=control_unit,
                 hm_entity=hm_entity,
             )
-            for hm_entity in hm_entities
+            for hm_entity in control_unit.async_exclude_disabled_entities(hm_entities=hm_entities)
         ]:
             async_add_entities(entities)
 
@@ -76,9 +74,7 @@ class HaHomematicUpdate(UpdateEntity):
         self._cu: ControlUnit = control_unit
         self._hm_entity: HmUpdate = hm_entity
         self._attr_unique_id = f"{DOMAIN}_{hm_entity.unique_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, hm_entity.device.identifier)},
-        )
+        self._attr_device_info = control_unit.async_get_device_info(hm_device=hm_entity.device)
         self._attr_extra_state_attributes = {
             ATTR_FIRMWARE_UPDATE_STATE: hm_entity.device.firmware_update_state
         }
@@ -120,6 +116,8 @@ class HaHomematicUpdate(UpdateEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks and load initial data."""
+        # Callbacks are only registered, while the entity is added to HA.
+        # HA doesn't add disabled entities and removes entities, that get disabled.
         self._unregister_callbacks.append(
             self._hm_entity.register_entity_updated_callback(
                 cb=self._async_entity_changed, custom_id=self.entity_id
@@ -132,15 +130,7 @@ class HaHomematicUpdate(UpdateEntity):
     @callback
     def _async_entity_changed(self, *args: Any, **kwargs: Any) -> None:
         """Handle device state changes."""
-        # Don't update disabled entities
-        if self.enabled:
-            _LOGGER.debug("Update state changed event fired for %s", self.name)
-            self.async_schedule_update_ha_state()
-        else:
-            _LOGGER.debug(
-                "Update state changed event for %s not fired. Entity is disabled",
-                self.name,
-            )
+        self.async_schedule_update_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when hmip device will be removed from hass."""
@@ -148,18 +138,13 @@ class HaHomematicUpdate(UpdateEntity):
         for unregister in self._unregister_callbacks:
             if unregister is not None:
                 unregister()
+        self._unregister_callbacks.clear()
 
     @callback
     def _async_device_removed(self, *args: Any, **kwargs: Any) -> None:
         """Handle hm device removal."""
-        self.hass.async_create_task(self.async_remove(force_remove=True))
-
-        if not self.registry_entry:
-            return
-
-        if device_id := self.registry_entry.device_id:
-            # Remove from device registry.
-            device_registry = dr.async_get(self.hass)
-            if device_id in device_registry.devices:
-                # This will also remove associated entities from entity registry.
-                device_registry.async_remove_device(device_id)
+        if self.registry_entry and (device_id := self.registry_entry.device_id):
+            # The removal of the device also removes its entities.
+            self._cu.async_remove_device(device_id=device_id)
+        else:
+            self.hass.async_create_task(self.async_remove(force_remove=True))
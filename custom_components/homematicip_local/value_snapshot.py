@@ -0,0 +1,133 @@
+"""Warm-start value snapshot for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Final
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import save_json
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util.json import load_json
+
+from .const import HmEntityState
+
+_LOGGER = logging.getLogger(__name__)
+
+# Same as the state attribute of the generic entity, that can't be imported here.
+ATTR_VALUE_STATE: Final = "value_state"
+# Version of the file format. Snapshots with another version are ignored.
+SNAPSHOT_VERSION: Final = 1
+
+
+class ValueSnapshot:
+    """
+    Snapshot of the entity states of a central.
+
+    The snapshot is loaded with a single read before the entities are created
+    and is used to seed the restored state of the entities, while the actual
+    values are loaded from the backend in the background. Only states with a
+    value, that was valid at the time of the snapshot, are stored. States of
+    entities, that are currently not tracked, are kept, so that a start without
+    a connection to the backend doesn't wipe the snapshot.
+    """
+
+    def __init__(self, hass: HomeAssistant, storage_folder: str, name: str) -> None:
+        """Init the value snapshot."""
+        self._hass: Final = hass
+        self._file_path: Final = os.path.join(storage_folder, f"{name}_value_snapshot.json")
+        # State, attributes and extra restore data by unique_id.
+        self._states: dict[str, list[Any]] = {}
+        self._entities: dict[str, RestoreEntity] = {}
+
+    def has_state(self, unique_id: str | None) -> bool:
+        """Return if the snapshot contains a state of the entity."""
+        return unique_id is not None and unique_id in self._states
+
+    def get_state(self, unique_id: str | None, entity_id: str) -> State | None:
+        """Return the state of an entity from the snapshot."""
+        if unique_id is None or (snapshot_state := self._states.get(unique_id)) is None:
+            return None
+        state, attributes, _ = snapshot_state
+        return State(entity_id=entity_id, state=state, attributes=attributes)
+
+    def get_extra_data(self, unique_id: str | None) -> dict[str, Any] | None:
+        """Return the extra restore data of an entity from the snapshot."""
+        if unique_id is None or (snapshot_state := self._states.get(unique_id)) is None:
+            return None
+        return snapshot_state[2]  # type: ignore[no-any-return]
+
+    @callback
+    def async_track_entity(self, entity: RestoreEntity) -> CALLBACK_TYPE:
+        """Add an entity to the snapshot until the returned callback is called."""
+        unique_id = entity.unique_id
+        if unique_id is not None:
+            self._entities[unique_id] = entity
+
+        @callback
+        def untrack_entity() -> None:
+            """Remove the entity from the snapshot."""
+            if unique_id is not None and self._entities.get(unique_id) is entity:
+                del self._entities[unique_id]
+
+        return untrack_entity
+
+    async def async_load(self) -> None:
+        """Load the snapshot."""
+        try:
+            data = await self._hass.async_add_executor_job(load_json, self._file_path)
+        except HomeAssistantError as ex:
+            _LOGGER.debug("Unable to load value snapshot %s: %s", self._file_path, ex)
+            return
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return
+        self._states = data.get("states", {})
+        _LOGGER.debug("Loaded %i states from value snapshot", len(self._states))
+
+    async def async_save(self, *args: Any) -> None:
+        """Save the current states of the entities to the snapshot."""
+        self._async_update_states()
+        try:
+            await self._hass.async_add_executor_job(
+                save_json,
+                self._file_path,
+                {"version": SNAPSHOT_VERSION, "states": self._states},
+                atomic_writes=True,
+            )
+        except HomeAssistantError as ex:
+            _LOGGER.warning("Unable to save value snapshot %s: %s", self._file_path, ex)
+
+    async def async_clear(self) -> None:
+        """Clear the snapshot."""
+        self._states.clear()
+        await self._hass.async_add_executor_job(_remove_file, self._file_path)
+
+    @callback
+    def _async_update_states(self) -> None:
+        """Update the snapshot from the tracked entities."""
+        states = dict(self._states)
+        for unique_id, entity in self._entities.items():
+            if (state := self._hass.states.get(entity.entity_id)) is None:
+                # The entity has no state, e.g. if it has been disabled.
+                states.pop(unique_id, None)
+            elif (
+                state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+                and state.attributes.get(ATTR_VALUE_STATE) != HmEntityState.NOT_VALID
+            ):
+                extra_data = entity.extra_restore_state_data
+                states[unique_id] = [
+                    state.state,
+                    dict(state.attributes),
+                    extra_data.as_dict() if extra_data else None,
+                ]
+            # Otherwise the last valid state is kept, e.g. if the device is unreachable.
+        self._states = states
+
+
+def _remove_file(file_path: str) -> None:
+    """Remove a file, if it exists."""
+    if os.path.exists(file_path):
+        os.remove(file_path)
@@ -0,0 +1,96 @@
+"""Slow callback watchdog for Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+from time import monotonic
+from typing import Final
+
+_LOGGER = logging.getLogger(__name__)
+
+# Minimum time in seconds between two warnings for the same callback.
+SLOW_CALLBACK_LOG_INTERVAL: Final = 60.0
+
+
+@dataclass
+class SlowCallbackStats:
+    """Statistics of a slow callback."""
+
+    count: int = 0
+    duration_max: float = 0.0
+    duration_last: float = 0.0
+    device_address: str | None = None
+    event_type: str | None = None
+
+
+class CallbackWatchdog:
+    """
+    Detect callbacks, that block the event loop.
+
+    Callbacks running longer than the threshold are counted by callback name.
+    A warning is logged at most once per log interval and callback name. The
+    watchdog is disabled, if the threshold is 0.
+    """
+
+    def __init__(
+        self,
+        instance_name: str,
+        threshold: float,
+        log_interval: float = SLOW_CALLBACK_LOG_INTERVAL,
+    ) -> None:
+        """Init the callback watchdog."""
+        self._instance_name: Final = instance_name
+        self._threshold: Final = threshold
+        self._log_interval: Final = log_interval
+        self._stats: dict[str, SlowCallbackStats] = {}
+        self._logged_at: dict[str, float] = {}
+        self._suppressed: dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the watchdog is enabled."""
+        return self._threshold > 0
+
+    @property
+    def stats(self) -> Mapping[str, SlowCallbackStats]:
+        """Return the statistics of slow callbacks by callback name."""
+        return dict(sorted(self._stats.items()))
+
+    def callback_finished(
+        self,
+        callback_name: str,
+        duration: float,
+        device_address: str | None = None,
+        event_type: str | None = None,
+    ) -> None:
+        """Check the time spent in a callback."""
+        if not self.enabled or duration < self._threshold:
+            return
+        if (stats := self._stats.get(callback_name)) is None:
+            stats = SlowCallbackStats()
+            self._stats[callback_name] = stats
+        stats.count += 1
+        stats.duration_max = max(stats.duration_max, duration)
+        stats.duration_last = duration
+        stats.device_address = device_address
+        stats.event_type = event_type
+
+        now = monotonic()
+        if (
+            logged_at := self._logged_at.get(callback_name)
+        ) is not None and now - logged_at < self._log_interval:
+            self._suppressed[callback_name] = self._suppressed.get(callback_name, 0) + 1
+            return
+        self._logged_at[callback_name] = now
+        _LOGGER.warning(
+            "Callback %s of %s blocked the event loop for %.3fs "
+            "(device address: %s, event type: %s, suppressed since last warning: %i)",
+            callback_name,
+            self._instance_name,
+            duration,
+            device_address,
+            event_type,
+            self._suppressed.pop(callback_name, 0),
+        )
@@ -181,6 +181,7 @@ def mock_control_unit() -> ControlUnit:
 
     control_unit.get_new_entities.return_value = []
     control_unit.get_new_hub_entities.return_value = []
+    control_unit.forwarded_platforms = ()
 
     with patch(
         "custom_components.homematicip_local.control_unit.ControlUnit",
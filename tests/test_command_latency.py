@@ -0,0 +1,77 @@
+"""Tests for the command latency metrics of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.homematicip_local.command_latency import CommandLatencyTracker
+
+DEVICE_ADDRESS = "VCU0000001"
+KEY = ("VCU0000001:1", "LEVEL")
+
+
+def test_command_latency() -> None:
+    """Test that confirmed commands are added to the histogram."""
+    command_latency = CommandLatencyTracker(timeout=10.0)
+    updates: list[bool] = []
+    command_latency.async_add_listener(
+        device_address=DEVICE_ADDRESS, listener=lambda: updates.append(True)
+    )
+    with patch(
+        "custom_components.homematicip_local.command_latency.monotonic",
+        side_effect=[100.0, 100.0, 100.8],
+    ):
+        command_latency.command_sent(device_address=DEVICE_ADDRESS, key=KEY)
+        command_latency.command_confirmed(key=KEY)
+
+    metrics = command_latency.get_device_metrics(device_address=DEVICE_ADDRESS)
+    assert metrics is not None
+    assert metrics.commands_sent == 1
+    assert metrics.commands_confirmed == 1
+    assert metrics.latency_avg == metrics.latency_last
+    assert metrics.latency_buckets["1.0"] == 1
+    assert updates == [True]
+    # A confirmation without a pending command is ignored.
+    command_latency.command_confirmed(key=KEY)
+    assert metrics.commands_confirmed == 1
+
+
+def test_command_latency_timeout() -> None:
+    """Test that unconfirmed commands are counted as timed out."""
+    command_latency = CommandLatencyTracker(timeout=10.0)
+    with patch(
+        "custom_components.homematicip_local.command_latency.monotonic",
+        side_effect=[100.0, 100.0, 111.0],
+    ):
+        command_latency.command_sent(device_address=DEVICE_ADDRESS, key=KEY)
+        metrics = command_latency.get_device_metrics(device_address=DEVICE_ADDRESS)
+
+    assert metrics is not None
+    assert metrics.commands_timed_out == 1
+    assert metrics.commands_confirmed == 0
+    assert metrics.latency_avg is None
+
+
+def test_command_latency_timeout_listener() -> None:
+    """Test that listeners reading the metrics on a timeout don't count it twice."""
+    command_latency = CommandLatencyTracker(timeout=10.0)
+    timed_out: list[int] = []
+
+    def listener() -> None:
+        """Read the metrics like a sensor does."""
+        metrics = command_latency.get_device_metrics(device_address=DEVICE_ADDRESS)
+        assert metrics is not None
+        timed_out.append(metrics.commands_timed_out)
+
+    command_latency.async_add_listener(device_address=DEVICE_ADDRESS, listener=listener)
+    with patch(
+        "custom_components.homematicip_local.command_latency.monotonic",
+        side_effect=[100.0, 100.0, 100.0, 100.0, 111.0, 111.0],
+    ):
+        command_latency.command_sent(device_address=DEVICE_ADDRESS, key=KEY)
+        command_latency.command_sent(device_address=DEVICE_ADDRESS, key=("VCU0000001:2", "LEVEL"))
+        metrics = command_latency.get_device_metrics(device_address=DEVICE_ADDRESS)
+
+    assert metrics is not None
+    assert metrics.commands_timed_out == 2
+    assert timed_out == [2]
@@ -0,0 +1,103 @@
+"""Tests for the command queue of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.homematicip_local.command_queue import (
+    CommandPriority,
+    CommandQueue,
+    WriteCoalescer,
+)
+from homeassistant.core import HomeAssistant
+
+from tests import const
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_last_writer_wins(hass: HomeAssistant) -> None:
+    """Test that queued writes to the same parameter are merged."""
+    sent: list[str] = []
+
+    def create_send(value: str):
+        async def send() -> str:
+            sent.append(value)
+            return value
+
+        return send
+
+    command_queue = CommandQueue(
+        hass=hass,
+        interface_id=const.INTERFACE_ID,
+        duty_cycle_provider=lambda: None,
+        burst=1,
+        max_rate=20.0,
+    )
+    # The first command is sent immediately.
+    assert await command_queue.async_send(send=create_send("first")) == "first"
+
+    results = await asyncio.gather(
+        command_queue.async_send(send=create_send("a"), key=("VCU0000001:1", "LEVEL")),
+        command_queue.async_send(send=create_send("other"), key=("VCU0000001:2", "LEVEL")),
+        command_queue.async_send(send=create_send("b"), key=("VCU0000001:1", "LEVEL")),
+        command_queue.async_send(
+            send=create_send("stop"), key=("VCU0000001:3", "LEVEL"), priority=CommandPriority.HIGH
+        ),
+    )
+    assert results == ["b", "other", "b", "stop"]
+    assert sent == ["first", "stop", "b", "other"]
+    metrics = command_queue.metrics
+    assert metrics.commands_sent == 4
+    assert metrics.commands_merged == 1
+    assert metrics.max_queue_depth == 3
+    assert metrics.queue_depth == 0
+    command_queue.stop()
+
+
+@pytest.mark.asyncio()
+async def test_command_queue_duty_cycle(hass: HomeAssistant) -> None:
+    """Test that the rate is reduced by the duty cycle."""
+    duty_cycle: float | None = None
+    command_queue = CommandQueue(
+        hass=hass,
+        interface_id=const.INTERFACE_ID,
+        duty_cycle_provider=lambda: duty_cycle,
+        max_rate=10.0,
+        min_rate=0.5,
+        throttle_level=50.0,
+    )
+    assert command_queue._get_rate() == 10.0  # pylint: disable=protected-access
+    duty_cycle = 75.0
+    assert command_queue._get_rate() == 5.0  # pylint: disable=protected-access
+    duty_cycle = 100.0
+    assert command_queue._get_rate() == 0.5  # pylint: disable=protected-access
+    assert command_queue.metrics.duty_cycle == 100.0
+
+
+@pytest.mark.asyncio()
+async def test_write_coalescer(hass: HomeAssistant) -> None:
+    """Test that only the leading and trailing writes are sent."""
+    sent: list[int] = []
+
+    def create_send(value: int):
+        async def send() -> int:
+            sent.append(value)
+            return value
+
+        return send
+
+    write_coalescer = WriteCoalescer(hass=hass, delay=0.05)
+    writes = []
+    for value in range(5):
+        writes.append(hass.async_create_task(write_coalescer.async_write(send=create_send(value))))
+        await asyncio.sleep(0.01)
+    assert await asyncio.gather(*writes) == [0, 4, 4, 4, 4]
+    assert sent == [0, 4]
+
+    pending_write = hass.async_create_task(write_coalescer.async_write(send=create_send(5)))
+    await asyncio.sleep(0)
+    write_coalescer.cancel()
+    assert await pending_write is None
+    assert sent == [0, 4]
@@ -0,0 +1,79 @@
+"""Tests for the control unit of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.homematicip_local.const import DOMAIN
+from custom_components.homematicip_local.control_unit import ControlUnit, DeviceRegistryStats
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from tests import const
+
+# pylint: disable=protected-access
+
+DEVICE_ADDRESS = "VCU0000001"
+
+
+@pytest.mark.asyncio()
+async def test_reconcile_device(
+    hass: HomeAssistant, mock_config_entry_v2: MockConfigEntry
+) -> None:
+    """Test that missing devices are created and existing devices are only updated on changes."""
+    mock_config_entry_v2.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    control_unit = Mock(
+        _entry_id=mock_config_entry_v2.entry_id, _device_registry_stats=DeviceRegistryStats()
+    )
+    control_unit._central.name = const.INSTANCE_NAME
+
+    central_device_id = ControlUnit._async_reconcile_device(
+        control_unit,
+        device_registry=device_registry,
+        identifier=const.INSTANCE_NAME,
+        attributes={"name": const.INSTANCE_NAME},
+    )
+    device_id = ControlUnit._async_reconcile_device(
+        control_unit,
+        device_registry=device_registry,
+        identifier=DEVICE_ADDRESS,
+        attributes={"name": "Switch", "sw_version": "1.0"},
+        via_device_id=central_device_id,
+    )
+    device = device_registry.async_get(device_id)
+    assert device is not None
+    assert device.identifiers == {(DOMAIN, DEVICE_ADDRESS)}
+    assert device.via_device_id == central_device_id
+    assert control_unit._device_registry_stats.created == 2
+
+    # An existing device without changes is not written.
+    assert (
+        ControlUnit._async_reconcile_device(
+            control_unit,
+            device_registry=device_registry,
+            identifier=DEVICE_ADDRESS,
+            attributes={"name": "Switch", "sw_version": "1.0"},
+            via_device_id=central_device_id,
+        )
+        == device_id
+    )
+    assert control_unit._device_registry_stats.unchanged == 1
+
+    # An existing device is updated, if its attributes or its via device changed.
+    device_registry.async_update_device(device_id, via_device_id=None)
+    ControlUnit._async_reconcile_device(
+        control_unit,
+        device_registry=device_registry,
+        identifier=DEVICE_ADDRESS,
+        attributes={"name": "Switch", "sw_version": "1.1"},
+        via_device_id=central_device_id,
+    )
+    device = device_registry.async_get(device_id)
+    assert device is not None
+    assert device.sw_version == "1.1"
+    assert device.via_device_id == central_device_id
+    assert control_unit._device_registry_stats.updated == 1
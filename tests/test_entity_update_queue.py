@@ -0,0 +1,60 @@
+"""Tests for the entity update queue of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.homematicip_local.entity_update_queue import EntityUpdateQueue
+from homeassistant.core import HomeAssistant
+
+
+@pytest.mark.asyncio()
+async def test_entity_update_queue(hass: HomeAssistant) -> None:
+    """Test that updates are compacted by key and processed in order."""
+    processed: list[str] = []
+    entity_update_queue = EntityUpdateQueue(hass=hass, batch_time=1.0)
+    for key in ("STATE", "LEVEL", "STATE", "STATE"):
+        entity_update_queue.put(
+            key=("VCU0000001:1", key), update=lambda key=key: processed.append(key)
+        )
+    assert processed == []
+    stats = entity_update_queue.stats
+    assert stats.queue_depth == 2
+    assert stats.compacted == 2
+
+    await hass.async_block_till_done()
+    assert processed == ["STATE", "LEVEL"]
+    stats = entity_update_queue.stats
+    assert stats.queue_depth == 0
+    assert stats.max_queue_depth == 2
+    assert stats.updates == 2
+    assert stats.batches == 1
+    assert stats.max_batch_size == 2
+
+
+@pytest.mark.asyncio()
+async def test_entity_update_queue_full(hass: HomeAssistant) -> None:
+    """Test that updates are processed immediately, if the queue is full."""
+    processed: list[str] = []
+    entity_update_queue = EntityUpdateQueue(hass=hass, batch_time=1.0, max_size=1)
+    entity_update_queue.put(key=("VCU0000001:1", "STATE"), update=lambda: processed.append("1"))
+    entity_update_queue.put(key=("VCU0000001:2", "STATE"), update=lambda: processed.append("2"))
+    assert processed == ["2"]
+    assert entity_update_queue.stats.overflows == 1
+
+    await hass.async_block_till_done()
+    assert processed == ["2", "1"]
+
+
+@pytest.mark.asyncio()
+async def test_entity_update_queue_disabled(hass: HomeAssistant) -> None:
+    """Test that updates are processed immediately without a batch time."""
+    processed: list[str] = []
+    entity_update_queue = EntityUpdateQueue(hass=hass)
+    for key in ("STATE", "STATE"):
+        entity_update_queue.put(
+            key=("VCU0000001:1", key), update=lambda key=key: processed.append(key)
+        )
+    assert processed == ["STATE", "STATE"]
+    assert entity_update_queue.stats.queue_depth == 0
+    assert entity_update_queue.stats.compacted == 0
@@ -0,0 +1,164 @@
+"""Tests for the event aggregation of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from hahomematic.const import (
+    EVENT_ADDRESS,
+    EVENT_INTERFACE_ID,
+    EVENT_PARAMETER,
+    HomematicEventType,
+)
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.homematicip_local.const import EVENT_DEVICE_ADDRESSES, EVENT_UNAVAILABLE
+from custom_components.homematicip_local.event_aggregation import (
+    EVENT_DEVICE_AVAILABILITY_SUMMARY,
+    DeviceAvailabilityAggregator,
+    DeviceErrorDeduplicator,
+    LongPressAggregator,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+
+def _availability_event(device_address: str, unavailable: bool = True) -> dict:
+    """Return the data of a device availability event."""
+    return {
+        EVENT_INTERFACE_ID: "CentralTest-BidCos-RF",
+        EVENT_ADDRESS: device_address,
+        EVENT_UNAVAILABLE: unavailable,
+    }
+
+
+@pytest.mark.asyncio()
+async def test_device_availability_aggregator(hass: HomeAssistant) -> None:
+    """Test that many availability changes of an interface are summarized."""
+    device_events = async_capture_events(hass, HomematicEventType.DEVICE_AVAILABILITY.value)
+    summary_events = async_capture_events(hass, EVENT_DEVICE_AVAILABILITY_SUMMARY)
+    aggregator = DeviceAvailabilityAggregator(hass=hass, threshold=2, window=3.0)
+
+    # Events below the threshold are fired immediately.
+    aggregator.async_add_event(event_data=_availability_event("VCU0000001"))
+    aggregator.async_add_event(event_data=_availability_event("VCU0000002", unavailable=False))
+    await hass.async_block_till_done()
+    assert len(device_events) == 2
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert len(device_events) == 2
+    assert len(summary_events) == 0
+
+    for device_address in ("VCU0000003", "VCU0000004", "VCU0000005"):
+        aggregator.async_add_event(event_data=_availability_event(device_address))
+    await hass.async_block_till_done()
+    assert len(device_events) == 4
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=8))
+    await hass.async_block_till_done()
+    assert len(device_events) == 4
+    assert len(summary_events) == 1
+    assert summary_events[0].data[EVENT_DEVICE_ADDRESSES] == [
+        "VCU0000003",
+        "VCU0000004",
+        "VCU0000005",
+    ]
+    assert summary_events[0].data[EVENT_UNAVAILABLE] is True
+
+
+def test_device_error_deduplicator() -> None:
+    """Test that only changed device errors are passed."""
+    deduplicator = DeviceErrorDeduplicator(reannounce_interval=3600)
+    with patch(
+        "custom_components.homematicip_local.event_aggregation.monotonic", return_value=100.0
+    ):
+        assert deduplicator.is_changed(
+            device_address="VCU0000001", parameter="LOW_BAT", value=True
+        )
+        assert not deduplicator.is_changed(
+            device_address="VCU0000001", parameter="LOW_BAT", value=True
+        )
+        assert deduplicator.is_changed(
+            device_address="VCU0000002", parameter="LOW_BAT", value=True
+        )
+        assert deduplicator.is_changed(
+            device_address="VCU0000001", parameter="LOW_BAT", value=False
+        )
+    with patch(
+        "custom_components.homematicip_local.event_aggregation.monotonic", return_value=3700.0
+    ):
+        assert deduplicator.is_changed(
+            device_address="VCU0000001", parameter="LOW_BAT", value=False
+        )
+    assert deduplicator.suppressed == 1
+
+
+@pytest.mark.asyncio()
+async def test_long_press_aggregator(hass: HomeAssistant) -> None:
+    """Test that the repeated events of a held button are folded."""
+    aggregator = LongPressAggregator(hass=hass, repeat_interval=1.0, timeout=0.5)
+    channel_address = "VCU0000001:1"
+    with patch("custom_components.homematicip_local.event_aggregation.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_SHORT")
+        assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG")
+        monotonic.return_value = 100.4
+        assert not aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG")
+        monotonic.return_value = 100.8
+        assert not aggregator.is_passed(channel_address=channel_address, parameter="press_long")
+        monotonic.return_value = 101.2
+        # Repeated after the repeat interval.
+        assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG")
+        assert aggregator.is_passed(
+            channel_address=channel_address, parameter="PRESS_LONG_RELEASE"
+        )
+        # A new long press starts after the release.
+        assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG")
+        monotonic.return_value = 102.0
+        # A new long press starts after the timeout.
+        assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_CONT")
+    assert aggregator.suppressed == 2
+
+
+@pytest.mark.asyncio()
+async def test_long_press_aggregator_timeout(hass: HomeAssistant) -> None:
+    """Test that a long press without a release event ends after the timeout."""
+    ended: list[tuple[str, Mapping[str, Any] | None]] = []
+    aggregator = LongPressAggregator(
+        hass=hass,
+        on_long_press_end=lambda channel_address, event_data: ended.append(
+            (channel_address, event_data)
+        ),
+        timeout=1.0,
+    )
+    channel_address = "VCU0000001:1"
+    event_data = {EVENT_ADDRESS: "VCU0000001", EVENT_PARAMETER: "PRESS_LONG"}
+    with patch("custom_components.homematicip_local.event_aggregation.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        assert aggregator.is_passed(
+            channel_address=channel_address, parameter="PRESS_LONG", event_data=event_data
+        )
+        assert not aggregator.is_passed(
+            channel_address=channel_address, parameter="PRESS_LONG", event_data=event_data
+        )
+        # Changes of the event data after the event don't reach the end of the long press.
+        del event_data[EVENT_PARAMETER]
+        monotonic.return_value = 102.0
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
+    assert ended == [
+        (channel_address, {EVENT_ADDRESS: "VCU0000001", EVENT_PARAMETER: "PRESS_LONG"})
+    ]
+
+    # A long press with a release event doesn't end by the timeout.
+    assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG")
+    assert aggregator.is_passed(channel_address=channel_address, parameter="PRESS_LONG_RELEASE")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert len(ended) == 1
@@ -0,0 +1,69 @@
+"""Tests for the click event consumers of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from time import monotonic
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.homematicip_local.event_consumers import (
+    LISTENER_COUNT_CACHE_TIME,
+    ClickEventStats,
+    async_get_click_event_consumers,
+)
+from homeassistant.core import HomeAssistant
+
+EVENT_TYPE = "homematic.keypress"
+
+
+@pytest.mark.asyncio()
+async def test_click_event_consumers(hass: HomeAssistant) -> None:
+    """Test that only events of registered channels have a consumer."""
+    consumers = async_get_click_event_consumers(hass=hass)
+    assert async_get_click_event_consumers(hass=hass) is consumers
+    assert not consumers.has_consumer(
+        event_type=EVENT_TYPE, device_address="VCU0000001", channel_no=1, parameter="PRESS_SHORT"
+    )
+
+    # A device trigger registers its listener and its consumer.
+    unsub_listener = hass.bus.async_listen(EVENT_TYPE, lambda event: None)
+    remove_consumer = consumers.async_add_consumer(
+        event_type=EVENT_TYPE, device_address="VCU0000001", channel_no=1, parameter="press_short"
+    )
+    assert consumers.has_consumer(
+        event_type=EVENT_TYPE, device_address="VCU0000001", channel_no=1, parameter="PRESS_SHORT"
+    )
+    assert not consumers.has_consumer(
+        event_type=EVENT_TYPE, device_address="VCU0000001", channel_no=2, parameter="PRESS_SHORT"
+    )
+
+    # Any other listener of the event type consumes all events,
+    # once the cached listener counts of the event bus have expired.
+    unsub_other_listener = hass.bus.async_listen(EVENT_TYPE, lambda event: None)
+    with patch(
+        "custom_components.homematicip_local.event_consumers.monotonic",
+        return_value=monotonic() + LISTENER_COUNT_CACHE_TIME,
+    ):
+        assert consumers.has_consumer(
+            event_type=EVENT_TYPE,
+            device_address="VCU0000001",
+            channel_no=2,
+            parameter="PRESS_SHORT",
+        )
+    unsub_other_listener()
+
+    unsub_listener()
+    remove_consumer()
+    assert not consumers.has_consumer(
+        event_type=EVENT_TYPE, device_address="VCU0000001", channel_no=1, parameter="PRESS_SHORT"
+    )
+
+
+def test_click_event_stats() -> None:
+    """Test the ratio of dropped to delivered events."""
+    stats = ClickEventStats()
+    assert stats.dropped_ratio is None
+    stats.delivered = 4
+    stats.dropped = 6
+    assert stats.dropped_ratio == 1.5
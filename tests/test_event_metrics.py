@@ -0,0 +1,51 @@
+"""Tests for the event metrics of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.homematicip_local.event_metrics import EventMetrics, RollingCounter
+
+from tests import const
+
+
+def test_rolling_counter() -> None:
+    """Test that events outside of the window are dropped from the rate."""
+    rolling_counter = RollingCounter(window=10)
+    for now in (100.0, 100.5, 101.0, 105.0):
+        rolling_counter.increment(now=now)
+    assert rolling_counter.rate(now=105.0) == 0.4
+    assert rolling_counter.rate(now=111.0) == 0.1
+    assert rolling_counter.rate(now=120.0) == 0.0
+    assert rolling_counter.total == 4
+
+
+def test_event_metrics() -> None:
+    """Test the event metrics."""
+    event_metrics = EventMetrics()
+    with patch("custom_components.homematicip_local.event_metrics.monotonic", return_value=100.0):
+        for _ in range(3):
+            event_metrics.event_received(
+                interface_id=const.INTERFACE_ID, event_type="entity_updated"
+            )
+        event_metrics.event_received(
+            interface_id=const.INTERFACE_ID, event_type="homematic.keypress"
+        )
+        assert event_metrics.events_per_second_by_event_type == {
+            "entity_updated": 0.05,
+            "homematic.keypress": 1 / 60,
+        }
+    assert event_metrics.events_total == 4
+    assert event_metrics.lag_avg is None
+
+    event_metrics.event_processed(lag=0.2)
+    event_metrics.event_processed(lag=0.4)
+    # Updates without a recent value are not counted as lag.
+    event_metrics.event_processed(lag=3600.0)
+    assert event_metrics.lag_avg is not None
+    assert round(event_metrics.lag_avg, 3) == 0.3
+    assert event_metrics.lag_max == 0.4
+
+    event_metrics.callback_finished(callback_name="entity_updated", duration=0.01)
+    event_metrics.callback_finished(callback_name="entity_updated", duration=0.005)
+    assert event_metrics.callback_time_max == {"entity_updated": 0.01}
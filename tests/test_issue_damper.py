@@ -0,0 +1,63 @@
+"""Tests for the flap damping of repair issues of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.homematicip_local.const import DOMAIN
+from custom_components.homematicip_local.issue_damper import IssueDamper
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.util import dt as dt_util
+
+INTERFACE_ID = "CentralTest-BidCos-RF"
+ISSUE_ID = f"proxy-{INTERFACE_ID}"
+
+
+@pytest.mark.asyncio()
+async def test_issue_damper(hass: HomeAssistant) -> None:
+    """Test that issues are only created and deleted for persistent conditions."""
+    issue_registry = ir.async_get(hass)
+    issue_damper = IssueDamper(hass=hass, create_delay=30, delete_delay=60)
+    issue_data = {
+        "is_fixable": False,
+        "severity": ir.IssueSeverity.WARNING,
+        "translation_key": "interface_not_reachable",
+    }
+
+    # A flapping condition does not create an issue.
+    issue_damper.async_set_issue(interface_id=INTERFACE_ID, issue_id=ISSUE_ID, **issue_data)
+    issue_damper.async_clear_issue(interface_id=INTERFACE_ID, issue_id=ISSUE_ID)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert issue_registry.async_get_issue(domain=DOMAIN, issue_id=ISSUE_ID) is None
+
+    issue_damper.async_set_issue(interface_id=INTERFACE_ID, issue_id=ISSUE_ID, **issue_data)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=62))
+    await hass.async_block_till_done()
+    assert issue_registry.async_get_issue(domain=DOMAIN, issue_id=ISSUE_ID) is not None
+
+    # A condition, that returns before the issue is deleted, updates the issue.
+    issue_damper.async_clear_issue(interface_id=INTERFACE_ID, issue_id=ISSUE_ID)
+    issue_damper.async_set_issue(
+        interface_id=INTERFACE_ID,
+        issue_id=ISSUE_ID,
+        **issue_data,
+        translation_placeholders={"interface_id": INTERFACE_ID},
+    )
+    issue = issue_registry.async_get_issue(domain=DOMAIN, issue_id=ISSUE_ID)
+    assert issue is not None
+    assert issue.translation_placeholders == {"interface_id": INTERFACE_ID}
+
+    issue_damper.async_clear_issue(interface_id=INTERFACE_ID, issue_id=ISSUE_ID)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=123))
+    await hass.async_block_till_done()
+    assert issue_registry.async_get_issue(domain=DOMAIN, issue_id=ISSUE_ID) is None
+
+    stats = issue_damper.stats[INTERFACE_ID]
+    assert stats.created == 1
+    assert stats.deleted == 1
+    assert stats.suppressed == 2
@@ -0,0 +1,64 @@
+"""Tests for the metrics endpoint of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+from hahomematic.const import HmPlatform
+
+from custom_components.homematicip_local.metrics import HmMetricsView, MetricFamilies
+
+
+def test_metric_families() -> None:
+    """Test the rendering of metric families in Prometheus text format."""
+    metrics = MetricFamilies()
+    metrics.add(
+        name="events_total",
+        metric_type="counter",
+        help_text="Number of received events by interface.",
+        labels={"instance": "ccu", "interface_id": "ccu-HmIP-RF"},
+        value=3,
+    )
+    metrics.add(
+        name="events_total",
+        metric_type="counter",
+        help_text="Number of received events by interface.",
+        labels={"instance": "ccu", "interface_id": 'ccu-"BidCos"'},
+        value=1,
+    )
+    metrics.add(
+        name="event_lag_max_seconds",
+        metric_type="gauge",
+        help_text="Max lag between the value update and the state write.",
+        labels={"instance": "ccu"},
+        value=0.25,
+    )
+    assert metrics.render() == (
+        "# HELP homematicip_local_events_total Number of received events by interface.\n"
+        "# TYPE homematicip_local_events_total counter\n"
+        'homematicip_local_events_total{instance="ccu",interface_id="ccu-HmIP-RF"} 3\n'
+        'homematicip_local_events_total{instance="ccu",interface_id="ccu-\\"BidCos\\""} 1\n'
+        "# HELP homematicip_local_event_lag_max_seconds "
+        "Max lag between the value update and the state write.\n"
+        "# TYPE homematicip_local_event_lag_max_seconds gauge\n"
+        'homematicip_local_event_lag_max_seconds{instance="ccu"} 0.25\n'
+    )
+
+
+def test_entities_by_platform_cache() -> None:
+    """Test that the entity counts are only recalculated, if the entities changed."""
+    view = HmMetricsView()
+    control_unit = Mock(entities_version=1)
+    with patch(
+        "custom_components.homematicip_local.metrics.get_entities_by_platform_stats",
+        return_value={HmPlatform.SWITCH: 2},
+    ) as mock_stats:
+        for _ in range(3):
+            assert view._get_entities_by_platform(entry_id="entry", control_unit=control_unit) == {
+                HmPlatform.SWITCH: 2
+            }
+        assert mock_stats.call_count == 1
+
+        control_unit.entities_version = 2
+        view._get_entities_by_platform(entry_id="entry", control_unit=control_unit)
+        assert mock_stats.call_count == 2
@@ -0,0 +1,69 @@
+"""Tests for the value snapshot of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.homematicip_local.const import HmEntityState
+from custom_components.homematicip_local.value_snapshot import ATTR_VALUE_STATE, ValueSnapshot
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+
+from tests import const
+
+
+def _mock_entity(unique_id: str, entity_id: str) -> Mock:
+    """Return a mocked restore entity."""
+    entity = Mock(unique_id=unique_id, entity_id=entity_id)
+    entity.extra_restore_state_data = None
+    return entity
+
+
+@pytest.mark.asyncio()
+async def test_value_snapshot(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test that valid states are saved and loaded."""
+    value_snapshot = ValueSnapshot(
+        hass=hass, storage_folder=str(tmp_path), name=const.INSTANCE_NAME
+    )
+    value_snapshot.async_track_entity(entity=_mock_entity("valid", "switch.valid"))
+    value_snapshot.async_track_entity(entity=_mock_entity("not_valid", "switch.not_valid"))
+    untrack = value_snapshot.async_track_entity(entity=_mock_entity("removed", "switch.removed"))
+    hass.states.async_set("switch.valid", "on", {ATTR_VALUE_STATE: HmEntityState.VALID})
+    hass.states.async_set("switch.not_valid", "off", {ATTR_VALUE_STATE: HmEntityState.NOT_VALID})
+    hass.states.async_set("switch.removed", "on", {ATTR_VALUE_STATE: HmEntityState.VALID})
+    untrack()
+    await value_snapshot.async_save()
+
+    loaded_snapshot = ValueSnapshot(
+        hass=hass, storage_folder=str(tmp_path), name=const.INSTANCE_NAME
+    )
+    await loaded_snapshot.async_load()
+    assert loaded_snapshot.has_state(unique_id="valid")
+    assert not loaded_snapshot.has_state(unique_id="not_valid")
+    assert not loaded_snapshot.has_state(unique_id="removed")
+    state = loaded_snapshot.get_state(unique_id="valid", entity_id="switch.renamed")
+    assert state is not None
+    assert state.entity_id == "switch.renamed"
+    assert state.state == "on"
+
+    # The last valid state is kept, while the entity is unavailable.
+    loaded_snapshot.async_track_entity(entity=_mock_entity("valid", "switch.valid"))
+    hass.states.async_set("switch.valid", STATE_UNAVAILABLE)
+    await loaded_snapshot.async_save()
+    assert loaded_snapshot.get_state(unique_id="valid", entity_id="switch.valid").state == "on"
+
+    # States of entities, that are not tracked, are kept.
+    untracked_snapshot = ValueSnapshot(
+        hass=hass, storage_folder=str(tmp_path), name=const.INSTANCE_NAME
+    )
+    await untracked_snapshot.async_load()
+    await untracked_snapshot.async_save()
+    await untracked_snapshot.async_load()
+    assert untracked_snapshot.has_state(unique_id="valid")
+
+    await loaded_snapshot.async_clear()
+    assert not loaded_snapshot.has_state(unique_id="valid")
+    assert not (tmp_path / f"{const.INSTANCE_NAME}_value_snapshot.json").exists()
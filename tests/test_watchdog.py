@@ -0,0 +1,50 @@
+"""Tests for the slow callback watchdog of Homematic(IP) Local."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from custom_components.homematicip_local.watchdog import CallbackWatchdog
+
+from tests import const
+
+
+def test_callback_watchdog() -> None:
+    """Test that slow callbacks are counted and warnings are rate limited."""
+    watchdog = CallbackWatchdog(instance_name=const.INSTANCE_NAME, threshold=0.1, log_interval=60)
+    with (
+        patch("custom_components.homematicip_local.watchdog.monotonic", return_value=100.0),
+        patch("custom_components.homematicip_local.watchdog._LOGGER") as logger,
+    ):
+        watchdog.callback_finished(callback_name="entity_updated", duration=0.05)
+        assert watchdog.stats == {}
+        watchdog.callback_finished(
+            callback_name="entity_updated",
+            duration=0.2,
+            device_address="VCU0000001",
+            event_type="entity_updated",
+        )
+        watchdog.callback_finished(callback_name="entity_updated", duration=0.3)
+        assert logger.warning.call_count == 1
+
+    stats = watchdog.stats["entity_updated"]
+    assert stats.count == 2
+    assert stats.duration_max == 0.3
+    assert stats.duration_last == 0.3
+
+    with (
+        patch("custom_components.homematicip_local.watchdog.monotonic", return_value=161.0),
+        patch("custom_components.homematicip_local.watchdog._LOGGER") as logger,
+    ):
+        watchdog.callback_finished(callback_name="entity_updated", duration=0.15)
+        assert logger.warning.call_count == 1
+        # The number of suppressed warnings is part of the next warning.
+        assert logger.warning.call_args.args[-1] == 1
+
+
+def test_callback_watchdog_disabled() -> None:
+    """Test that a threshold of 0 disables the watchdog."""
+    watchdog = CallbackWatchdog(instance_name=const.INSTANCE_NAME, threshold=0)
+    assert watchdog.enabled is False
+    watchdog.callback_finished(callback_name="entity_updated", duration=10.0)
+    assert watchdog.stats == {}